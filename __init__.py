@@ -1,9 +1,3 @@
-from . import group_data
-from . import custom_renamer
-from . import group_pie_menu
-from . import addon_updater
-from . import curve_namer
-
 bl_info = {
     "name": "Group Renamer",
     "author": "Luka4D",
@@ -14,34 +8,96 @@ bl_info = {
     "category": "Object",
 }
 
+# Submodules only import what registration needs; heavy modules (urllib,
+# zipfile, numpy, bmesh, cProfile) are imported by the operators using them.
+# See benchmarks/import_time.py for the load-time budget.
+# Dependencies before dependents, so a reload never mixes old and new code
+_RELOAD_ORDER = (
+    "group_data", "naming", "group_matcher", "subgroup_search", "taxonomy", "profiling",
+    "name_registry", "rename_service", "blend_reader", "material_catalog", "material_library",
+    "planner", "plan_applier", "group_index", "update_installer", "addon_updater",
+    "custom_renamer", "group_pie_menu", "curve_namer", "bundle_tracker", "mesh_dedup",
+    "collection_bundler", "part_classifier", "auto_classify", "symmetry", "mirror_naming",
+    "material_assign", "scene_audit", "batch",
+)
+
 if "bpy" in locals():
+    # Script reload: refresh only what is loaded, lazily imported modules
+    # stay unloaded until something needs them
     import importlib
-    importlib.reload(group_data)            # <--- RELOAD group_data NOW
-    importlib.reload(custom_renamer)
-    importlib.reload(group_pie_menu)
-    importlib.reload(curve_namer)
-    importlib.reload(collection_bundler)
-    importlib.reload(addon_updater)
+    import sys
+    for _name in _RELOAD_ORDER:
+        _module = sys.modules.get(f"{__name__}.{_name}")
+        if _module is not None:
+            importlib.reload(_module)
 else:
-    from . import group_data                 # <--- IMPORT group_data
+    from . import group_data
+    from . import taxonomy
+    from . import profiling
     from . import custom_renamer
+    from . import group_index
     from . import group_pie_menu
     from . import curve_namer
+    from . import bundle_tracker
+    from . import mesh_dedup
     from . import collection_bundler
+    from . import auto_classify
+    from . import mirror_naming
+    from . import material_assign
+    from . import scene_audit
+    from . import material_library
     from . import addon_updater
 
+import bpy
+
+STARTUP_DELAY = 1.0     # seconds after registration before non-essential startup work
+
+
+def _deferred_startup():
+    # Interactive sessions only: render and batch nodes never need the pie
+    # submenus or a network round-trip
+    if not bpy.app.background:
+        group_pie_menu.sync_submenus()
+        addon_updater.check_for_update()
+    return None
+
+
 def register():
+    taxonomy.register()
     custom_renamer.register()
+    group_index.register()
     group_pie_menu.register()
     curve_namer.register()
+    bundle_tracker.register()
+    mesh_dedup.register()
     collection_bundler.register()
+    auto_classify.register()
+    mirror_naming.register()
+    material_assign.register()
+    scene_audit.register()
+    material_library.register()
     addon_updater.register_updater()
-    addon_updater.check_for_update()
+    profiling.register()
+    # Persistent: `blender file.blend` loads the file before the first tick,
+    # which would drop an ordinary timer
+    if not bpy.app.timers.is_registered(_deferred_startup):
+        bpy.app.timers.register(_deferred_startup, first_interval=STARTUP_DELAY, persistent=True)
 
 def unregister():
+    if bpy.app.timers.is_registered(_deferred_startup):
+        bpy.app.timers.unregister(_deferred_startup)
+    profiling.unregister()
     group_pie_menu.unregister()
+    group_index.unregister()
     custom_renamer.unregister()
     curve_namer.unregister()
+    scene_audit.unregister()
+    material_assign.unregister()
+    mirror_naming.unregister()
+    auto_classify.unregister()
     collection_bundler.unregister()
-    addon_updater.register_updater()
-    addon_updater.check_for_update()
\ No newline at end of file
+    mesh_dedup.unregister()
+    bundle_tracker.unregister()
+    addon_updater.unregister_updater()
+    material_library.unregister()
+    taxonomy.unregister()
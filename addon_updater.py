@@ -1,17 +1,21 @@
 import bpy
 from bpy.types import AddonPreferences, Operator
-from bpy.props import StringProperty, BoolProperty
-import urllib.request
-import zipfile
+from bpy.props import StringProperty, BoolProperty, CollectionProperty
 import os
-import shutil
-import json
 import importlib
+import time
+from .taxonomy import invalidate_taxonomy
+from .material_library import MaterialLibraryPath
+from .profiling import timed, profiled_operator, update_settings as update_profiling
 
 # Your repo information here
 GITHUB_API_RELEASES = "https://api.github.com/repos/Luka4D/group_renamer/releases/latest"
 DOWNLOAD_URL_TEMPLATE = "https://github.com/Luka4D/group_renamer/archive/refs/tags/v{tag_name}.zip"
 
+UPDATE_CHECK_TIMEOUT = 5.0          # seconds, hard limit for the releases request
+UPDATE_CACHE_TTL = 24 * 60 * 60     # seconds between network checks
+UPDATE_CACHE_FILE = "update_cache.json"
+
 def get_bl_info():
     """
     Dynamically load the bl_info dictionary from __init__.py
@@ -21,57 +25,131 @@ def get_bl_info():
     return module.bl_info
 
 
-def get_latest_version_info():
-    url = GITHUB_API_RELEASES
-    # Adding a simple User-Agent header so GitHub doesn’t reject the request
-    req = urllib.request.Request(url,
-        headers={"User-Agent": "group_renamer-addon/1.2.0"})
+def get_cache_path():
+    config_dir = bpy.utils.user_resource('CONFIG', path=__package__, create=True)
+    return os.path.join(config_dir, UPDATE_CACHE_FILE)
+
+
+def load_update_cache(cache_path):
+    import json
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_update_cache(cache_path, cache):
+    import json
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Failed to write update cache: {e}")
+
+
+def find_checksum_url(release):
+    """Return the download URL of a `.sha256` asset attached to the release, if any."""
+    for asset in release.get("assets", []):
+        if asset.get("name", "").endswith(".sha256"):
+            return asset.get("browser_download_url", "")
+    return ""
+
+
+def fetch_latest_release(cache_path, url=GITHUB_API_RELEASES, user_agent="group_renamer-addon",
+                         timeout=UPDATE_CHECK_TIMEOUT, ttl=UPDATE_CACHE_TTL):
+    """
+    Return the cached release info, refreshing it from the network only when
+    it is older than ttl. Uses If-None-Match so an unchanged release costs a
+    304 with no body. Safe to call from a worker thread (no bpy access).
+    """
+    import json
+    import urllib.error
+    import urllib.request
+
+    cache = load_update_cache(cache_path)
+    if cache.get("url") != url:
+        cache = {}
+    elif time.time() - cache.get("checked_at", 0) < ttl:
+        return cache
+
+    headers = {"User-Agent": user_agent}
+    if cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+
+    req = urllib.request.Request(url, headers=headers)
     try:
-        with urllib.request.urlopen(req) as response:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
             data = json.loads(response.read())
-            tag_name = data.get("tag_name", "")
-            return tag_name.lstrip("v")  # e.g. "1.2.0"
+            cache = {
+                "url": url,
+                "etag": response.headers.get("ETag", ""),
+                "tag_name": data.get("tag_name", ""),
+                "checksum_url": find_checksum_url(data),
+            }
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            print(f"Failed to fetch latest release: {e}")
+            return cache
     except Exception as e:
         print(f"Failed to fetch latest release: {e}")
-        return None
+        return cache
 
+    cache["checked_at"] = time.time()
+    save_update_cache(cache_path, cache)
+    return cache
 
-def download_and_install_update(tag_name):
-    download_url = DOWNLOAD_URL_TEMPLATE.format(tag_name=tag_name)
-    temp_zip_path = os.path.join(bpy.app.tempdir, "group_renamer_update.zip")
 
-    try:
-        # Download the zip
-        urllib.request.urlretrieve(download_url, temp_zip_path)
+def get_latest_version_info():
+    bl_info = get_bl_info()
+    user_agent = "group_renamer-addon/" + ".".join(map(str, bl_info["version"]))
+    release = fetch_latest_release(get_cache_path(), user_agent=user_agent)
+    tag_name = release.get("tag_name", "")
+    return tag_name.lstrip("v") or None  # e.g. "1.2.0"
 
-        # Extract it
-        extract_path = os.path.join(bpy.app.tempdir, "group_renamer_extracted")
-        with zipfile.ZipFile(temp_zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_path)
 
-        # The extracted folder is usually named 'group_renamer-<tag_name>/'
-        extracted_subfolder = next(os.scandir(extract_path)).path
+def download_and_install_update(tag_name, download_url=None, checksum_url=None, progress=None):
+    from . import update_installer
 
-        # Copy files over to the addon directory
-        addon_dir = os.path.dirname(__file__)
+    if download_url is None:
+        download_url = DOWNLOAD_URL_TEMPLATE.format(tag_name=tag_name)
+    if checksum_url is None:
+        checksum_url = load_update_cache(get_cache_path()).get("checksum_url")
 
-        for item in os.listdir(extracted_subfolder):
-            src = os.path.join(extracted_subfolder, item)
-            dst = os.path.join(addon_dir, item)
+    addon_dir = os.path.dirname(__file__)
 
-            if os.path.isdir(src):
-                if os.path.exists(dst):
-                    shutil.rmtree(dst)
-                shutil.copytree(src, dst)
-            else:
-                shutil.copy2(src, dst)
+    try:
+        expected_sha256 = None
+        if checksum_url:
+            with timed("update.checksum"):
+                expected_sha256 = update_installer.fetch_checksum(checksum_url)
+        else:
+            print("No checksum published for this release, installing unverified.")
 
+        with timed("update.install"):
+            result = update_installer.install_update(
+                download_url,
+                addon_dir,
+                bpy.app.tempdir,
+                expected_sha256=expected_sha256,
+                progress=progress,
+            )
+        print(f"Updated {len(result['changed'])} file(s), removed {len(result['removed'])}, {len(result['unchanged'])} unchanged.")
         return True
     except Exception as e:
         print(f"Update failed: {e}")
         return False
 
 
+def can_rollback():
+    # Same check as update_installer.can_rollback, without importing the
+    # installer (zipfile, shutil, urllib) just to draw the preferences
+    parent, name = os.path.split(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.isdir(os.path.join(parent, f".{name}.previous"))
+
+
 class GroupRenamerPreferences(AddonPreferences):
     bl_idname = __package__
 
@@ -79,9 +157,28 @@ class GroupRenamerPreferences(AddonPreferences):
     latest_version: StringProperty(default="")
     materials_blend_path: StringProperty(
         name="Materials Blend File",
-        description="Path to the .blend file containing materials",
+        description="The .blend file containing materials, or a directory of library .blend files",
         subtype="FILE_PATH"
     )
+    material_libraries: CollectionProperty(type=MaterialLibraryPath)
+    taxonomy_path: StringProperty(
+        name="Taxonomy File",
+        description="JSON or TOML file with the group -> sub-group taxonomy (empty uses the built-in one)",
+        subtype="FILE_PATH",
+        update=invalidate_taxonomy,
+    )
+    profiling_enabled: BoolProperty(
+        name="Profiling",
+        description="Record wall time, call and object counts for operators and their inner stages",
+        default=False,
+        update=update_profiling,
+    )
+    profiling_cprofile: BoolProperty(
+        name="Capture cProfile",
+        description="Also keep a cProfile of each operator's last run (slower)",
+        default=False,
+        update=update_profiling,
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -91,6 +188,18 @@ class GroupRenamerPreferences(AddonPreferences):
 
         # New Material Path Field
         layout.prop(self, "materials_blend_path")
+        for index, library in enumerate(self.material_libraries):
+            row = layout.row(align=True)
+            row.prop(library, "path", text=f"Library {index + 2}")
+            row.operator("group_renamer.remove_material_library", text="", icon="X").index = index
+        row = layout.row(align=True)
+        row.operator("group_renamer.add_material_library", icon="ADD")
+        row.operator("group_renamer.rescan_material_libraries", icon="FILE_REFRESH")
+        layout.prop(self, "taxonomy_path")
+
+        row = layout.row(align=True)
+        row.prop(self, "profiling_enabled")
+        row.prop(self, "profiling_cprofile")
 
         if self.update_available:
             row = layout.row()
@@ -99,14 +208,29 @@ class GroupRenamerPreferences(AddonPreferences):
         else:
             layout.label(text="Addon is up to date.")
 
+        if can_rollback():
+            layout.operator("group_renamer.rollback_update", icon="LOOP_BACK")
+
 
 class GROUPRENAMER_OT_UpdateAddon(Operator):
     bl_idname = "group_renamer.update_addon"
     bl_label = "Update Addon"
 
+    @profiled_operator("group_renamer.update_addon")
     def execute(self, context):
         prefs = bpy.context.preferences.addons[__package__].preferences
-        success = download_and_install_update(prefs.latest_version)
+        wm = context.window_manager
+        wm.progress_begin(0, 100)
+
+        def progress(done, total):
+            if total:
+                wm.progress_update(int(done * 100 / total))
+
+        try:
+            success = download_and_install_update(prefs.latest_version, progress=progress)
+        finally:
+            wm.progress_end()
+
         if success:
             self.report({'INFO'}, "Update successful. Please restart Blender.")
         else:
@@ -114,16 +238,41 @@ class GROUPRENAMER_OT_UpdateAddon(Operator):
         return {'FINISHED'}
 
 
-def check_for_update():
-    latest_version_str = get_latest_version_info()
+class GROUPRENAMER_OT_RollbackUpdate(Operator):
+    bl_idname = "group_renamer.rollback_update"
+    bl_label = "Roll Back Update"
+    bl_description = "Restore the add-on version that was installed before the last update"
+
+    def execute(self, context):
+        try:
+            from . import update_installer
+            update_installer.rollback(os.path.dirname(__file__))
+        except Exception as e:
+            self.report({'ERROR'}, f"Rollback failed: {e}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, "Previous version restored. Please restart Blender.")
+        return {'FINISHED'}
+
+
+def apply_update_info(latest_version_str):
     if not latest_version_str:
         return
 
-    latest_version = tuple(map(int, latest_version_str.split(".")))
+    try:
+        latest_version = tuple(map(int, latest_version_str.split(".")))
+    except ValueError:
+        print(f"Ignoring unrecognised release tag: {latest_version_str}")
+        return
+
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon is None:
+        return
+
     bl_info = get_bl_info()
     current_version = bl_info["version"]
 
-    prefs = bpy.context.preferences.addons[__package__].preferences
+    prefs = addon.preferences
     if latest_version > current_version:
         prefs.update_available = True
         prefs.latest_version = latest_version_str
@@ -132,11 +281,63 @@ def check_for_update():
         prefs.latest_version = ""
 
 
+# --- Background update check
+_update_check = {"thread": None, "result": None}
+
+
+def _update_check_worker(cache_path, user_agent):
+    with timed("update.check"):
+        release = fetch_latest_release(cache_path, user_agent=user_agent)
+    _update_check["result"] = release.get("tag_name", "").lstrip("v")
+
+
+def _poll_update_check():
+    thread = _update_check["thread"]
+    if thread is not None and thread.is_alive():
+        return 0.5
+
+    _update_check["thread"] = None
+    apply_update_info(_update_check["result"])
+    return None
+
+
+def check_for_update():
+    """
+    Start the update check on a worker thread. The result is applied to the
+    preferences on the main thread by a bpy.app.timers poll, so Blender
+    never waits on the network.
+    """
+    if _update_check["thread"] is not None:
+        return
+
+    bl_info = get_bl_info()
+    user_agent = "group_renamer-addon/" + ".".join(map(str, bl_info["version"]))
+
+    import threading
+
+    _update_check["result"] = None
+    thread = threading.Thread(
+        target=_update_check_worker,
+        args=(get_cache_path(), user_agent),
+        daemon=True,
+    )
+    _update_check["thread"] = thread
+    thread.start()
+
+    if not bpy.app.timers.is_registered(_poll_update_check):
+        bpy.app.timers.register(_poll_update_check, first_interval=0.5)
+
+
 def register_updater():
     bpy.utils.register_class(GroupRenamerPreferences)
     bpy.utils.register_class(GROUPRENAMER_OT_UpdateAddon)
+    bpy.utils.register_class(GROUPRENAMER_OT_RollbackUpdate)
 
 
 def unregister_updater():
+    if bpy.app.timers.is_registered(_poll_update_check):
+        bpy.app.timers.unregister(_poll_update_check)
+    _update_check["thread"] = None
     bpy.utils.unregister_class(GroupRenamerPreferences)
     bpy.utils.unregister_class(GROUPRENAMER_OT_UpdateAddon)
+    bpy.utils.unregister_class(GROUPRENAMER_OT_RollbackUpdate)
@@ -0,0 +1,214 @@
+import bpy
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import BoolProperty, CollectionProperty, IntProperty, PointerProperty, StringProperty
+from .taxonomy import get_taxonomy
+from .rename_service import rename_objects
+from .profiling import timed, profiled_operator
+
+
+# --- Geometry
+def read_part_bounds(objects):
+    """
+    World-space (mins, maxs, centroids) of every mesh's vertices as (N, 3)
+    arrays. Vertices are read with foreach_get into one shared buffer and
+    reduced per part with reduceat, so there is no per-vertex Python. The
+    buffer is float32 like MeshVertex.co, which keeps foreach_get on its
+    fast memcpy path; it is widened to float64 once afterwards.
+    """
+    import numpy as np
+
+    counts = np.array([len(obj.data.vertices) for obj in objects], dtype=np.int64)
+    coords = np.empty(int(counts.sum()) * 3, dtype=np.float32)
+
+    offset = 0
+    for obj, count in zip(objects, counts.tolist()):
+        end = offset + count * 3
+        obj.data.vertices.foreach_get("co", coords[offset:end])
+        offset = end
+
+    coords = coords.astype(np.float64).reshape(-1, 3)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    for obj, start, count in zip(objects, starts.tolist(), counts.tolist()):
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        part = coords[start:start + count]
+        part[:] = part @ matrix[:3, :3].T + matrix[:3, 3]
+
+    mins = np.minimum.reduceat(coords, starts, axis=0)
+    maxs = np.maximum.reduceat(coords, starts, axis=0)
+    centroids = np.add.reduceat(coords, starts, axis=0) / counts[:, None]
+    return mins, maxs, centroids
+
+
+def classify_objects(objects, taxonomy=None):
+    """Return [(obj, (group, sub_group, reason) or None)] for meshes with geometry."""
+    from .part_classifier import suggest_subgroups
+
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    parts = [obj for obj in objects if obj.type == 'MESH' and obj.data is not None and len(obj.data.vertices)]
+    if not parts:
+        return []
+    with timed("classify.read", len(parts)):
+        mins, maxs, centroids = read_part_bounds(parts)
+    with timed("classify.rules", len(parts)):
+        suggestions = suggest_subgroups(mins, maxs, centroids, taxonomy.groups)
+    return list(zip(parts, suggestions))
+
+
+# --- Suggestion list
+class SubgroupSuggestion(PropertyGroup):
+    obj: PointerProperty(type=bpy.types.Object)
+    group: StringProperty()
+    sub_group: StringProperty()
+    reason: StringProperty()
+    accept: BoolProperty(name="Accept", default=True)
+
+
+class ClassifyProps(PropertyGroup):
+    suggestions: CollectionProperty(type=SubgroupSuggestion)
+    index: IntProperty()
+    only_unmatched: BoolProperty(
+        name="Only Unmatched",
+        description="Only classify parts whose name matches no sub-group (e.g. imported Mesh.123)",
+        default=True,
+    )
+
+
+class GROUPRENAMER_UL_suggestions(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "accept", text="")
+        row.label(text=item.obj.name if item.obj else "(removed)", icon="MESH_DATA")
+        row.label(text=get_taxonomy().labels.get(item.sub_group, item.sub_group), icon="FORWARD")
+
+
+# --- Operators
+class OBJECT_OT_auto_suggest_subgroups(Operator):
+    bl_idname = "object.auto_suggest_subgroups"
+    bl_label = "Suggest Sub-Groups"
+    bl_description = "Propose sub-groups for selected meshes from their size and position in the assembly"
+
+    @profiled_operator("object.auto_suggest_subgroups")
+    def execute(self, context):
+        props = context.scene.classify_props
+        taxonomy = get_taxonomy()
+        objects = context.selected_objects
+        if props.only_unmatched:
+            matcher = taxonomy.matcher
+            objects = [obj for obj in objects if matcher.match(obj.name) is None]
+
+        results = classify_objects(objects, taxonomy)
+        props.suggestions.clear()
+        for obj, suggestion in results:
+            if suggestion is None:
+                continue
+            item = props.suggestions.add()
+            item.obj = obj
+            item.group, item.sub_group, item.reason = suggestion
+        props.index = 0
+
+        if not results:
+            self.report({'WARNING'}, "No meshes with geometry to classify.")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Suggested sub-groups for {len(props.suggestions)} of {len(results)} part(s).")
+        return {'FINISHED'}
+
+
+class OBJECT_OT_accept_suggestions(Operator):
+    bl_idname = "object.accept_suggestions"
+    bl_label = "Accept Suggestions"
+    bl_description = "Rename every ticked part to its suggested sub-group"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @profiled_operator("object.accept_suggestions")
+    def execute(self, context):
+        props = context.scene.classify_props
+
+        by_subgroup = {}
+        for item in props.suggestions:
+            if item.accept and item.obj is not None and item.sub_group:
+                by_subgroup.setdefault(item.sub_group, []).append(item.obj)
+        if not by_subgroup:
+            self.report({'WARNING'}, "No suggestions ticked.")
+            return {'CANCELLED'}
+
+        renamed = 0
+        for sub_group, objects in by_subgroup.items():
+            renamed += len(rename_objects(objects, sub_group))
+
+        # Keep only what was left unticked for another look
+        for index in reversed(range(len(props.suggestions))):
+            if props.suggestions[index].accept:
+                props.suggestions.remove(index)
+        props.index = 0
+
+        self.report({'INFO'}, f"Renamed {renamed} part(s) into {len(by_subgroup)} sub-group(s).")
+        return {'FINISHED'}
+
+
+class OBJECT_OT_tick_suggestions(Operator):
+    bl_idname = "object.tick_suggestions"
+    bl_label = "Tick Suggestions"
+    bl_description = "Tick or untick every suggestion"
+
+    accept: BoolProperty(default=True)
+
+    def execute(self, context):
+        for item in context.scene.classify_props.suggestions:
+            item.accept = self.accept
+        return {'FINISHED'}
+
+
+# --- Panel
+class VIEW3D_PT_auto_classify(Panel):
+    bl_label = "Auto Classify"
+    bl_idname = "VIEW3D_PT_auto_classify"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Rename"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.classify_props
+
+        row = layout.row(align=True)
+        row.operator("object.auto_suggest_subgroups", icon="VIEWZOOM")
+        row.prop(props, "only_unmatched", text="", icon="FILTER")
+
+        if not props.suggestions:
+            return
+
+        layout.template_list("GROUPRENAMER_UL_suggestions", "", props, "suggestions", props, "index", rows=6)
+        if 0 <= props.index < len(props.suggestions):
+            layout.label(text=props.suggestions[props.index].reason, icon="INFO")
+
+        row = layout.row(align=True)
+        row.operator("object.tick_suggestions", text="All").accept = True
+        row.operator("object.tick_suggestions", text="None").accept = False
+        row = layout.row()
+        row.scale_y = 1.3
+        row.operator("object.accept_suggestions", icon="CHECKMARK")
+
+
+classes = (
+    SubgroupSuggestion,
+    ClassifyProps,
+    GROUPRENAMER_UL_suggestions,
+    OBJECT_OT_auto_suggest_subgroups,
+    OBJECT_OT_accept_suggestions,
+    OBJECT_OT_tick_suggestions,
+    VIEW3D_PT_auto_classify,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.classify_props = PointerProperty(type=ClassifyProps)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.classify_props
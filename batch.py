@@ -0,0 +1,87 @@
+import os
+
+import bpy
+
+from .collection_bundler import bundle_objects
+from .curve_namer import rename_curves
+from .material_assign import collect_material_targets, assign_materials
+from .rename_service import rename_objects
+from .taxonomy import get_taxonomy, get_scene_profile, load_taxonomy_file
+
+STAGES = ("rename", "curves", "materials", "bundle")
+
+
+# --- Pipeline stages (run inside Blender on the open file)
+def classify_scene_objects(objects, matcher):
+    """Split recognised meshes and curves into {sub_group: [objects]} maps."""
+    meshes, curves = {}, {}
+    for obj in objects:
+        if obj.type not in {'MESH', 'CURVE'}:
+            continue
+        match = matcher.match(obj.name)
+        if match is None:
+            continue
+        if obj.type == 'CURVE':
+            curves.setdefault(match[1], []).append(obj)
+        elif "curve" not in obj.name.lower():
+            meshes.setdefault(match[1], []).append(obj)
+    return meshes, curves
+
+
+def process_current_file(stages=STAGES, materials_path="", taxonomy_path="", profile=""):
+    """
+    Run the selected pipeline stages over every object in the open file's
+    active scene, with the given taxonomy profile or else the one saved
+    with the scene. Every stage sees the same objects: bundling builds its
+    collections in this scene, so objects elsewhere are left alone.
+    """
+    scene = bpy.context.scene
+    objects = list(scene.objects)
+    profile = profile or get_scene_profile(scene)
+    taxonomy = load_taxonomy_file(taxonomy_path, profile) if taxonomy_path else get_taxonomy(profile)
+    matcher = taxonomy.matcher
+    report = {"taxonomy": taxonomy.version, "profile": profile}
+
+    meshes, curves = classify_scene_objects(objects, matcher)
+
+    if "rename" in stages:
+        report["renamed"] = {
+            old: new
+            for sub, objs in meshes.items()
+            for old, new in rename_objects(objs, sub)
+            if old != new
+        }
+
+    if "curves" in stages:
+        report["curves_renamed"] = {
+            old: new
+            for sub, objs in curves.items()
+            for old, new in rename_curves(objs, sub)
+            if old != new
+        }
+
+    if "materials" in stages and materials_path:
+        # Several libraries may be given, searched in order
+        blend_paths = [path for path in materials_path.split(os.pathsep) if path]
+        targets = collect_material_targets(objects, matcher)
+        assigned, skipped, missing = assign_materials(targets, blend_paths)
+        report["materials"] = assigned
+        report["materials_unchanged"] = skipped
+        report["missing_materials"] = missing
+
+    if "bundle" in stages:
+        bundled = [obj for obj in objects if obj.type in {'MESH', 'CURVE'}]
+        if bundled:
+            summary = bundle_objects(bundled, matcher=matcher)
+            report["bundled"] = summary["groups"]
+            report["curves_bundled"] = summary["curves"]
+            report["orphaned"] = summary["orphaned"]
+
+    return report
+
+
+def save_current_file(output_path=None):
+    if output_path:
+        bpy.ops.wm.save_as_mainfile(filepath=output_path, copy=True)
+    else:
+        bpy.ops.wm.save_mainfile()
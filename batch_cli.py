@@ -0,0 +1,220 @@
+"""
+Run the Group Renamer pipelines (rename, curves, materials, bundle) over a
+directory of .blend files with a pool of background Blender workers.
+
+    python batch_cli.py --blender /path/to/blender --workers 4 \
+        --materials /lib/materials.blend --report report.json deliveries/
+
+The same script is passed to each `blender -b` worker, where it imports the
+add-on package and runs batch.process_current_file() on the opened file.
+Only the standard library is used on the controlling side.
+"""
+import argparse
+import concurrent.futures
+import datetime
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+STAGES = ("rename", "curves", "materials", "bundle")
+
+
+# --- Controller
+def find_blend_files(root, recursive=True):
+    if os.path.isfile(root):
+        return [root]
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        found.extend(os.path.join(dirpath, f) for f in filenames if f.lower().endswith(".blend"))
+        if not recursive:
+            break
+    return sorted(found)
+
+
+def output_path_for(blend_path, args):
+    if not args.output_dir:
+        return ""
+    rel_path = os.path.relpath(blend_path, args.input) if os.path.isdir(args.input) else os.path.basename(blend_path)
+    return os.path.join(os.path.abspath(args.output_dir), rel_path)
+
+
+def build_worker_command(blend_path, result_path, args):
+    command = [
+        args.blender, "-b", "--factory-startup", "-noaudio", os.path.abspath(blend_path),
+        "--python-exit-code", "1",
+        "--python", os.path.abspath(__file__),
+        "--", "--worker",
+        "--result", result_path,
+        "--stages", ",".join(args.stages),
+    ]
+    if args.materials:
+        libraries = (os.path.abspath(path) for path in args.materials.split(os.pathsep) if path)
+        command += ["--materials", os.pathsep.join(libraries)]
+    if args.taxonomy:
+        command += ["--taxonomy", os.path.abspath(args.taxonomy)]
+    if args.profile:
+        command += ["--profile", args.profile]
+    output_path = output_path_for(blend_path, args)
+    if output_path:
+        command += ["--output", output_path]
+    if args.no_save:
+        command.append("--no-save")
+    return command
+
+
+def run_file(blend_path, args):
+    """Process one file in a fresh Blender, retrying on failure or timeout."""
+    entry = {"file": blend_path, "status": "failed", "attempts": 0}
+    fd, result_path = tempfile.mkstemp(prefix="group_renamer_", suffix=".json")
+    os.close(fd)
+
+    try:
+        for attempt in range(1, args.retries + 2):
+            entry["attempts"] = attempt
+            if os.path.exists(result_path):
+                os.remove(result_path)
+
+            start = time.perf_counter()
+            try:
+                proc = subprocess.run(
+                    build_worker_command(blend_path, result_path, args),
+                    capture_output=True, text=True, timeout=args.timeout,
+                )
+                entry["duration"] = round(time.perf_counter() - start, 3)
+            except subprocess.TimeoutExpired:
+                entry["duration"] = round(time.perf_counter() - start, 3)
+                entry["error"] = f"Timed out after {args.timeout}s"
+                continue
+
+            # A worker can exit cleanly without writing its result; that's a failed attempt
+            if proc.returncode == 0 and os.path.exists(result_path) and os.path.getsize(result_path) > 0:
+                with open(result_path, "r", encoding="utf-8") as f:
+                    entry.update(json.load(f))
+                entry["status"] = "ok"
+                entry.pop("error", None)
+                break
+
+            tail = (proc.stderr or proc.stdout or "").strip().splitlines()[-5:]
+            if proc.returncode == 0:
+                entry["error"] = "Blender exited without writing a result: " + " | ".join(tail)
+            else:
+                entry["error"] = f"Blender exited with {proc.returncode}: " + " | ".join(tail)
+    finally:
+        if os.path.exists(result_path):
+            os.remove(result_path)
+
+    return entry
+
+
+def summarize(entries):
+    totals = {"files": len(entries), "ok": 0, "failed": 0, "renamed": 0, "curves_renamed": 0, "bundled": 0, "orphaned": 0}
+    for entry in entries:
+        totals["ok" if entry["status"] == "ok" else "failed"] += 1
+        totals["renamed"] += len(entry.get("renamed", {}))
+        totals["curves_renamed"] += len(entry.get("curves_renamed", {}))
+        totals["bundled"] += sum(len(names) for names in entry.get("bundled", {}).values()) + len(entry.get("curves_bundled", []))
+        totals["orphaned"] += len(entry.get("orphaned", []))
+    return totals
+
+
+def run_batch(args):
+    files = find_blend_files(args.input, recursive=not args.no_recursive)
+    entries = []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(run_file, path, args): path for path in files}
+        for future in concurrent.futures.as_completed(futures):
+            entry = future.result()
+            entries.append(entry)
+            print(f"[{len(entries)}/{len(files)}] {entry['status']:6} {entry['file']}", flush=True)
+
+    entries.sort(key=lambda e: e["file"])
+    report = {
+        "generated": datetime.datetime.now().isoformat(timespec="seconds"),
+        "stages": list(args.stages),
+        "totals": summarize(entries),
+        "files": entries,
+    }
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def parse_controller_args(argv):
+    parser = argparse.ArgumentParser(description="Batch-process .blend files with Group Renamer.")
+    parser.add_argument("input", help="A .blend file or a directory of .blend files")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--timeout", type=float, default=600.0, help="Seconds per file attempt")
+    parser.add_argument("--retries", type=int, default=1, help="Extra attempts after a failure")
+    parser.add_argument("--stages", type=lambda s: tuple(p for p in s.split(",") if p), default=STAGES)
+    parser.add_argument("--materials", default="", help=f"Library .blend(s) or directories of them to link materials from, '{os.pathsep}' separated in priority order")
+    parser.add_argument("--taxonomy", default="", help="JSON/TOML taxonomy file (default: built-in)")
+    parser.add_argument("--profile", default="", help="Taxonomy profile (default: the one saved with each scene)")
+    parser.add_argument("--output-dir", default="", help="Save results here instead of in place")
+    parser.add_argument("--no-save", action="store_true", help="Only report, don't save files")
+    parser.add_argument("--no-recursive", action="store_true")
+    parser.add_argument("--report", default="group_renamer_report.json")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"Unknown stage(s): {', '.join(sorted(unknown))}")
+    return args
+
+
+# --- Worker (runs inside `blender -b`)
+def import_addon():
+    sys.path.insert(0, os.path.dirname(ADDON_DIR))
+    return importlib.import_module(os.path.basename(ADDON_DIR))
+
+
+def worker_main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--result", required=True)
+    parser.add_argument("--stages", default=",".join(STAGES))
+    parser.add_argument("--materials", default="")
+    parser.add_argument("--taxonomy", default="")
+    parser.add_argument("--profile", default="")
+    parser.add_argument("--output", default="")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+
+    addon = import_addon()
+    batch = importlib.import_module(f"{addon.__name__}.batch")
+
+    report = batch.process_current_file(
+        stages=tuple(args.stages.split(",")),
+        materials_path=args.materials,
+        taxonomy_path=args.taxonomy,
+        profile=args.profile,
+    )
+    if not args.no_save:
+        if args.output:
+            os.makedirs(os.path.dirname(args.output), exist_ok=True)
+        batch.save_current_file(args.output or None)
+        report["saved_to"] = args.output or "in place"
+
+    with open(args.result, "w", encoding="utf-8") as f:
+        json.dump(report, f)
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    if argv and argv[0] == "--worker":
+        worker_main(argv[1:])
+        return
+
+    report = run_batch(parse_controller_args(argv))
+    totals = report["totals"]
+    print(f"{totals['ok']}/{totals['files']} files processed, {totals['failed']} failed.")
+    sys.exit(1 if totals["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare renaming with and without the BMesh rebuild pass on dense meshes.
+
+Run inside Blender from the add-on directory:
+
+    blender -b --factory-startup --python benchmarks/bench_rename.py -- --verts 500000 --objects 4
+"""
+import argparse
+import importlib
+import math
+import os
+import sys
+import time
+
+import bpy
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_addon():
+    sys.path.insert(0, os.path.dirname(ADDON_DIR))
+    return importlib.import_module(os.path.basename(ADDON_DIR))
+
+
+def make_grid_mesh(name, vert_count):
+    side = max(2, int(math.sqrt(vert_count)))
+    verts = [(x, y, 0.0) for y in range(side) for x in range(side)]
+    faces = [
+        (y * side + x, y * side + x + 1, (y + 1) * side + x + 1, (y + 1) * side + x)
+        for y in range(side - 1) for x in range(side - 1)
+    ]
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def time_rename(rename_service, objects, base_name, rebuild):
+    start = time.perf_counter()
+    rename_service.rename_objects(objects, base_name, rebuild=rebuild)
+    return time.perf_counter() - start
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--verts", type=int, default=500000)
+    parser.add_argument("--objects", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    addon = import_addon()
+    rename_service = importlib.import_module(f"{addon.__name__}.rename_service")
+
+    objects = [make_grid_mesh(f"Scan.{i:03d}", args.verts) for i in range(args.objects)]
+    verts = sum(len(obj.data.vertices) for obj in objects)
+
+    plain = time_rename(rename_service, objects, "Seat_Cushion", rebuild=False)
+    rebuilt = time_rename(rename_service, objects, "Back_Cushion", rebuild=True)
+
+    print(f"{args.objects} objects, {verts} vertices total")
+    print(f"rename only:        {plain * 1000:10.2f} ms")
+    print(f"rename + rebuild:   {rebuilt * 1000:10.2f} ms")
+    if plain > 0:
+        print(f"speedup:            {rebuilt / plain:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+"""
+In-memory stand-in for the parts of bpy the add-on touches, so its hot
+paths can be timed without Blender.
+
+Only behaviour that matters for performance and naming is modelled:
+unique ID names with Blender's `.001` fallback, collection membership,
+parenting (with Blender's matrix_world = parent world @ parent inverse @
+basis rule), material slots and library loading. install() registers the
+fake modules in sys.modules; reset() starts a fresh, empty file.
+"""
+import sys
+import types
+
+
+# --- mathutils
+class Matrix:
+    """Just enough of mathutils.Matrix for 4x4 transforms."""
+
+    def __init__(self, rows=None):
+        self.rows = [list(map(float, row)) for row in rows] if rows else Matrix._identity_rows()
+
+    @staticmethod
+    def _identity_rows():
+        return [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+
+    @classmethod
+    def Identity(cls, size=4):
+        return cls()
+
+    @classmethod
+    def Translation(cls, vector):
+        m = cls()
+        for i, value in enumerate(vector):
+            m.rows[i][3] = float(value)
+        return m
+
+    def copy(self):
+        return Matrix(self.rows)
+
+    def __matmul__(self, other):
+        b = other.rows
+        return Matrix([[sum(row[k] * b[k][j] for k in range(4)) for j in range(4)] for row in self.rows])
+
+    def __eq__(self, other):
+        return isinstance(other, Matrix) and self.rows == other.rows
+
+    def inverted_safe(self):
+        # Gauss-Jordan elimination on [M | I]
+        n = 4
+        a = [row[:] + ident for row, ident in zip(self.rows, Matrix._identity_rows())]
+        for col in range(n):
+            pivot = max(range(col, n), key=lambda r: abs(a[r][col]))
+            if abs(a[pivot][col]) < 1e-12:
+                return Matrix()
+            a[col], a[pivot] = a[pivot], a[col]
+            scale = a[col][col]
+            a[col] = [v / scale for v in a[col]]
+            for r in range(n):
+                if r != col and a[r][col]:
+                    factor = a[r][col]
+                    a[r] = [v - factor * w for v, w in zip(a[r], a[col])]
+        return Matrix([row[n:] for row in a])
+
+    inverted = inverted_safe
+
+    def is_close(self, other, tol=1e-6):
+        return all(abs(x - y) <= tol for r1, r2 in zip(self.rows, other.rows) for x, y in zip(r1, r2))
+
+
+# --- ID blocks and collections
+class IDCollection:
+    """bpy.data.<type>: a name-unique set of ID blocks."""
+
+    def __init__(self, factory):
+        self._items = {}
+        self._factory = factory
+        self._next_suffix = {}
+
+    def _unique(self, name, owner=None):
+        name = name[:63]
+        held = self._items.get(name)
+        if held is None or held is owner:
+            return name
+        # Like Blender's name map, remember where the last search stopped
+        index = self._next_suffix.get(name, 1)
+        while f"{name}.{index:03d}" in self._items:
+            index += 1
+        self._next_suffix[name] = index + 1
+        return f"{name}.{index:03d}"
+
+    def _rename(self, id_block, name):
+        name = self._unique(name, id_block)
+        if self._items.get(id_block._name) is id_block:
+            del self._items[id_block._name]
+        id_block._name = name
+        self._items[name] = id_block
+
+    def new(self, name, *args):
+        id_block = self._factory(self, *args)
+        self._rename(id_block, name)
+        return id_block
+
+    def remove(self, id_block):
+        del self._items[id_block._name]
+        id_block._removed = True
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def __getitem__(self, name):
+        return self._items[name]
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return key in self._items
+        return self._items.get(getattr(key, "_name", None)) is key
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+
+class ID:
+    def __init__(self, owner):
+        self._owner = owner
+        self._name = ""
+        self._removed = False
+        self._props = {}
+        self.library = None
+
+    @property
+    def name(self):
+        if self._removed:
+            raise ReferenceError("StructRNA of type ID has been removed")
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._owner._rename(self, value)
+
+    def __getitem__(self, key):
+        return self._props[key]
+
+    def __setitem__(self, key, value):
+        self._props[key] = value
+
+    def __contains__(self, key):
+        return key in self._props
+
+    def get(self, key, default=None):
+        return self._props.get(key, default)
+
+    def as_pointer(self):
+        return id(self)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} '{self._name}'>"
+
+
+class Material(ID):
+    pass
+
+
+class Mesh(ID):
+    def __init__(self, owner):
+        super().__init__(owner)
+        self.materials = []
+
+
+class Curve(ID):
+    def __init__(self, owner, curve_type='CURVE'):
+        super().__init__(owner)
+        self.materials = []
+
+
+class CollectionObjects:
+    def __init__(self, collection):
+        self._collection = collection
+        self._objects = {}
+
+    def link(self, obj):
+        if id(obj) in self._objects:
+            raise RuntimeError(f"Object '{obj.name}' already in collection '{self._collection.name}'")
+        self._objects[id(obj)] = obj
+        obj._collections.append(self._collection)
+
+    def unlink(self, obj):
+        del self._objects[id(obj)]
+        obj._collections.remove(self._collection)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return any(obj.name == key for obj in self._objects.values())
+        return id(key) in self._objects
+
+    def __iter__(self):
+        return iter(list(self._objects.values()))
+
+    def __len__(self):
+        return len(self._objects)
+
+
+class CollectionChildren(list):
+    def link(self, collection):
+        self.append(collection)
+
+    def unlink(self, collection):
+        self.remove(collection)
+
+
+class Collection(ID):
+    def __init__(self, owner):
+        super().__init__(owner)
+        self.objects = CollectionObjects(self)
+        self.children = CollectionChildren()
+        self.color_tag = 'NONE'
+
+
+class Object(ID):
+    def __init__(self, owner, data=None):
+        super().__init__(owner)
+        self.data = data
+        if data is None:
+            self.type = 'EMPTY'
+        elif isinstance(data, Curve):
+            self.type = 'CURVE'
+        else:
+            self.type = 'MESH'
+        self.parent = None
+        self.matrix_parent_inverse = Matrix()
+        self.matrix_basis = Matrix()
+        self._collections = []
+        self._selected = False
+
+    @property
+    def matrix_world(self):
+        if self.parent is None:
+            return self.matrix_basis.copy()
+        return self.parent.matrix_world @ self.matrix_parent_inverse @ self.matrix_basis
+
+    @property
+    def users_collection(self):
+        return tuple(self._collections)
+
+    def select_get(self):
+        return self._selected
+
+    def select_set(self, state):
+        self._selected = state
+
+
+class Scene(types.SimpleNamespace):
+    def get(self, key, default=None):
+        return default
+
+
+# --- Library loading
+class LibraryLoad:
+    """bpy.data.libraries.load(): lists and links materials from LIBRARIES."""
+
+    def __init__(self, data, path, link=False):
+        self._data = data
+        self._path = path
+
+    def __enter__(self):
+        self._from = types.SimpleNamespace(materials=list(LIBRARIES.get(self._path, ())))
+        self._to = types.SimpleNamespace(materials=[])
+        stats["library_loads"] += 1
+        return self._from, self._to
+
+    def __exit__(self, *exc):
+        linked = []
+        for name in self._to.materials:
+            mat = self._data.materials.new(name)
+            mat.library = self._path
+            linked.append(mat)
+        self._to.materials = linked
+        return False
+
+
+LIBRARIES = {}
+stats = {"library_loads": 0}
+
+
+# --- Module assembly
+class _Base:
+    pass
+
+
+class Operator:
+    bl_options = set()
+
+    def report(self, level, message):
+        pass
+
+
+def _prop(*args, **kwargs):
+    return (args, kwargs)
+
+
+def _persistent(func):
+    return func
+
+
+def _make_modules():
+    bpy = types.ModuleType("bpy")
+    bpy.types = types.ModuleType("bpy.types")
+    for name in ("Panel", "Menu", "PropertyGroup", "AddonPreferences", "UIList",
+                 "Scene", "Object", "WindowManager", "Mesh", "Curve"):
+        setattr(bpy.types, name, type(name, (_Base,), {}))
+    bpy.types.Operator = Operator
+
+    bpy.props = types.ModuleType("bpy.props")
+    for name in ("StringProperty", "BoolProperty", "EnumProperty", "PointerProperty",
+                 "IntProperty", "FloatProperty", "FloatVectorProperty", "CollectionProperty"):
+        setattr(bpy.props, name, _prop)
+
+    bpy.utils = types.ModuleType("bpy.utils")
+    bpy.utils.register_class = lambda cls: None
+    bpy.utils.unregister_class = lambda cls: None
+    bpy.utils.user_resource = lambda *args, **kwargs: ""
+
+    timers = types.SimpleNamespace(
+        register=lambda func, **kwargs: None,
+        unregister=lambda func: None,
+        is_registered=lambda func: False,
+    )
+    handlers = types.SimpleNamespace(depsgraph_update_post=[], load_post=[], persistent=_persistent)
+    bpy.app = types.ModuleType("bpy.app")
+    bpy.app.version = (4, 2, 0)
+    bpy.app.background = True
+    bpy.app.tempdir = ""
+    bpy.app.timers = timers
+    bpy.app.handlers = handlers
+
+    bpy.path = types.ModuleType("bpy.path")
+    bpy.path.abspath = lambda path: path
+
+    bpy.ops = types.SimpleNamespace()
+    bpy.data = types.SimpleNamespace()
+    bpy.context = types.SimpleNamespace()
+
+    bmesh = types.ModuleType("bmesh")
+    mathutils = types.ModuleType("mathutils")
+    mathutils.Matrix = Matrix
+    return bpy, bmesh, mathutils
+
+
+def reset():
+    """Start an empty file with one scene."""
+    bpy = sys.modules["bpy"]
+    data = bpy.data
+    data.objects = IDCollection(Object)
+    data.meshes = IDCollection(Mesh)
+    data.curves = IDCollection(Curve)
+    data.materials = IDCollection(Material)
+    data.collections = IDCollection(Collection)
+    data.libraries = types.SimpleNamespace(load=lambda path, link=False: LibraryLoad(data, path, link))
+
+    scene_collection = Collection(None)
+    scene_collection._name = "Scene Collection"
+    scene = Scene(collection=scene_collection, objects=data.objects)
+    data.scenes = [scene]
+
+    ctx = bpy.context
+    ctx.scene = scene
+    ctx.selected_objects = []
+    ctx.active_object = None
+    ctx.preferences = types.SimpleNamespace(addons={})
+    stats["library_loads"] = 0
+    return bpy
+
+
+def install():
+    """Register the fake bpy/bmesh/mathutils modules and return the fake bpy."""
+    if "bpy" not in sys.modules:
+        bpy, bmesh, mathutils = _make_modules()
+        sys.modules.update({
+            "bpy": bpy,
+            "bpy.types": bpy.types,
+            "bpy.props": bpy.props,
+            "bpy.utils": bpy.utils,
+            "bpy.app": bpy.app,
+            "bpy.path": bpy.path,
+            "bmesh": bmesh,
+            "mathutils": mathutils,
+        })
+    return reset()
+
+
+def new_object(bpy, name, kind='MESH'):
+    """Create an object with its own data block, linked to the scene collection."""
+    if kind == 'MESH':
+        data = bpy.data.meshes.new(name)
+    elif kind == 'CURVE':
+        data = bpy.data.curves.new(name, 'CURVE')
+    else:
+        data = None
+    obj = bpy.data.objects.new(name, data)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
@@ -0,0 +1,104 @@
+"""
+Measure how long importing the add-on takes, against the bpy stand-in in
+fake_bpy.py, and which heavy modules get pulled in at load time.
+
+    python benchmarks/import_time.py --budget-ms 15
+
+Runs a fresh interpreter under `python -X importtime` (best of --repeat),
+prints the slowest modules, and exits non-zero when the package import is
+over budget or loads any of HEAVY_MODULES eagerly.
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(BENCH_DIR)
+PACKAGE = os.path.basename(ADDON_DIR)
+
+# Modules only operators should import, never add-on loading
+HEAVY_MODULES = (
+    "bmesh", "numpy", "urllib.request", "http.client", "ssl", "zipfile",
+    "shutil", "cProfile", "pstats", "tomllib", "sqlite3", "concurrent.futures",
+)
+
+# Run in the child: install the stand-in, keep bmesh importable but not
+# preloaded (so an eager import shows up), import the add-on, then report
+# which heavy modules ended up loaded.
+CHILD = f"""
+import sys
+sys.path[:0] = [{BENCH_DIR!r}, {os.path.dirname(ADDON_DIR)!r}]
+import importlib.abc, importlib.util, fake_bpy
+fake_bpy.install()
+_bmesh = sys.modules.pop("bmesh")
+
+class _BmeshFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, name, path=None, target=None):
+        return importlib.util.spec_from_loader(name, self) if name == "bmesh" else None
+    def create_module(self, spec):
+        return _bmesh
+    def exec_module(self, module):
+        pass
+
+sys.meta_path.insert(0, _BmeshFinder())
+_before = set(sys.modules)
+import {PACKAGE}
+_loaded = sorted(set(sys.modules) - _before)
+print(repr((_loaded, [m for m in {HEAVY_MODULES!r} if m in _loaded])))
+"""
+
+
+def parse_importtime(stderr):
+    """Return {module: (self_us, cumulative_us)} from -X importtime output."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        capture_output=True, text=True, check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    loaded, heavy = ast.literal_eval(result.stdout.strip().splitlines()[-1])
+    # Only what importing the add-on loaded, not the stand-in's own imports
+    timings = {name: t for name, t in parse_importtime(result.stderr).items() if name in loaded}
+    return timings, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=15.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    runs = [measure() for _ in range(args.repeat)]
+    timings, heavy = min(runs, key=lambda run: run[0][PACKAGE][1])
+    total_ms = timings[PACKAGE][1] / 1000
+
+    print(f"import {PACKAGE}: {total_ms:.1f} ms, {len(timings)} modules (best of {args.repeat}, budget {args.budget_ms:.1f} ms)")
+    print("slowest modules (self time):")
+    for name, (self_us, cumulative_us) in sorted(timings.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"  {self_us / 1000:8.2f} ms  {name}")
+
+    failed = False
+    if heavy:
+        print(f"heavy modules loaded at import: {', '.join(heavy)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print("over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Benchmark the add-on's hot paths without Blender, against the in-memory
+bpy stand-in in fake_bpy.py and synthetic scenes generated from GROUPS.
+
+    python benchmarks/run.py --sizes 1000,10000,100000 --output bench.json
+
+Results are written as JSON so they can be compared across releases.
+"""
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.dirname(ADDON_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+# The stand-in must be installed before the add-on package is imported
+import fake_bpy
+import scenes
+
+bpy = fake_bpy.install()
+
+
+def import_addon_module(name):
+    return importlib.import_module(f"{os.path.basename(ADDON_DIR)}.{name}")
+
+
+def best_of(repeat, setup, func):
+    """Run setup() then time func(state) `repeat` times; return the fastest."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        result = func(state)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+# --- Benchmarks
+def bench_bundle(size, args, groups):
+    bundler = import_addon_module("collection_bundler")
+
+    def setup():
+        scenes.build_scene(bpy, groups, size, **args.scene)
+
+    seconds, summary = best_of(args.repeat, setup, lambda state: bundler.bundle_selected_objects())
+    rebundle, _ = best_of(1, lambda: None, lambda state: bundler.bundle_selected_objects())
+    return [
+        {"benchmark": "bundle_selected_objects", "seconds": seconds, "orphaned": len(summary["orphaned"])},
+        {"benchmark": "bundle_selected_objects (rebundle)", "seconds": rebundle},
+    ]
+
+
+def bench_curve_names(size, args, groups):
+    curve_namer = import_addon_module("curve_namer")
+    name_registry = import_addon_module("name_registry")
+    sub = next(iter(groups.values()))[0]
+
+    def setup():
+        name_registry.name_registry.reset()
+        objects = scenes.build_scene(bpy, groups, size, **args.scene)
+        return [obj for obj in objects if obj.type == 'CURVE']
+
+    seconds, renamed = best_of(args.repeat, setup, lambda curves: curve_namer.rename_curves(curves, sub))
+    return [{"benchmark": "rename_curves (name allocation)", "seconds": seconds, "curves": len(renamed)}]
+
+
+def bench_enum_items(size, args, groups):
+    custom_renamer = import_addon_module("custom_renamer")
+    props = type("Props", (), {"profile": ""})()
+    group_names = list(groups)
+    draws = size
+
+    def run(state):
+        for i in range(draws):
+            props.group = group_names[i % len(group_names)]
+            custom_renamer.RenameProps.get_group_items(props, None)
+            custom_renamer.RenameProps.get_subgroup_items(props, None)
+
+    seconds, _ = best_of(args.repeat, lambda: None, run)
+    return [{"benchmark": "enum item generation", "seconds": seconds, "draws": draws}]
+
+
+def bench_material_lookup(size, args, groups):
+    custom_renamer = import_addon_module("custom_renamer")
+    material_library = import_addon_module("material_library")
+    names = [sub.lower() for items in groups.values() for sub in items]
+
+    fd, library = tempfile.mkstemp(suffix=".blend")
+    os.close(fd)
+    fake_bpy.LIBRARIES[library] = names[::2]
+
+    def setup():
+        fake_bpy.reset()
+        material_library.material_cache.invalidate()
+
+    def run(state):
+        for i in range(size):
+            custom_renamer.link_material(names[i % len(names)], library)
+        return fake_bpy.stats["library_loads"]
+
+    try:
+        seconds, loads = best_of(args.repeat, setup, run)
+    finally:
+        os.remove(library)
+    return [{"benchmark": "link_material lookups", "seconds": seconds, "library_loads": loads}]
+
+
+def bench_matcher(size, args, groups):
+    group_matcher = import_addon_module("group_matcher")
+    names = [name for name, kind in scenes.scene_names(groups, size, **args.scene)]
+
+    def run(matcher):
+        for name in names:
+            matcher.match(name)
+
+    # A fresh matcher per run so the scan is timed, not the memo
+    seconds, _ = best_of(args.repeat, lambda: group_matcher.SubgroupMatcher(groups), run)
+    memo, _ = best_of(2, group_matcher.get_matcher, run)
+    return [
+        {"benchmark": "sub-group matching", "seconds": seconds},
+        {"benchmark": "sub-group matching (memoized)", "seconds": memo},
+    ]
+
+
+BENCHMARKS = {
+    "bundle": bench_bundle,
+    "curves": bench_curve_names,
+    "enums": bench_enum_items,
+    "materials": bench_material_lookup,
+    "matcher": bench_matcher,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--only", default=",".join(BENCHMARKS), help="Comma separated benchmarks to run")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--curve-ratio", type=float, default=0.1)
+    parser.add_argument("--noise", type=float, default=0.1)
+    parser.add_argument("--collisions", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="", help="Write JSON results here (default: stdout)")
+    args = parser.parse_args(argv)
+    args.scene = {
+        "curve_ratio": args.curve_ratio,
+        "noise": args.noise,
+        "collisions": args.collisions,
+        "seed": args.seed,
+    }
+
+    addon = importlib.import_module(os.path.basename(ADDON_DIR))
+    groups = import_addon_module("taxonomy").get_taxonomy().groups
+
+    results = []
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        for name in args.only.split(","):
+            for entry in BENCHMARKS[name](size, args, groups):
+                entry["size"] = size
+                entry["per_item_us"] = round(entry["seconds"] / size * 1e6, 3)
+                results.append(entry)
+                print(f"{entry['benchmark']:40} {size:>8} {entry['seconds'] * 1000:10.2f} ms", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "addon_version": ".".join(map(str, addon.bl_info["version"])),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "repeat": args.repeat,
+            "scene": args.scene,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Synthetic furniture scenes built from a GROUPS-style taxonomy.
+"""
+import random
+
+import fake_bpy
+
+
+def scene_names(groups, count, curve_ratio=0.1, noise=0.1, collisions=0.05, seed=0):
+    """
+    Return [(name, kind)] for a synthetic assembly:
+    - curve_ratio of the parts are CURVE objects named like piping/welts,
+    - noise of the names match no sub-group (imported `Mesh.123` parts),
+    - collisions of the names repeat an earlier name, so Blender-style
+      `.001` suffixes show up exactly as they do in real deliveries.
+    """
+    rng = random.Random(seed)
+    subs = [sub for items in groups.values() for sub in items]
+    names = []
+
+    for i in range(count):
+        kind = 'CURVE' if rng.random() < curve_ratio else 'MESH'
+        if names and rng.random() < collisions:
+            name = rng.choice(names)[0]
+        elif rng.random() < noise:
+            name = f"BezierCurve.{i}" if kind == 'CURVE' else f"Mesh.{i}"
+        else:
+            sub = rng.choice(subs)
+            if kind == 'CURVE':
+                name = f"{sub}_curve"
+            else:
+                style = rng.random()
+                if style < 0.2:
+                    name = sub.lower()
+                elif style < 0.4:
+                    name = f"{sub}_{rng.randint(1, 99):02d}"
+                else:
+                    name = sub
+        names.append((name, kind))
+    return names
+
+
+def build_scene(bpy, groups, count, select=True, **kwargs):
+    """Fill the fake file with a synthetic scene and select every part."""
+    fake_bpy.reset()
+    objects = [fake_bpy.new_object(bpy, name, kind) for name, kind in scene_names(groups, count, **kwargs)]
+    if select:
+        for obj in objects:
+            obj.select_set(True)
+        bpy.context.selected_objects = objects
+        bpy.context.active_object = objects[0] if objects else None
+    return objects
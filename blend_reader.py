@@ -0,0 +1,192 @@
+"""
+List the ID names in a .blend file without Blender.
+
+A .blend is a file header, a stream of blocks (each a small header plus
+data) and the SDNA, a description of every struct in the file, at the end.
+Only the first bytes of the wanted ID blocks are kept while streaming;
+once the SDNA is read it tells where ID.name and ID.lib sit, whatever
+Blender version wrote the file. Gzip-compressed files are read through
+gzip; zstd (Blender 3.0+ "Compress") needs Python 3.14's compression.zstd,
+otherwise BlendReadError tells the caller to fall back to Blender.
+"""
+import gzip
+import struct
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ID_PREFIX_BYTES = 1024      # of each wanted block, enough to reach the ID name
+
+
+class BlendReadError(Exception):
+    """The file isn't a .blend this reader understands."""
+
+
+def open_blend(path):
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(path, "rb")
+    if magic == ZSTD_MAGIC:
+        try:
+            from compression import zstd
+        except ImportError:
+            raise BlendReadError("zstd-compressed .blend files need Python 3.14") from None
+        return zstd.open(path, "rb")
+    return open(path, "rb")
+
+
+def read_file_header(f):
+    """Return (pointer size, endian prefix, block header struct)."""
+    head = f.read(12)
+    if len(head) < 12 or not head.startswith(b"BLENDER"):
+        raise BlendReadError("not a .blend file")
+
+    if head[7:9].isdigit():
+        # Blender 5.0+: BLENDER17-01v0500, header size then format version
+        head += f.read(int(head[7:9]) - 12)
+        if head[9:10] != b"-" or head[10:12] != b"01" or head[12:13] != b"v":
+            raise BlendReadError(f"unknown .blend header {head!r}")
+        # code, SDNA index, old pointer, 64-bit length, count
+        return 8, "<", struct.Struct("<4siQqq")
+
+    pointer_size = {b"_": 4, b"-": 8}.get(head[7:8])
+    endian = {b"v": "<", b"V": ">"}.get(head[8:9])
+    if pointer_size is None or endian is None:
+        raise BlendReadError(f"unknown .blend header {head!r}")
+    pointer = "I" if pointer_size == 4 else "Q"
+    # code, length, old pointer, SDNA index, count
+    return pointer_size, endian, struct.Struct(f"{endian}4si{pointer}ii")
+
+
+def iter_blocks(f, block_header, wanted):
+    """Yield (code, data) for wanted codes and DNA1; other blocks are skipped unread."""
+    large = block_header.size == 32
+    while True:
+        raw = f.read(block_header.size)
+        if len(raw) < block_header.size:
+            raise BlendReadError("truncated .blend file")
+        fields = block_header.unpack(raw)
+        code = fields[0]
+        length = fields[3] if large else fields[1]
+        if code == b"ENDB":
+            return
+        if length < 0:
+            raise BlendReadError("corrupt block header")
+        if code == b"DNA1":
+            yield code, f.read(length)
+        elif code in wanted:
+            data = f.read(min(length, ID_PREFIX_BYTES))
+            f.seek(length - len(data), 1)
+            yield code, data
+        else:
+            f.seek(length, 1)
+
+
+# --- SDNA
+def parse_sdna(data, endian):
+    """Return (field names, type names, type lengths, {struct name: [(type, field name)]})."""
+    position = 0
+
+    def expect(tag):
+        nonlocal position
+        position = (position + 3) & ~3
+        if data[position:position + 4] != tag:
+            raise BlendReadError(f"SDNA is missing {tag!r}")
+        position += 4
+
+    def read_int(fmt, size):
+        nonlocal position
+        value = struct.unpack_from(endian + fmt, data, position)[0]
+        position += size
+        return value
+
+    def read_strings():
+        nonlocal position
+        strings = []
+        for _ in range(read_int("i", 4)):
+            end = data.index(b"\0", position)
+            strings.append(data[position:end].decode("latin-1"))
+            position = end + 1
+        return strings
+
+    if data[:4] != b"SDNA":
+        raise BlendReadError("DNA1 block without SDNA")
+    position = 4
+    expect(b"NAME")
+    names = read_strings()
+    expect(b"TYPE")
+    types = read_strings()
+    expect(b"TLEN")
+    lengths = [read_int("h", 2) for _ in types]
+    expect(b"STRC")
+    structs = {}
+    for _ in range(read_int("i", 4)):
+        struct_type = read_int("h", 2)
+        fields = [(read_int("h", 2), read_int("h", 2)) for _ in range(read_int("h", 2))]
+        structs[types[struct_type]] = [(types[t], names[n]) for t, n in fields]
+    return names, types, lengths, structs
+
+
+def field_size(type_name, field_name, type_lengths, pointer_size):
+    count = 1
+    for dim in field_name.split("[")[1:]:
+        count *= int(dim.rstrip("]"))
+    if field_name.startswith("*") or field_name.startswith("(*"):
+        return pointer_size * count
+    return type_lengths[type_name] * count
+
+
+def field_offsets(sdna, struct_name, pointer_size):
+    """{bare field name: (offset, size)} for one struct."""
+    names, types, lengths, structs = sdna
+    type_lengths = dict(zip(types, lengths))
+    offsets = {}
+    offset = 0
+    for type_name, field_name in structs[struct_name]:
+        size = field_size(type_name, field_name, type_lengths, pointer_size)
+        bare = field_name.lstrip("*(").split("[")[0].split(")")[0]
+        offsets[bare] = (offset, size)
+        offset += size
+    return offsets
+
+
+# --- ID names
+def read_id_names(path, code=b"MA"):
+    """
+    Names (without the two-letter prefix) of the local IDs of one kind in
+    the .blend at path, e.g. every material. IDs the file itself links
+    from another library are left out, as libraries.load does.
+    """
+    block_code = code.ljust(4, b"\0")
+    prefixes = []
+    sdna = None
+    try:
+        with open_blend(path) as f:
+            pointer_size, endian, block_header = read_file_header(f)
+            for found, data in iter_blocks(f, block_header, {block_code}):
+                if found == b"DNA1":
+                    sdna = parse_sdna(data, endian)
+                else:
+                    prefixes.append(data)
+    except (OSError, EOFError, struct.error, ValueError, KeyError, IndexError) as e:
+        raise BlendReadError(str(e)) from e
+    if sdna is None:
+        raise BlendReadError("no SDNA in file")
+
+    try:
+        offsets = field_offsets(sdna, "ID", pointer_size)
+        name_offset, name_size = offsets["name"]
+        lib_offset, lib_size = offsets["lib"]
+    except (KeyError, IndexError, ValueError) as e:
+        raise BlendReadError(f"unexpected ID layout: {e}") from e
+
+    names = []
+    for data in prefixes:
+        if len(data) < name_offset + name_size:
+            continue
+        if any(data[lib_offset:lib_offset + lib_size]):
+            continue
+        raw = data[name_offset:name_offset + name_size].split(b"\0", 1)[0]
+        if raw.startswith(code):
+            names.append(raw[len(code):].decode("utf-8", "replace"))
+    return names
@@ -0,0 +1,139 @@
+import bpy
+
+# Custom property holding the classification inputs an object was bundled with
+STAMP_KEY = "group_renamer_bundle"
+MAX_TRACKED = 50000     # past this many pending names, fall back to a stamp scan
+CHECK_INTERVAL = 0.5    # seconds between stale checks of recently updated objects
+TRACKED_TYPES = ('MESH', 'CURVE')
+
+# names: objects known to be stale; candidates: updated since the last check
+_tracker = {"names": set(), "candidates": set(), "scheduled": False, "overflow": False, "version": None}
+
+
+# --- Fingerprints
+def fingerprint(obj, version):
+    return f"{obj.name}|{obj.type}|{version}"
+
+
+def is_stale(obj, version):
+    return obj.get(STAMP_KEY) != fingerprint(obj, version)
+
+
+def stamp_objects(objects, version):
+    for obj in objects:
+        obj[STAMP_KEY] = fingerprint(obj, version)
+    _tracker["version"] = version
+
+
+# --- Dirty set
+@bpy.app.handlers.persistent
+def on_depsgraph_update(scene, depsgraph):
+    """
+    Remember objects that may have been added or renamed. Kept to a set
+    insert per ID-level update: geometry and transform updates (sculpting,
+    moving, editing) are skipped outright, and fingerprints are compared
+    at most once per CHECK_INTERVAL, by a timer, for everything updated
+    since.
+    """
+    if _tracker["overflow"]:
+        return
+    candidates = _tracker["candidates"]
+    for update in depsgraph.updates:
+        if update.is_updated_geometry or update.is_updated_transform:
+            continue
+        obj = update.id
+        if isinstance(obj, bpy.types.Object):
+            candidates.add(obj.original.name)
+    if len(candidates) > MAX_TRACKED:
+        clear_dirty()
+        _tracker["overflow"] = True
+    elif candidates and not _tracker["scheduled"]:
+        _tracker["scheduled"] = True
+        bpy.app.timers.register(check_candidates, first_interval=CHECK_INTERVAL)
+
+
+def check_candidates():
+    """
+    Keep the updated objects whose stamp no longer matches; selection
+    changes, relinks and the bundle's own edits leave stamps intact.
+    """
+    _tracker["scheduled"] = False
+    candidates, names, version = _tracker["candidates"], _tracker["names"], _tracker["version"]
+    objects = bpy.data.objects
+    for name in candidates:
+        obj = objects.get(name)
+        # Without a bundle this session there is no version to compare against
+        if obj is not None and obj.type in TRACKED_TYPES and (version is None or is_stale(obj, version)):
+            names.add(name)
+    candidates.clear()
+    if len(names) > MAX_TRACKED:
+        names.clear()
+        _tracker["overflow"] = True
+    return None
+
+
+def pending_count():
+    """Objects renamed or added since they were last bundled."""
+    if _tracker["candidates"]:
+        check_candidates()
+    return len(_tracker["names"])
+
+
+def dirty_objects(scene, version, types=TRACKED_TYPES):
+    """
+    Objects in scene whose stamp no longer matches their name, type and
+    the taxonomy version. Only recorded names are checked, unless the
+    taxonomy changed or too many updates came in, then every object that
+    was bundled before is re-checked.
+    """
+    if _tracker["candidates"]:
+        check_candidates()
+    objects = scene.objects
+    if _tracker["overflow"] or _tracker["version"] != version:
+        candidates = [obj for obj in objects if STAMP_KEY in obj]
+        candidates.extend(objects.get(name) for name in _tracker["names"])
+    else:
+        candidates = [objects.get(name) for name in _tracker["names"]]
+
+    dirty = {}
+    for obj in candidates:
+        if obj is not None and obj.type in types and is_stale(obj, version):
+            dirty[obj.name] = obj
+    return list(dirty.values())
+
+
+def mark_clean(names):
+    names = set(names)
+    _tracker["names"].difference_update(names)
+    _tracker["candidates"].difference_update(names)
+
+
+def clear_dirty():
+    _tracker["names"].clear()
+    _tracker["candidates"].clear()
+    _tracker["overflow"] = False
+
+
+@bpy.app.handlers.persistent
+def reset_tracker(*args):
+    # Loading a file drops the pending check timer
+    if bpy.app.timers.is_registered(check_candidates):
+        bpy.app.timers.unregister(check_candidates)
+    _tracker["scheduled"] = False
+    clear_dirty()
+    _tracker["version"] = None
+
+
+def register():
+    if on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    if reset_tracker not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(reset_tracker)
+
+
+def unregister():
+    if on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+    if reset_tracker in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(reset_tracker)
+    reset_tracker()
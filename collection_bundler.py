@@ -1,93 +1,177 @@
 import bpy
 from bpy.types import Operator, Panel
-from .group_data import GROUPS
+from bpy.props import BoolProperty, StringProperty
+from .group_matcher import get_matcher
+from .planner import plan_bundle, bundle_empty_names, BUNDLED_TYPES
+from .plan_applier import apply_plan, snapshot_scene
+from .profiling import timed, profiled_operator
+from .bundle_tracker import stamp_objects, mark_clean, clear_dirty, dirty_objects, pending_count
+from .mesh_dedup import share_identical_meshes, format_bytes
+from .group_index import get_group_index
+
+
+def bundle_selected_objects(share_meshes=False):
+    return bundle_objects(bpy.context.selected_objects, share_meshes=share_meshes)
+
+
+def plan_bundle_objects(objects, matcher=None):
+    """Snapshot objects and return the bundle Plan without touching the scene."""
+    if matcher is None:
+        matcher = get_matcher()
+    with timed("bundle.snapshot", len(objects)):
+        scene = snapshot_scene(objects, bundle_empty_names(matcher.groups))
+    with timed("bundle.plan", len(objects)):
+        return plan_bundle(scene, [obj.name for obj in objects], matcher)
+
+
+def bundle_objects(objects, matcher=None, share_meshes=False):
+    """
+    Bundle objects into EXPORT/ORPHAN with the group empty hierarchy.
+    Returns a summary dict of what went where, keyed by object name. With
+    share_meshes, identical meshes among them become linked instances.
+    """
+    if matcher is None:
+        matcher = get_matcher()
+    plan = plan_bundle_objects(objects, matcher)
+    with timed("bundle.apply", len(objects)):
+        apply_plan(plan)
+
+    bundled = [obj for obj in objects if obj.type in BUNDLED_TYPES]
+    stamp_objects(bundled, matcher.version)
+    mark_clean(obj.name for obj in bundled)
+    summary = {"groups": plan.groups, "curves": plan.curves, "orphaned": plan.orphans}
+    if share_meshes:
+        summary["meshes_shared"], summary["bytes_saved"] = share_identical_meshes(bundled)
+    return summary
+
+
+def bundle_dirty_objects(scene, matcher=None, share_meshes=False):
+    """
+    Bundle only objects added or renamed since they were last bundled.
+    Returns the bundle summary, or None when nothing changed.
+    """
+    if matcher is None:
+        matcher = get_matcher()
+    with timed("bundle.dirty_scan"):
+        dirty = dirty_objects(scene, matcher.version, BUNDLED_TYPES)
+    clear_dirty()
+    if not dirty:
+        return None
+    return bundle_objects(dirty, matcher, share_meshes)
+
+
+def shared_meshes_text(summary):
+    if not summary.get("meshes_shared"):
+        return ""
+    return f", {summary['meshes_shared']} duplicate mesh(es) shared ({format_bytes(summary['bytes_saved'])} saved)"
 
 
-def ensure_collection(name, color_tag=None):
-    if name in bpy.data.collections:
-        col = bpy.data.collections[name]
-    else:
-        col = bpy.data.collections.new(name)
-        bpy.context.scene.collection.children.link(col)
+class OBJECT_OT_bundle_collection(Operator):
+    bl_idname = "object.bundle_selected"
+    bl_label = "Bundle Selection"
+    bl_description = "Move selected objects/curves into EXPORT collection with parenting hierarchy"
+    bl_options = {'REGISTER', 'UNDO'}
 
-    if color_tag:
-        col.color_tag = color_tag
+    share_meshes: BoolProperty(
+        name="Share Identical Meshes",
+        description="Also turn copies of the same geometry into linked instances of one mesh",
+        default=False,
+    )
 
-    return col
+    @profiled_operator("object.bundle_selected")
+    def execute(self, context):
+        try:
+            summary = bundle_selected_objects(self.share_meshes)
+        except Exception as e:
+            self.report({'ERROR'}, f"Bundling failed: {e}")
+            return {'CANCELLED'}
 
+        self.report({'INFO'}, f"Bundling complete{shared_meshes_text(summary)}.")
+        return {'FINISHED'}
 
-def ensure_empty(name):
-    if name in bpy.data.objects:
-        obj = bpy.data.objects[name]
-    else:
-        obj = bpy.data.objects.new(name, None)
-        bpy.context.scene.collection.objects.link(obj)
-    return obj
 
+class OBJECT_OT_bundle_incremental(Operator):
+    bl_idname = "object.bundle_incremental"
+    bl_label = "Bundle Changes"
+    bl_description = "Bundle only objects added or renamed since the last bundle"
+    bl_options = {'REGISTER', 'UNDO'}
 
-def safe_link_to_collection(obj, target_col):
-    for col in obj.users_collection:
-        if col != target_col:
-            col.objects.unlink(obj)
-    if obj.name not in target_col.objects:
-        target_col.objects.link(obj)
+    share_meshes: BoolProperty(
+        name="Share Identical Meshes",
+        description="Also turn copies of the same geometry into linked instances of one mesh",
+        default=False,
+    )
 
+    @profiled_operator("object.bundle_incremental")
+    def execute(self, context):
+        try:
+            summary = bundle_dirty_objects(context.scene, share_meshes=self.share_meshes)
+        except Exception as e:
+            self.report({'ERROR'}, f"Bundling failed: {e}")
+            return {'CANCELLED'}
 
-def bundle_selected_objects():
-    selected_objs = [obj for obj in bpy.context.selected_objects if obj.type in {'MESH', 'CURVE'}]
+        if summary is None:
+            self.report({'INFO'}, "Nothing changed since the last bundle.")
+            return {'CANCELLED'}
 
-    if not selected_objs:
-        raise RuntimeError("No supported objects selected.")
+        count = sum(len(names) for names in summary["groups"].values()) + len(summary["curves"]) + len(summary["orphaned"])
+        self.report({'INFO'}, f"Bundled {count} changed object(s){shared_meshes_text(summary)}.")
+        return {'FINISHED'}
 
-    export_col = ensure_collection("EXPORT", color_tag='COLOR_04')
-    orphan_col = ensure_collection("ORPHAN", color_tag='COLOR_01')
 
-    group_empties = {}
-    curves_empty = ensure_empty("Curves_Group")
-    placeholder = ensure_empty("PLACEHOLDER")
+class OBJECT_OT_bundle_group(Operator):
+    bl_idname = "object.bundle_group"
+    bl_label = "Bundle Group"
+    bl_description = "Bundle every mesh and curve of the group in the scene, selected or not"
+    bl_options = {'REGISTER', 'UNDO'}
 
-    safe_link_to_collection(curves_empty, export_col)
-    safe_link_to_collection(placeholder, export_col)
+    group: StringProperty(name="Group")
 
-    for obj in selected_objs:
-        name = obj.name.lower()
-        assigned = False
+    @profiled_operator("object.bundle_group")
+    def execute(self, context):
+        objects = get_group_index().members(group=self.group, scene=context.scene)
+        if not objects:
+            self.report({'WARNING'}, f"No objects in {self.group}.")
+            return {'CANCELLED'}
 
-        if "curve" in name:
-            for group, subs in GROUPS.items():
-                if any(sub.lower() in name for sub in subs):
-                    safe_link_to_collection(obj, export_col)
-                    if obj != curves_empty:
-                        obj.parent = curves_empty
-                    assigned = True
-                    break
-            if not assigned:
-                safe_link_to_collection(obj, orphan_col)
-            continue
+        try:
+            bundle_objects(objects)
+        except Exception as e:
+            self.report({'ERROR'}, f"Bundling failed: {e}")
+            return {'CANCELLED'}
 
-        for group, subs in GROUPS.items():
-            if any(sub.lower() in name for sub in subs):
-                if group not in group_empties:
-                    group_empties[group] = ensure_empty(group)
-                    safe_link_to_collection(group_empties[group], export_col)
-                    group_empties[group].parent = placeholder
-                safe_link_to_collection(obj, export_col)
-                if obj != group_empties[group]:
-                    obj.parent = group_empties[group]
-                assigned = True
-                break
+        self.report({'INFO'}, f"Bundled {len(objects)} object(s) of {self.group}.")
+        return {'FINISHED'}
 
-        if not assigned:
-            safe_link_to_collection(obj, orphan_col)
 
-    curves_empty.parent = placeholder
+# Lines of the last previewed plan, shown by the dry-run dialog
+_preview_lines = []
 
 
-class OBJECT_OT_bundle_collection(Operator):
-    bl_idname = "object.bundle_selected"
-    bl_label = "Bundle Selection"
-    bl_description = "Move selected objects/curves into EXPORT collection with parenting hierarchy"
+class OBJECT_OT_bundle_preview(Operator):
+    bl_idname = "object.bundle_preview"
+    bl_label = "Preview Bundle"
+    bl_description = "Show the bundle plan for the selection (dry run) and apply it on confirm"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        try:
+            plan = plan_bundle_objects(context.selected_objects)
+        except Exception as e:
+            self.report({'ERROR'}, f"Planning failed: {e}")
+            return {'CANCELLED'}
+
+        _preview_lines[:] = plan.summary_lines()
+        if plan.is_empty():
+            _preview_lines.insert(0, "Selection is already bundled, nothing to do.")
+        return context.window_manager.invoke_props_dialog(self, width=480)
+
+    def draw(self, context):
+        col = self.layout.column(align=True)
+        for line in _preview_lines:
+            col.label(text=line)
 
+    @profiled_operator("object.bundle_preview")
     def execute(self, context):
         try:
             bundle_selected_objects()
@@ -108,14 +192,25 @@ class VIEW3D_PT_bundle_panel(Panel):
 
     def draw(self, context):
         layout = self.layout
-        layout.operator("object.bundle_selected", icon="PACKAGE")
+        row = layout.row(align=True)
+        row.operator("object.bundle_selected", icon="PACKAGE")
+        row.operator("object.bundle_preview", text="", icon="VIEWZOOM")
+        pending = pending_count()
+        layout.operator("object.bundle_incremental", text=f"Bundle Changes ({pending})" if pending else "Bundle Changes", icon="FILE_REFRESH")
+        layout.operator("object.share_identical_meshes", icon="LINKED")
 
 
 def register():
     bpy.utils.register_class(OBJECT_OT_bundle_collection)
+    bpy.utils.register_class(OBJECT_OT_bundle_preview)
+    bpy.utils.register_class(OBJECT_OT_bundle_incremental)
+    bpy.utils.register_class(OBJECT_OT_bundle_group)
     bpy.utils.register_class(VIEW3D_PT_bundle_panel)
 
 
 def unregister():
     bpy.utils.unregister_class(VIEW3D_PT_bundle_panel)
+    bpy.utils.unregister_class(OBJECT_OT_bundle_group)
+    bpy.utils.unregister_class(OBJECT_OT_bundle_incremental)
+    bpy.utils.unregister_class(OBJECT_OT_bundle_preview)
     bpy.utils.unregister_class(OBJECT_OT_bundle_collection)
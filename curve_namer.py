@@ -1,26 +1,48 @@
 import bpy
 from bpy.types import Operator, Panel
-from bpy.props import StringProperty
-
-# --- Suffix list
-SUFFIXES = [
-    "", "_second", "_third", "_fourth", "_fifth",
-    "_sixth", "_seventh", "_eighth", "_ninth", "_tenth"
-]
-
-def get_suffix(index):
-    if index < len(SUFFIXES):
-        return SUFFIXES[index]
-    else:
-        return f"_{index+1}th"
+from bpy.props import BoolProperty
+from .name_registry import get_name_registry, reset_name_registry
+from .planner import plan_curve_renames
+from .plan_applier import apply_plan, snapshot_object
+from .profiling import timed, profiled_operator
+from .group_index import get_group_index
+
+# --- Renaming
+def rename_curves(curves, base_name):
+    """
+    Rename curves (objects and curve data) to <base_name>_curve<ordinal>,
+    taking the lowest free ordinals. Curves keep their relative order, so
+    renumbering closes gaps without swapping any. Names are planned by
+    plan_curve_renames against the name registry and applied in one pass.
+    Returns a list of (old_name, new_name).
+    """
+    selected = list(dict.fromkeys(curves))
+    old_names = [obj.name for obj in selected]
+
+    registry = get_name_registry()
+    for obj in selected:
+        registry.release(obj.name, obj)
+        registry.release(obj.data.name, obj.data)
+
+    with timed("curves.allocate", len(selected)):
+        plan = plan_curve_renames([snapshot_object(obj) for obj in selected], base_name, registry)
+    apply_plan(plan)
+
+    planned = dict(plan.renames)
+    for obj, old_name in zip(selected, old_names):
+        new_name = planned.get(old_name, old_name)
+
+        # Something outside the registry already held the name: learn
+        # about it and take the next free ordinal instead of skipping.
+        while obj.name != new_name or obj.data.name != new_name:
+            registry.adopt(new_name)
+            new_name = registry.allocate(f"{base_name}_curve")[0]
+            obj.name = new_name
+            obj.data.name = new_name
 
-def get_used_object_names(exclude_objects):
-    exclude_set = set(exclude_objects)
-    return {obj.name for obj in bpy.data.objects if obj not in exclude_set}
+        registry.claim(new_name, obj, obj.data)
 
-def get_used_curve_data_names(exclude_objects):
-    exclude_data = {obj.data for obj in exclude_objects if obj.type == 'CURVE'}
-    return {obj.data.name for obj in bpy.data.objects if obj.type == 'CURVE' and obj.data not in exclude_data}
+    return [(old, obj.name) for old, obj in zip(old_names, selected)]
 
 # --- Operator
 class OBJECT_OT_rename_curves(Operator):
@@ -28,13 +50,14 @@ class OBJECT_OT_rename_curves(Operator):
     bl_label = "Rename Selected Curves"
     bl_description = "Rename selected curves based on the selected sub-group name"
 
-    def execute(self, context):
-        selected = [obj for obj in context.selected_objects if obj.type == 'CURVE']
-
-        if not selected:
-            self.report({'WARNING'}, "No curves selected!")
-            return {'CANCELLED'}
+    whole_subgroup: BoolProperty(
+        name="Whole Sub-Group",
+        description="Renumber every curve already in the sub-group instead of the selection",
+        default=False,
+    )
 
+    @profiled_operator("object.rename_curves")
+    def execute(self, context):
         rename_props = context.scene.rename_props
         base_name = rename_props.sub_group.strip()
 
@@ -42,24 +65,16 @@ class OBJECT_OT_rename_curves(Operator):
             self.report({'WARNING'}, "No sub-group selected!")
             return {'CANCELLED'}
 
-        selected.sort(key=lambda o: o.name)
-
-        existing_object_names = get_used_object_names(selected)
-        existing_curve_data_names = get_used_curve_data_names(selected)
-
-        for i, obj in enumerate(selected):
-            suffix = get_suffix(i)
-            new_name = f"{base_name}_curve{suffix}"
+        if self.whole_subgroup:
+            selected = get_group_index().members(sub_group=base_name, types={'CURVE'}, scene=context.scene)
+        else:
+            selected = [obj for obj in context.selected_objects if obj.type == 'CURVE']
 
-            if new_name in existing_object_names or new_name in existing_curve_data_names:
-                self.report({'WARNING'}, f"Name '{new_name}' already exists. Skipping '{obj.name}'.")
-                continue
-
-            obj.name = new_name
-            obj.data.name = new_name
+        if not selected:
+            self.report({'WARNING'}, "No curves selected!")
+            return {'CANCELLED'}
 
-            existing_object_names.add(new_name)
-            existing_curve_data_names.add(new_name)
+        rename_curves(selected, base_name)
 
         self.report({'INFO'}, f"Renamed {len(selected)} curves using base name '{base_name}'.")
         return {'FINISHED'}
@@ -76,6 +91,7 @@ class VIEW3D_PT_curve_renamer(Panel):
         layout = self.layout
         layout.label(text="Curve Renamer")
         layout.operator("object.rename_curves", icon='OUTLINER_OB_CURVE')
+        layout.operator("object.rename_curves", text="Renumber Sub-Group Curves", icon='LINENUMBERS_ON').whole_subgroup = True
 
 # --- Registration
 classes = (
@@ -86,7 +102,11 @@ classes = (
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    bpy.app.handlers.load_post.append(reset_name_registry)
 
 def unregister():
+    if reset_name_registry in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(reset_name_registry)
+    reset_name_registry()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
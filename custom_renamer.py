@@ -1,96 +1,126 @@
 import bpy
-import bmesh
 from bpy.types import Panel, Operator, PropertyGroup
-from bpy.props import EnumProperty, PointerProperty
-from .group_data import GROUPS
-
-def link_material(material_name, blend_path):
-    if not blend_path:
+from bpy.props import EnumProperty, PointerProperty, BoolProperty, StringProperty
+from .taxonomy import get_taxonomy, get_profiles
+from .material_library import material_cache, get_material_library_paths
+from .rename_service import get_rename_targets, rename_objects, report_rename_results
+from .profiling import timed, profiled_operator
+
+def link_material(material_name, blend_paths):
+    """Link material_name from the first library in blend_paths that has it."""
+    if isinstance(blend_paths, str):
+        blend_paths = [blend_paths]
+    if not any(blend_paths):
         print("No blend path set, skipping material link.")
         return None
     
     try:
-        with bpy.data.libraries.load(blend_path, link=True) as (data_from, data_to):
-            if material_name in data_from.materials:
-                if material_name not in bpy.data.materials:
-                    data_to.materials.append(material_name)
-        return bpy.data.materials.get(material_name)
+        return material_cache.link_from_libraries(blend_paths, [material_name])[material_name]
     except Exception as e:
         print(f"Failed to link material '{material_name}': {e}")
         return None        
 
+def assign_material_to_objects(objects, material_name, blend_paths):
+    """Link material_name once and share it across every object's mesh."""
+    mat = link_material(material_name, blend_paths)
+    if not mat:
+        return None
+
+    for mesh in {obj.data for obj in objects}:
+        mesh.materials.clear()
+        mesh.materials.append(mat)
+    return mat
+
 def update_subgroup(self, context):
-    if self.group in GROUPS:
-        subgroups = GROUPS[self.group]
-        self.sub_group = subgroups[0] if subgroups else ""
+    subgroups = get_taxonomy(self.profile).subgroups(self.group)
+    self.sub_group = subgroups[0] if subgroups else ""
+
+def update_profile(self, context):
+    # The group enum indexes into the new profile now, so pick its first group
+    group_items = get_taxonomy(self.profile).group_items
+    if group_items:
+        self.group = group_items[0][0]
+
+def search_profiles(self, context, edit_text):
+    return [name for name in get_profiles() if edit_text.lower() in name.lower()]
 
 class RenameProps(PropertyGroup):
+    profile: StringProperty(
+        name="Profile",
+        description="Taxonomy profile this scene is named with (empty uses Default)",
+        search=search_profiles,
+        update=update_profile,
+    )
+
+    # Enum items come straight from the compiled taxonomy, which keeps the
+    # tuples alive for Blender and never rebuilds them per draw.
+    def get_group_items(self, context):
+        return get_taxonomy(self.profile).group_items
+
     group: EnumProperty(
         name="Group",
-        items=[(str(k), k.replace("_", " "), "") for k in GROUPS.keys()],
-        default="Arm_Group",
+        items=get_group_items,
         update=update_subgroup
     )
 
     def get_subgroup_items(self, context):
-        group_items = GROUPS.get(self.group, [])
-        return [(str(item), item.replace("_", " "), "") for item in group_items]
+        return get_taxonomy(self.profile).subgroup_items.get(self.group, ())
 
     sub_group: EnumProperty(
         name="Sub-Group",
         items=get_subgroup_items,
     )
 
+    batch_rename: BoolProperty(
+        name="All Selected",
+        description="Rename every selected mesh in one step instead of only the active object",
+        default=False,
+    )
+
+    rebuild_mesh: BoolProperty(
+        name="Rebuild Mesh",
+        description="Also rewrite the mesh geometry through BMesh while renaming (slow on dense meshes)",
+        default=False,
+    )
+
     def init_defaults(self):
         """Force initial sub_group assignment after registration"""
-        if self.group in GROUPS:
-            subgroups = GROUPS[self.group]
-            if subgroups:
-                self.sub_group = subgroups[0]
+        subgroups = get_taxonomy(self.profile).subgroups(self.group)
+        if subgroups:
+            self.sub_group = subgroups[0]
 
 class OBJECT_OT_rename_to_subgroup(Operator):
     bl_idname = "object.rename_to_subgroup"
     bl_label = "Rename"
-    bl_description = "Rename the active object and its mesh data to the selected sub-group without causing context switches"
+    bl_description = "Rename the active object (or all selected meshes) and mesh data to the selected sub-group without causing context switches"
+    bl_options = {'REGISTER', 'UNDO'}
 
     @classmethod
     def poll(cls, context):
-        obj = context.active_object
-        return obj is not None and obj.type == 'MESH' and obj.data is not None
+        return bool(get_rename_targets(context, context.scene.rename_props.batch_rename))
 
+    @profiled_operator("object.rename_to_subgroup")
     def execute(self, context):
         props = context.scene.rename_props
-        obj = context.active_object
-        mesh = obj.data
+        targets = get_rename_targets(context, props.batch_rename)
 
         new_name = props.sub_group.strip()
         if not new_name:
             self.report({'ERROR'}, "Sub-group name is empty. Cannot rename.")
             return {'CANCELLED'}
 
-        # Safe BMesh operations without needing to enter edit mode
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.to_mesh(mesh)
-        bm.free()
-
-        obj.name = new_name
-        mesh.name = new_name
-
-        self.report({'INFO'}, f"Renamed object and mesh to {new_name}")
+        results = rename_objects(targets, new_name, rebuild=props.rebuild_mesh)
+        report_rename_results(self, results, new_name)
     
-        # Link and assign material
+        # Link the material once and assign it to every renamed mesh
         try:
-            preferences = context.preferences.addons[__package__].preferences
-            blend_path = preferences.materials_blend_path
+            blend_paths = get_material_library_paths(context)
             material_name = new_name.lower()
 
-            mat = link_material(material_name, blend_path)
+            with timed("rename.materials", len(targets)):
+                mat = assign_material_to_objects(targets, material_name, blend_paths)
             if mat:
-                # Clear existing materials and assign new one
-                obj.data.materials.clear()
-                obj.data.materials.append(mat)
-                self.report({'INFO'}, f"Renamed and assigned material '{material_name}'")
+                self.report({'INFO'}, f"Renamed and assigned material '{material_name}' to {len(targets)} object(s)")
             else:
                 self.report({'WARNING'}, f"Material '{material_name}' not found or failed to link.")
         except Exception as e:
@@ -113,12 +143,20 @@ class VIEW3D_PT_group_renamer(Panel):
         if not props.sub_group:
             props.init_defaults()
 
+        if len(get_profiles()) > 1:
+            layout.prop(props, "profile", icon="PRESET")
         layout.prop(props, "group")
         layout.prop(props, "sub_group")
+        row = layout.row(align=True)
+        row.prop(props, "batch_rename")
+        row.prop(props, "rebuild_mesh")
 
         row = layout.row()
         row.scale_y = 1.3
         row.operator("object.rename_to_subgroup", icon="FILE_TICK")
+        layout.operator("object.search_subgroup", icon="VIEWZOOM")
+        layout.operator("object.name_mirrored_pairs", icon="MOD_MIRROR")
+        layout.operator("object.assign_materials_by_name", icon="MATERIAL")
 
         layout.separator()
         layout.operator("wm.refresh_group_pie_menus", icon="FILE_REFRESH")
@@ -0,0 +1,281 @@
+import bpy
+from bpy.types import Operator, Panel
+from bpy.props import BoolProperty, StringProperty
+from .taxonomy import get_taxonomy
+from .planner import BUNDLED_TYPES
+from .profiling import timed, profiled_operator
+
+
+# --- Index of objects by group and sub-group
+class GroupIndex:
+    """
+    Which group and sub-group every mesh and curve belongs to, with the
+    reverse sets per group and sub-group, so membership queries and counts
+    never walk bpy.data.objects. Built once per file and taxonomy version,
+    then kept current object by object from depsgraph updates, which
+    report added and renamed objects. Deleted objects are dropped lazily:
+    when a query runs into one, or on the next query after a collection
+    changed (deleting an object unlinks it from its collections).
+    """
+
+    def __init__(self):
+        self._entries = {}      # pointer -> (object, name, (group, sub_group) or None)
+        self._by_group = {}
+        self._by_subgroup = {}
+        self._matcher = None
+        self._version = None
+        self._check_deleted = False
+
+    def reset(self):
+        self._entries.clear()
+        self._by_group.clear()
+        self._by_subgroup.clear()
+        self._matcher = None
+        self._version = None
+        self._check_deleted = False
+
+    @property
+    def built(self):
+        return self._matcher is not None
+
+    def _add(self, key, obj, name):
+        match = self._matcher.match(name) if obj.type in BUNDLED_TYPES else None
+        self._entries[key] = (obj, name, match)
+        if match is not None:
+            self._by_group.setdefault(match[0], set()).add(key)
+            self._by_subgroup.setdefault(match[1], set()).add(key)
+
+    def _remove(self, key):
+        obj, name, match = self._entries.pop(key)
+        if match is not None:
+            self._by_group[match[0]].discard(key)
+            self._by_subgroup[match[1]].discard(key)
+
+    def rebuild(self):
+        taxonomy = get_taxonomy()
+        self.reset()
+        self._matcher = taxonomy.matcher
+        self._version = taxonomy.version
+        with timed("index.rebuild", len(bpy.data.objects)):
+            for obj in bpy.data.objects:
+                self._add(obj.as_pointer(), obj, obj.name)
+
+    def _drop_deleted(self):
+        """Drop entries whose object was deleted; only runs after a collection change."""
+        with timed("index.drop_deleted", len(self._entries)):
+            for key, (obj, name, match) in list(self._entries.items()):
+                try:
+                    obj.name
+                except ReferenceError:
+                    self._remove(key)
+        self._check_deleted = False
+
+    def sync(self):
+        if not self.built or self._version != get_taxonomy().version:
+            self.rebuild()
+        elif self._check_deleted:
+            self._drop_deleted()
+
+    def update(self, obj):
+        """File one added or renamed object; a dict lookup when nothing changed."""
+        if not self.built:
+            return
+        key = obj.as_pointer()
+        entry = self._entries.get(key)
+        name = obj.name
+        if entry is not None and entry[1] == name:
+            return
+        if entry is not None:
+            self._remove(key)
+        self._add(key, obj, name)
+
+    def mark_collections_changed(self):
+        self._check_deleted = True
+
+    # Queries
+    def classification(self, obj):
+        """(group, sub_group) of obj or None."""
+        self.sync()
+        entry = self._entries.get(obj.as_pointer())
+        return entry[2] if entry is not None else None
+
+    def members(self, group=None, sub_group=None, types=BUNDLED_TYPES, scene=None):
+        """Objects filed under sub_group, or under group when no sub-group is given."""
+        self.sync()
+        keys = self._by_subgroup.get(sub_group, ()) if sub_group else self._by_group.get(group, ())
+        scene_objects = scene.objects if scene is not None else None
+        found = []
+        for key in list(keys):
+            obj, name, match = self._entries[key]
+            try:
+                current = obj.name
+            except ReferenceError:
+                self._remove(key)
+                continue
+            if current != name:
+                # Renamed without a depsgraph update yet: re-file, keep if it still belongs
+                self._remove(key)
+                self._add(key, obj, current)
+                if key not in keys:
+                    continue
+            if obj.type in types and (scene_objects is None or current in scene_objects):
+                found.append(obj)
+        return sorted(found, key=lambda obj: obj.name)
+
+    def group_counts(self):
+        self.sync()
+        return {group: len(keys) for group, keys in self._by_group.items() if keys}
+
+    def subgroup_counts(self):
+        self.sync()
+        return {sub_group: len(keys) for sub_group, keys in self._by_subgroup.items() if keys}
+
+
+_group_index = GroupIndex()
+
+
+def get_group_index():
+    return _group_index
+
+
+# --- Handlers
+@bpy.app.handlers.persistent
+def on_depsgraph_update(scene, depsgraph):
+    """
+    Re-file added or renamed objects. Like the bundle tracker, geometry and
+    transform updates are skipped, so editing costs one flag check per
+    update. A changed collection only flags the index to look for deleted
+    objects the next time it is queried.
+    """
+    if not _group_index.built:
+        return
+    for update in depsgraph.updates:
+        if update.is_updated_geometry or update.is_updated_transform:
+            continue
+        id_block = update.id
+        if isinstance(id_block, bpy.types.Object):
+            _group_index.update(id_block.original)
+        elif isinstance(id_block, bpy.types.Collection):
+            _group_index.mark_collections_changed()
+
+
+@bpy.app.handlers.persistent
+def reset_group_index(*args):
+    # Held object references don't survive a file load or an undo step
+    _group_index.reset()
+
+
+# --- Selection
+def select_objects(context, objects, extend=False):
+    """Select objects that are in the view layer and make the first one active."""
+    view_layer_objects = context.view_layer.objects
+    if not extend:
+        for obj in context.selected_objects:
+            obj.select_set(False)
+    selected = []
+    for obj in objects:
+        if obj.name in view_layer_objects:
+            obj.select_set(True)
+            selected.append(obj)
+    if selected:
+        view_layer_objects.active = selected[0]
+    return selected
+
+
+class OBJECT_OT_select_group_members(Operator):
+    bl_idname = "object.select_group_members"
+    bl_label = "Select Group"
+    bl_description = "Select every mesh and curve belonging to the group"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    group: StringProperty(name="Group")
+    extend: BoolProperty(name="Extend", description="Add to the current selection", default=False)
+
+    @profiled_operator("object.select_group_members")
+    def execute(self, context):
+        group = self.group or context.scene.rename_props.group
+        selected = select_objects(context, get_group_index().members(group=group, scene=context.scene), self.extend)
+        self.report({'INFO'}, f"Selected {len(selected)} object(s) in {get_taxonomy().labels.get(group, group)}.")
+        return {'FINISHED'}
+
+
+class OBJECT_OT_select_subgroup_members(Operator):
+    bl_idname = "object.select_subgroup_members"
+    bl_label = "Select Sub-Group"
+    bl_description = "Select every mesh and curve named after the sub-group"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    sub_group: StringProperty(name="Sub-Group")
+    extend: BoolProperty(name="Extend", description="Add to the current selection", default=False)
+
+    @profiled_operator("object.select_subgroup_members")
+    def execute(self, context):
+        sub_group = self.sub_group or context.scene.rename_props.sub_group
+        selected = select_objects(context, get_group_index().members(sub_group=sub_group, scene=context.scene), self.extend)
+        self.report({'INFO'}, f"Selected {len(selected)} object(s) named {sub_group}.")
+        return {'FINISHED'}
+
+
+# --- Panel
+class VIEW3D_PT_group_members(Panel):
+    bl_label = "Group Members"
+    bl_idname = "VIEW3D_PT_group_members"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Rename"
+    bl_parent_id = "VIEW3D_PT_group_renamer"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        index = get_group_index()
+        taxonomy = get_taxonomy()
+        props = context.scene.rename_props
+
+        if props.sub_group:
+            row = layout.row(align=True)
+            row.label(text=f"{props.sub_group}: {index.subgroup_counts().get(props.sub_group, 0)}", icon="OBJECT_DATA")
+            row.operator("object.select_subgroup_members", text="", icon="RESTRICT_SELECT_OFF").sub_group = props.sub_group
+
+        counts = index.group_counts()
+        if not counts:
+            layout.label(text="No objects named after a sub-group.")
+            return
+
+        col = layout.column(align=True)
+        for group in taxonomy.groups:
+            count = counts.get(group, 0)
+            if not count:
+                continue
+            row = col.row(align=True)
+            row.label(text=f"{taxonomy.labels.get(group, group)}: {count}")
+            row.operator("object.select_group_members", text="", icon="RESTRICT_SELECT_OFF").group = group
+            row.operator("object.bundle_group", text="", icon="PACKAGE").group = group
+
+
+classes = (
+    OBJECT_OT_select_group_members,
+    OBJECT_OT_select_subgroup_members,
+    VIEW3D_PT_group_members,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    if on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reset_group_index not in handlers:
+            handlers.append(reset_group_index)
+
+
+def unregister():
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reset_group_index in handlers:
+            handlers.remove(reset_group_index)
+    if on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+    reset_group_index()
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,139 @@
+from collections import deque
+
+MATCH_CACHE_SIZE = 65536
+
+
+# --- Multi-pattern matcher (Aho-Corasick over lowercased sub-group names)
+class SubgroupMatcher:
+    """
+    Finds which sub-group a name belongs to in a single scan of the name.
+    Overlaps are resolved by the longest matching sub-group; equal lengths
+    fall back to taxonomy order, so the result never depends on luck.
+    """
+
+    def __init__(self, groups, version=""):
+        self._goto = [{}]
+        self._fail = [0]
+        self._hits = [()]
+        self._patterns = []
+        self._memo = {}
+        self.groups = tuple(groups)
+        self.version = version      # taxonomy version, stamped on bundled objects
+
+        order = 0
+        for group, subs in groups.items():
+            for sub in subs:
+                self._add(sub.lower(), (len(sub), -order, group, sub))
+                order += 1
+
+        self._build_links()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_memo"] = {}
+        return state
+
+    def _add(self, pattern, entry):
+        if not pattern:
+            return
+        state = 0
+        for char in pattern:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._hits.append(())
+                self._goto[state][char] = nxt
+            state = nxt
+        self._hits[state] = self._hits[state] + (len(self._patterns),)
+        self._patterns.append(entry)
+
+    def _build_links(self):
+        best = [None] * len(self._goto)
+        queue = deque()
+        for nxt in self._goto[0].values():
+            queue.append(nxt)
+
+        while queue:
+            state = queue.popleft()
+            fail = self._fail[state]
+            # Merge the outputs reachable through the failure link
+            self._hits[state] = self._hits[state] + self._hits[fail]
+            if self._hits[state]:
+                best[state] = max(self._hits[state], key=self._patterns.__getitem__)
+
+            for char, nxt in self._goto[state].items():
+                f = fail
+                while f and char not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(char, 0)
+                queue.append(nxt)
+
+        self._best = best
+
+    def _scan(self, name):
+        goto = self._goto
+        fail = self._fail
+        state = 0
+        for char in name.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            yield state
+
+    def match(self, name):
+        """
+        Return (group, sub_group) for the best match in name, or None.
+        Results are memoized, so re-bundling an unchanged scene skips the scan.
+        """
+        try:
+            return self._memo[name]
+        except KeyError:
+            pass
+        if len(self._memo) >= MATCH_CACHE_SIZE:
+            self._memo.clear()
+        result = self._memo[name] = self._match(name)
+        return result
+
+    def _match(self, name):
+        best = self._best
+        patterns = self._patterns
+        found = None
+        for state in self._scan(name):
+            idx = best[state]
+            if idx is not None and (found is None or patterns[idx] > patterns[found]):
+                found = idx
+        if found is None:
+            return None
+        entry = patterns[found]
+        return entry[2], entry[3]
+
+    def match_all(self, name):
+        """Return every (group, sub_group) occurring in name, best first."""
+        hits = set()
+        for state in self._scan(name):
+            hits.update(self._hits[state])
+        ranked = sorted((self._patterns[i] for i in hits), reverse=True)
+        return [(entry[2], entry[3]) for entry in ranked]
+
+
+# --- Cached matcher for ad-hoc group mappings, rebuilt only when they change
+_matcher_cache = {"key": None, "matcher": None}
+
+
+def _taxonomy_key(groups):
+    return tuple((group, tuple(subs)) for group, subs in groups.items())
+
+
+def get_matcher(groups=None):
+    """Matcher for groups, or for the active taxonomy when groups is None."""
+    if groups is None:
+        from .taxonomy import get_taxonomy
+        return get_taxonomy().matcher
+
+    key = _taxonomy_key(groups)
+    if _matcher_cache["key"] != key:
+        _matcher_cache["matcher"] = SubgroupMatcher(groups)
+        _matcher_cache["key"] = key
+    return _matcher_cache["matcher"]
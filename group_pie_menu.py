@@ -1,10 +1,40 @@
+from collections import deque
+
 import bpy
 from bpy.types import Menu, Operator
 from bpy.props import StringProperty
-from .group_data import GROUPS
-import bmesh
+from .taxonomy import get_taxonomy, add_taxonomy_listener, remove_taxonomy_listener
+from .rename_service import get_rename_targets, rename_objects, report_rename_results
+from .profiling import profiled_operator
+
+# --- Recently used sub-groups, most recent first
+RECENT_LIMIT = 8
+recent_subgroups = deque(maxlen=RECENT_LIMIT)
+
+def remember_subgroup(name):
+    if name in recent_subgroups:
+        recent_subgroups.remove(name)
+    recent_subgroups.appendleft(name)
 
 # --- Operator to rename
+def rename_to_subgroup(operator, context, new_name):
+    """Shared by the pie and the search popup."""
+    props = context.scene.rename_props
+    targets = get_rename_targets(context, props.batch_rename)
+    if not targets:
+        operator.report({'WARNING'}, "No valid mesh object selected.")
+        return {'CANCELLED'}
+
+    new_name = new_name.strip()
+    if not new_name:
+        operator.report({'ERROR'}, "Invalid name provided.")
+        return {'CANCELLED'}
+
+    results = rename_objects(targets, new_name, rebuild=props.rebuild_mesh)
+    report_rename_results(operator, results, new_name)
+    remember_subgroup(new_name)
+    return {'FINISHED'}
+
 class OBJECT_OT_rename_to_subgroup_pie(Operator):
     bl_idname = "object.rename_to_subgroup_pie"
     bl_label = "Rename to Sub-Group"
@@ -12,35 +42,53 @@ class OBJECT_OT_rename_to_subgroup_pie(Operator):
 
     name: StringProperty()
 
+    @profiled_operator("object.rename_to_subgroup_pie")
     def execute(self, context):
-        obj = context.active_object
-        if not obj or obj.type != 'MESH':
-            self.report({'WARNING'}, "No valid mesh object selected.")
-            return {'CANCELLED'}
-
-        new_name = self.name.strip()
-        if not new_name:
-            self.report({'ERROR'}, "Invalid name provided.")
-            return {'CANCELLED'}
+        return rename_to_subgroup(self, context, self.name)
+
+# --- Type-ahead search over every sub-group
+SEARCH_LIMIT = 50
+
+def search_subgroups(self, context, edit_text):
+    taxonomy = get_taxonomy()
+    index = taxonomy.search_index
+    return [
+        (name, ", ".join(taxonomy.labels[g] for g in index.groups_of(name)))
+        for name in index.search(edit_text, SEARCH_LIMIT, recent_subgroups)
+    ]
+
+class OBJECT_OT_search_subgroup(Operator):
+    bl_idname = "object.search_subgroup"
+    bl_label = "Search Sub-Group"
+    bl_description = "Type to find any sub-group across all groups and rename the selection to it"
+    bl_options = {'REGISTER', 'UNDO'}
 
-        mesh = obj.data
+    name: StringProperty(name="Sub-Group", search=search_subgroups)
 
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.to_mesh(mesh)
-        bm.free()
+    def invoke(self, context, event):
+        self.name = ""
+        return context.window_manager.invoke_props_dialog(self, width=360)
 
-        obj.name = new_name
-        mesh.name = new_name
+    def draw(self, context):
+        layout = self.layout
+        layout.activate_init = True
+        layout.prop(self, "name", text="", icon="VIEWZOOM")
 
-        self.report({'INFO'}, f"Renamed to {new_name}")
-        return {'FINISHED'}
+    @profiled_operator("object.search_subgroup")
+    def execute(self, context):
+        taxonomy = get_taxonomy()
+        # Accept typed text too, as long as it names a sub-group
+        name = taxonomy.lower_lookup.get(self.name.strip().lower().replace(" ", "_"))
+        if name is None or not taxonomy.subgroup_groups.get(name):
+            self.report({'WARNING'}, f"'{self.name}' is not a sub-group.")
+            return {'CANCELLED'}
+        return rename_to_subgroup(self, context, name)
 
 # --- Submenus per group (Dropdowns, not pies)
-def make_dropdown_menu(group, items):
+def make_dropdown_menu(group, items, label=None):
     class SubMenu(Menu):
         bl_idname = f"SUBMENU_MT_{group}"
-        bl_label = group.replace("_", " ")
+        bl_label = label or group.replace("_", " ")
 
         def draw(self, context):
             layout = self.layout
@@ -57,51 +105,84 @@ class PIE_MT_group_menu(Menu):
 
     def draw(self, context):
         pie = self.layout.menu_pie()
-        for group in GROUPS:
-            pie.menu(f"SUBMENU_MT_{group}", text=group.replace("_", " "), icon='GROUP')
+        taxonomy = get_taxonomy()
+        for group in taxonomy.groups:
+            pie.menu(f"SUBMENU_MT_{group}", text=taxonomy.labels[group], icon='GROUP')
 
 # --- Dynamic Submenus Storage
-submenus = []
+# group -> ((items, label), registered class)
+submenus = {}
+
+def sync_submenus(taxonomy=None):
+    """
+    Bring the registered submenus in line with the taxonomy, touching only
+    the groups that were added, removed or whose items/label changed.
+    Returns (added, changed, removed) counts.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+
+    wanted = {group: (items, taxonomy.labels[group]) for group, items in taxonomy.groups.items()}
+    added = changed = removed = 0
+
+    for group in [g for g in submenus if g not in wanted]:
+        bpy.utils.unregister_class(submenus.pop(group)[1])
+        removed += 1
+
+    for group, spec in wanted.items():
+        current = submenus.get(group)
+        if current is not None:
+            if current[0] == spec:
+                continue
+            bpy.utils.unregister_class(current[1])
+            changed += 1
+        else:
+            added += 1
+        cls = make_dropdown_menu(group, *spec)
+        bpy.utils.register_class(cls)
+        submenus[group] = (spec, cls)
 
-def generate_submenus():
-    """Generate submenus based on current GROUPS"""
-    global submenus
-    submenus.clear()
-    for group, items in GROUPS.items():
-        submenu = make_dropdown_menu(group, items)
-        submenus.append(submenu)
+    return added, changed, removed
+
+def _sync_submenus_deferred():
+    sync_submenus()
+    return None
+
+def on_taxonomy_changed(taxonomy):
+    # The change may be noticed mid-draw, so register classes from a timer
+    if not bpy.app.timers.is_registered(_sync_submenus_deferred):
+        bpy.app.timers.register(_sync_submenus_deferred, first_interval=0.0)
 
 # --- Operator to Regenerate Pie Menus
 class OBJECT_OT_refresh_group_pie_menus(Operator):
     bl_idname = "wm.refresh_group_pie_menus"
     bl_label = "Refresh Group Pie Menus"
-    bl_description = "Regenerate group pie menus after changing GROUPS"
+    bl_description = "Update group pie menus after changing the taxonomy"
 
     def execute(self, context):
-        unregister_submenus()
-        generate_submenus()
-        register_submenus()
-        self.report({'INFO'}, "Group Pie Menus refreshed.")
+        added, changed, removed = sync_submenus()
+        if added or changed or removed:
+            self.report({'INFO'}, f"Group Pie Menus refreshed ({added} added, {changed} changed, {removed} removed).")
+        else:
+            self.report({'INFO'}, "Group Pie Menus already up to date.")
         return {'FINISHED'}
 
-def register_submenus():
-    for cls in submenus:
-        bpy.utils.register_class(cls)
-
 def unregister_submenus():
-    for cls in reversed(submenus):
+    for spec, cls in reversed(list(submenus.values())):
         bpy.utils.unregister_class(cls)
+    submenus.clear()
 
 # --- Registration
 addon_keymaps = []
 
 def register():
     bpy.utils.register_class(OBJECT_OT_rename_to_subgroup_pie)
+    bpy.utils.register_class(OBJECT_OT_search_subgroup)
     bpy.utils.register_class(PIE_MT_group_menu)
     bpy.utils.register_class(OBJECT_OT_refresh_group_pie_menus)
 
-    generate_submenus()
-    register_submenus()
+    # Submenus are generated by the add-on's deferred startup timer
+    add_taxonomy_listener(on_taxonomy_changed)
 
     wm = bpy.context.window_manager
     if wm.keyconfigs.addon:
@@ -109,14 +190,20 @@ def register():
         kmi = km.keymap_items.new("wm.call_menu_pie", "U", "PRESS", alt=True)
         kmi.properties.name = "PIE_MT_group_menu"
         addon_keymaps.append((km, kmi))
+        kmi = km.keymap_items.new("object.search_subgroup", "U", "PRESS", alt=True, shift=True)
+        addon_keymaps.append((km, kmi))
 
 def unregister():
     for km, kmi in addon_keymaps:
         km.keymap_items.remove(kmi)
     addon_keymaps.clear()
 
+    remove_taxonomy_listener(on_taxonomy_changed)
+    if bpy.app.timers.is_registered(_sync_submenus_deferred):
+        bpy.app.timers.unregister(_sync_submenus_deferred)
     unregister_submenus()
     bpy.utils.unregister_class(PIE_MT_group_menu)
+    bpy.utils.unregister_class(OBJECT_OT_search_subgroup)
     bpy.utils.unregister_class(OBJECT_OT_rename_to_subgroup_pie)
     bpy.utils.unregister_class(OBJECT_OT_refresh_group_pie_menus)
 
@@ -0,0 +1,104 @@
+import bpy
+from bpy.types import Operator
+from bpy.props import BoolProperty
+from .taxonomy import get_taxonomy
+from .material_library import material_cache, get_material_library_paths
+from .profiling import timed, profiled_operator
+
+MATERIAL_TYPES = {'MESH', 'CURVE'}
+
+
+# --- Assignment
+def material_name_for(sub_group):
+    return sub_group.lower()
+
+
+def collect_material_targets(objects, matcher):
+    """Group objects with material slots by the material their sub-group names: {material: [objects]}."""
+    targets = {}
+    for obj in objects:
+        if obj.type not in MATERIAL_TYPES or obj.data is None:
+            continue
+        match = matcher.match(obj.name)
+        if match is not None:
+            targets.setdefault(material_name_for(match[1]), []).append(obj)
+    return targets
+
+
+def assign_materials(targets, blend_paths):
+    """
+    Link every needed material with at most one libraries.load per library
+    and assign it to each data block once. Data that already uses exactly
+    that material is left alone. Returns (assigned, skipped, missing) where
+    assigned maps material names to the number of data blocks changed.
+    """
+    with timed("materials.link", len(targets)):
+        linked = material_cache.link_from_libraries(blend_paths, list(targets))
+
+    assigned, skipped, missing = {}, 0, []
+    for material_name, objects in targets.items():
+        mat = linked.get(material_name)
+        if mat is None:
+            missing.append(material_name)
+            continue
+        changed = 0
+        for data in {obj.data for obj in objects}:
+            if len(data.materials) == 1 and data.materials[0] == mat:
+                skipped += 1
+                continue
+            data.materials.clear()
+            data.materials.append(mat)
+            changed += 1
+        if changed:
+            assigned[material_name] = changed
+    return assigned, skipped, missing
+
+
+# --- Operator
+class OBJECT_OT_assign_materials_by_name(Operator):
+    bl_idname = "object.assign_materials_by_name"
+    bl_label = "Assign Materials by Name"
+    bl_description = "Link and assign the material of each object's sub-group, for meshes and curves alike"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    selected_only: BoolProperty(
+        name="Selected Only",
+        description="Only objects in the selection instead of the whole scene",
+        default=True,
+    )
+
+    @profiled_operator("object.assign_materials_by_name")
+    def execute(self, context):
+        blend_paths = get_material_library_paths(context)
+        if not blend_paths:
+            self.report({'WARNING'}, "No material library set in the add-on preferences.")
+            return {'CANCELLED'}
+
+        objects = context.selected_objects if self.selected_only else context.scene.objects
+        targets = collect_material_targets(objects, get_taxonomy().matcher)
+        if not targets:
+            self.report({'WARNING'}, "No objects named after a sub-group.")
+            return {'CANCELLED'}
+
+        try:
+            assigned, skipped, missing = assign_materials(targets, blend_paths)
+        except Exception as e:
+            self.report({'ERROR'}, f"Material assignment error: {e}")
+            return {'CANCELLED'}
+
+        for material_name in missing:
+            print(f"Material '{material_name}' not found in any library")
+        message = f"Assigned {len(assigned)} material(s) to {sum(assigned.values())} data block(s), {skipped} already set"
+        if missing:
+            self.report({'WARNING'}, f"{message}; {len(missing)} missing (see console)")
+        else:
+            self.report({'INFO'}, f"{message}.")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(OBJECT_OT_assign_materials_by_name)
+
+
+def unregister():
+    bpy.utils.unregister_class(OBJECT_OT_assign_materials_by_name)
@@ -0,0 +1,132 @@
+"""
+SQLite catalog of the materials in a set of library .blend files.
+
+Each library file is listed once and remembered with its mtime and size;
+refresh() only re-lists files that changed since, so keeping the catalog
+current costs one stat per file. Finding which library holds a material
+is then an indexed query instead of opening every library.
+"""
+import os
+
+SCHEMA_VERSION = 1
+
+
+def library_files(sources):
+    """Expand files and directories (searched recursively) into .blend paths, keeping priority order."""
+    files = []
+    for source in sources:
+        if os.path.isdir(source):
+            for dirpath, dirnames, filenames in os.walk(source):
+                dirnames.sort()
+                files.extend(os.path.join(dirpath, f) for f in sorted(filenames) if f.lower().endswith(".blend"))
+        elif os.path.isfile(source):
+            files.append(source)
+        else:
+            print(f"Material library not found: {source}")
+    return list(dict.fromkeys(files))
+
+
+class MaterialCatalog:
+    """
+    Material name -> library file index stored at db_path (":memory:" keeps
+    it for the session only). list_materials(path) returns the material
+    names in one library file.
+    """
+
+    def __init__(self, db_path, list_materials):
+        self.db_path = db_path
+        self.list_materials = list_materials
+        self._db = None
+        self._known = None      # path -> (mtime, size), mirrors the files table
+
+    @property
+    def db(self):
+        if self._db is None:
+            import sqlite3
+
+            self._db = sqlite3.connect(self.db_path)
+            if self._db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._db.executescript(f"""
+                    DROP TABLE IF EXISTS materials;
+                    DROP TABLE IF EXISTS files;
+                    CREATE TABLE files (path TEXT PRIMARY KEY, mtime REAL NOT NULL, size INTEGER NOT NULL);
+                    CREATE TABLE materials (name TEXT NOT NULL, path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE);
+                    CREATE INDEX materials_name ON materials(name);
+                    CREATE INDEX materials_path ON materials(path);
+                    PRAGMA user_version = {SCHEMA_VERSION};
+                """)
+            self._db.execute("PRAGMA foreign_keys = ON")
+        return self._db
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self._known = None
+
+    def refresh(self, files):
+        """
+        Re-list every file whose mtime or size changed since it was last
+        listed. Returns the number of files listed; unreadable files are
+        reported and skipped.
+        """
+        if self._known is None:
+            self._known = {path: (mtime, size) for path, mtime, size in self.db.execute("SELECT path, mtime, size FROM files")}
+        known = self._known
+        listed = 0
+        with self.db:
+            for path in files:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if known.get(path) == (stat.st_mtime, stat.st_size):
+                    continue
+                try:
+                    names = self.list_materials(path)
+                except Exception as e:
+                    print(f"Could not list materials in {path}: {e}")
+                    continue
+                self.db.execute("DELETE FROM files WHERE path = ?", (path,))
+                self.db.execute("INSERT INTO files VALUES (?, ?, ?)", (path, stat.st_mtime, stat.st_size))
+                self.db.executemany("INSERT INTO materials VALUES (?, ?)", ((name, path) for name in set(names)))
+                known[path] = (stat.st_mtime, stat.st_size)
+                listed += 1
+        return listed
+
+    def forget(self, paths=None):
+        """Drop files from the catalog (all of them by default) so they are listed again."""
+        with self.db:
+            if paths is None:
+                self.db.execute("DELETE FROM files")
+            else:
+                self.db.executemany("DELETE FROM files WHERE path = ?", ((path,) for path in paths))
+        self._known = None
+
+    def prune(self):
+        """Drop files that no longer exist; returns how many."""
+        gone = [path for (path,) in self.db.execute("SELECT path FROM files") if not os.path.isfile(path)]
+        self.forget(gone)
+        return len(gone)
+
+    def names_in(self, path):
+        return frozenset(name for (name,) in self.db.execute("SELECT name FROM materials WHERE path = ?", (path,)))
+
+    def locate(self, names, files):
+        """{name: path} of the first file in files (priority order) holding each name."""
+        rank = {path: i for i, path in enumerate(files)}
+        names = list(dict.fromkeys(names))
+        found = {}
+        # Stay well under SQLite's bound parameter limit
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            query = f"SELECT name, path FROM materials WHERE name IN ({', '.join('?' * len(chunk))})"
+            for name, path in self.db.execute(query, chunk):
+                if path in rank and (name not in found or rank[path] < rank[found[name]]):
+                    found[name] = path
+        return found
+
+    def stats(self):
+        files = self.db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        materials = self.db.execute("SELECT COUNT(*) FROM materials").fetchone()[0]
+        return files, materials
@@ -0,0 +1,185 @@
+import os
+import time
+import bpy
+from bpy.types import Operator, PropertyGroup
+from bpy.props import IntProperty, StringProperty
+
+from .material_catalog import MaterialCatalog, library_files
+from .profiling import timed
+
+
+CATALOG_FILE = "material_catalog.sqlite"
+LIBRARY_CHECK_INTERVAL = 1.0    # seconds between re-walks of the library folders on access
+
+
+def list_library_materials(path):
+    """Material names in one library, read from the file itself when possible."""
+    from .blend_reader import read_id_names, BlendReadError
+
+    try:
+        with timed("materials.read_blend"):
+            return read_id_names(path, b"MA")
+    except BlendReadError as e:
+        # zstd without Python support, or a layout the reader doesn't know
+        print(f"Listing {path} through Blender: {e}")
+        with timed("materials.library_load"), bpy.data.libraries.load(path, link=True) as (data_from, data_to):
+            return list(data_from.materials)
+
+
+def get_catalog_path():
+    try:
+        config_dir = bpy.utils.user_resource('CONFIG', path=__package__, create=True)
+    except Exception:
+        config_dir = ""
+    return os.path.join(config_dir, CATALOG_FILE) if config_dir else ":memory:"
+
+
+# --- Material library index, persisted in a catalog keyed by file mtime and size
+class MaterialLibraryCache:
+    """
+    Knows which materials every library .blend (or directory of them)
+    holds, from a SQLite catalog that outlives the session. Libraries are
+    only re-listed when they change on disk, and linking opens just the
+    files that hold the wanted materials. The library folders are walked
+    and stat'ed at most once per LIBRARY_CHECK_INTERVAL.
+    """
+
+    def __init__(self):
+        self._catalog = None
+        self._files = {}        # resolved library paths -> (checked_at, .blend files)
+
+    @property
+    def catalog(self):
+        if self._catalog is None:
+            self._catalog = MaterialCatalog(get_catalog_path(), list_library_materials)
+        return self._catalog
+
+    @staticmethod
+    def resolve_path(blend_path):
+        return os.path.normpath(bpy.path.abspath(blend_path))
+
+    def library_files(self, blend_paths):
+        """Every library .blend in blend_paths (files or directories), in priority order."""
+        sources = tuple(self.resolve_path(path) for path in blend_paths)
+        now = time.monotonic()
+        cached = self._files.get(sources)
+        if cached is not None and now - cached[0] < LIBRARY_CHECK_INTERVAL:
+            return cached[1]
+
+        files = library_files(sources)
+        with timed("materials.catalog_refresh", len(files)):
+            self.catalog.refresh(files)
+        self._files[sources] = (now, files)
+        return files
+
+    def link_from_libraries(self, blend_paths, material_names):
+        """
+        Link each requested material from the first library (in priority
+        order) that has it, with one libraries.load per library that holds
+        any of them. Returns {name: Material or None}.
+        """
+        requested = list(dict.fromkeys(material_names))
+        found = {name: bpy.data.materials.get(name) for name in requested}
+        remaining = [name for name, mat in found.items() if mat is None]
+        if not remaining:
+            return found
+
+        by_file = {}
+        for name, path in self.catalog.locate(remaining, self.library_files(blend_paths)).items():
+            by_file.setdefault(path, []).append(name)
+
+        for path, names in by_file.items():
+            with timed("materials.library_load", len(names)), bpy.data.libraries.load(path, link=True) as (data_from, data_to):
+                # The catalog is only as fresh as the file's mtime; trust the library
+                available = set(data_from.materials)
+                wanted = [name for name in names if name in available]
+                data_to.materials = wanted
+            for name, mat in zip(wanted, data_to.materials):
+                found[name] = mat
+        return found
+
+    def rescan(self, blend_paths):
+        """Forget and re-list every library; returns (files, materials) in the catalog."""
+        self._files.clear()
+        self.catalog.prune()
+        files = library_files([self.resolve_path(path) for path in blend_paths])
+        self.catalog.forget(files)
+        self.catalog.refresh(files)
+        return self.catalog.stats()
+
+    def invalidate(self, blend_path=None):
+        self._files.clear()
+        self.catalog.forget(None if blend_path is None else [self.resolve_path(blend_path)])
+
+
+material_cache = MaterialLibraryCache()
+
+
+# --- Library list in the add-on preferences
+class MaterialLibraryPath(PropertyGroup):
+    path: StringProperty(
+        name="Library",
+        description="Extra .blend file, or directory of them, searched for materials after the ones above it",
+        subtype="FILE_PATH",
+    )
+
+
+def get_material_library_paths(context):
+    """Material libraries in priority order: the main one, then the extras."""
+    addon = context.preferences.addons.get(__package__)
+    if addon is None:
+        return []
+    prefs = addon.preferences
+    paths = [prefs.materials_blend_path, *(library.path for library in prefs.material_libraries)]
+    return [path for path in dict.fromkeys(paths) if path]
+
+
+class GROUPRENAMER_OT_AddMaterialLibrary(Operator):
+    bl_idname = "group_renamer.add_material_library"
+    bl_label = "Add Material Library"
+    bl_description = "Add a .blend file searched for materials after the ones above"
+
+    def execute(self, context):
+        context.preferences.addons[__package__].preferences.material_libraries.add()
+        return {'FINISHED'}
+
+
+class GROUPRENAMER_OT_RemoveMaterialLibrary(Operator):
+    bl_idname = "group_renamer.remove_material_library"
+    bl_label = "Remove Material Library"
+
+    index: IntProperty()
+
+    def execute(self, context):
+        context.preferences.addons[__package__].preferences.material_libraries.remove(self.index)
+        return {'FINISHED'}
+
+
+class GROUPRENAMER_OT_RescanMaterialLibraries(Operator):
+    bl_idname = "group_renamer.rescan_material_libraries"
+    bl_label = "Rescan Libraries"
+    bl_description = "List every material library again (changed files are picked up automatically)"
+
+    def execute(self, context):
+        files, materials = material_cache.rescan(get_material_library_paths(context))
+        self.report({'INFO'}, f"Material catalog: {materials} material(s) in {files} library file(s).")
+        return {'FINISHED'}
+
+
+# MaterialLibraryPath comes first: the add-on preferences hold a collection of it
+classes = (
+    MaterialLibraryPath,
+    GROUPRENAMER_OT_AddMaterialLibrary,
+    GROUPRENAMER_OT_RemoveMaterialLibrary,
+    GROUPRENAMER_OT_RescanMaterialLibraries,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,210 @@
+import bpy
+from bpy.types import Operator
+from bpy.props import BoolProperty, FloatProperty
+from .naming import COLLISION_SUFFIX
+from .profiling import timed, profiled_operator
+
+DEFAULT_TOLERANCE = 1e-5    # positions and UVs closer than this count as equal
+
+
+# --- Geometry hashing
+# Generic attribute data types: (foreach_get property, values per element, numpy dtype)
+ATTRIBUTE_LAYOUTS = {
+    'FLOAT': ("value", 1, "float32"),
+    'INT': ("value", 1, "int32"),
+    'INT8': ("value", 1, "int8"),
+    'BOOLEAN': ("value", 1, "bool"),
+    'FLOAT2': ("vector", 2, "float32"),
+    'INT32_2D': ("value", 2, "int32"),
+    'FLOAT_VECTOR': ("vector", 3, "float32"),
+    'FLOAT_COLOR': ("color", 4, "float32"),
+    'BYTE_COLOR': ("color", 4, "float32"),
+    'QUATERNION': ("value", 4, "float32"),
+}
+HASHED_ATTRIBUTES = {"position", "material_index"}     # read through vertices / polygons
+
+
+def generic_attributes(mesh):
+    """
+    Attributes geometry_hash reads generically: colors, sharp_face, creases
+    and the like. Positions, material indices and UV maps are hashed on
+    their own; dot-prefixed internals (selection, topology) are skipped.
+    """
+    uv_names = {layer.name for layer in mesh.uv_layers}
+    return sorted(
+        (attr for attr in getattr(mesh, "attributes", ())
+         if not attr.name.startswith(".") and attr.name not in HASHED_ATTRIBUTES and attr.name not in uv_names),
+        key=lambda attr: attr.name,
+    )
+
+
+def can_share(mesh):
+    """
+    Linked, shape-keyed or custom-normal meshes, and meshes with attribute
+    types the hash can't read, carry more than geometry; leave them alone.
+    Deform weights are checked by the caller, from the objects' vertex groups.
+    """
+    if mesh.library is not None or mesh.shape_keys is not None or getattr(mesh, "has_custom_normals", False):
+        return False
+    return all(attr.data_type in ATTRIBUTE_LAYOUTS for attr in generic_attributes(mesh))
+
+
+def layout_key(mesh):
+    """Cheap key: only meshes that agree on every count can be identical."""
+    return (
+        len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons),
+        tuple(layer.name for layer in mesh.uv_layers),
+        tuple((attr.name, attr.domain, attr.data_type) for attr in generic_attributes(mesh)),
+        tuple(mat.name if mat else "" for mat in mesh.materials),
+    )
+
+
+def read_array(collection, attribute, count, width, dtype, np):
+    values = np.empty(count * width, dtype=dtype)
+    if count:
+        collection.foreach_get(attribute, values)
+    return values
+
+
+def quantize(values, tolerance, np):
+    return np.round(values / tolerance).astype(np.int64)
+
+
+def geometry_hash(mesh, tolerance, np):
+    """
+    Digest of positions, topology, material indices, seams, UVs and generic
+    attributes, read in bulk with foreach_get. Float values are snapped to a
+    tolerance grid first, so float noise from export round-trips doesn't
+    keep copies apart. Returns (digest, bytes of geometry read) where the
+    size estimates what a copy costs.
+    """
+    import hashlib
+
+    floats = [quantize(read_array(mesh.vertices, "co", len(mesh.vertices), 3, np.float32, np), tolerance, np)]
+    floats += [quantize(read_array(layer.data, "uv", len(mesh.loops), 2, np.float32, np), tolerance, np)
+               for layer in mesh.uv_layers]
+    arrays = [
+        read_array(mesh.edges, "vertices", len(mesh.edges), 2, np.int32, np),
+        read_array(mesh.edges, "use_seam", len(mesh.edges), 1, bool, np),
+        read_array(mesh.loops, "vertex_index", len(mesh.loops), 1, np.int32, np),
+        read_array(mesh.polygons, "loop_total", len(mesh.polygons), 1, np.int32, np),
+        read_array(mesh.polygons, "material_index", len(mesh.polygons), 1, np.int32, np),
+    ]
+    for attr in generic_attributes(mesh):
+        prop, width, dtype = ATTRIBUTE_LAYOUTS[attr.data_type]
+        values = read_array(attr.data, prop, len(attr.data), width, dtype, np)
+        if dtype == "float32":
+            floats.append(quantize(values, tolerance, np))
+        else:
+            arrays.append(values)
+
+    digest = hashlib.blake2b(digest_size=20)
+    size = 0
+    for array in floats + arrays:
+        digest.update(array.tobytes())
+        size += array.nbytes
+    # Quantized ints are twice the width of the float32 data Blender stores
+    size -= sum(array.nbytes for array in floats) // 2
+    return digest.digest(), size
+
+
+def find_duplicate_meshes(meshes, tolerance=DEFAULT_TOLERANCE):
+    """
+    Group meshes with identical geometry: [(keeper, [copies], bytes per copy)].
+    Only meshes sharing a layout_key are hashed. The keeper is the plainest
+    name, so Button wins over Button.001.
+    """
+    import numpy as np
+
+    by_layout = {}
+    for mesh in meshes:
+        if can_share(mesh):
+            by_layout.setdefault(layout_key(mesh), []).append(mesh)
+
+    groups = []
+    for candidates in by_layout.values():
+        if len(candidates) < 2:
+            continue
+        by_hash = {}
+        for mesh in candidates:
+            digest, size = geometry_hash(mesh, tolerance, np)
+            by_hash.setdefault(digest, (size, []))[1].append(mesh)
+        for size, same in by_hash.values():
+            if len(same) > 1:
+                same.sort(key=lambda mesh: (bool(COLLISION_SUFFIX.search(mesh.name)), len(mesh.name), mesh.name))
+                groups.append((same[0], same[1:], size))
+    return groups
+
+
+def share_identical_meshes(objects, tolerance=DEFAULT_TOLERANCE):
+    """
+    Point every copy of a mesh used by objects at one shared data block and
+    delete the copies. Returns (meshes removed, approximate bytes saved).
+    Meshes with vertex groups are skipped: their deform weights aren't
+    hashed, and merging would silently drop one copy's weights.
+    """
+    # Vertex groups live on the mesh (Blender 3.0+), so every user sees the same ones
+    meshes = list({obj.data for obj in objects if obj.type == 'MESH' and obj.data is not None and not obj.vertex_groups})
+    with timed("dedupe.hash", len(meshes)):
+        groups = find_duplicate_meshes(meshes, tolerance)
+
+    removed = saved = 0
+    with timed("dedupe.remap", sum(len(copies) for keeper, copies, size in groups)):
+        for keeper, copies, size in groups:
+            for mesh in copies:
+                # Remaps every user in the file, not only the given objects
+                mesh.user_remap(keeper)
+                bpy.data.meshes.remove(mesh)
+                removed += 1
+                saved += size
+    return removed, saved
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+# --- Operator
+class OBJECT_OT_share_identical_meshes(Operator):
+    bl_idname = "object.share_identical_meshes"
+    bl_label = "Share Identical Meshes"
+    bl_description = "Turn copies of the same geometry into linked instances of one mesh"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    selected_only: BoolProperty(
+        name="Selected Only",
+        description="Only meshes used by selected objects instead of the whole scene",
+        default=True,
+    )
+    tolerance: FloatProperty(
+        name="Tolerance",
+        description="Positions and UVs closer than this are treated as equal",
+        default=DEFAULT_TOLERANCE, min=1e-8, max=0.01, precision=6,
+    )
+
+    @profiled_operator("object.share_identical_meshes")
+    def execute(self, context):
+        objects = context.selected_objects if self.selected_only else context.scene.objects
+        try:
+            removed, saved = share_identical_meshes(objects, self.tolerance)
+        except Exception as e:
+            self.report({'ERROR'}, f"Sharing meshes failed: {e}")
+            return {'CANCELLED'}
+
+        if not removed:
+            self.report({'INFO'}, "No identical meshes found.")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Shared {removed} duplicate mesh(es), about {format_bytes(saved)} saved.")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(OBJECT_OT_share_identical_meshes)
+
+
+def unregister():
+    bpy.utils.unregister_class(OBJECT_OT_share_identical_meshes)
@@ -0,0 +1,117 @@
+import bpy
+from bpy.types import Operator
+from bpy.props import EnumProperty, FloatProperty
+from .taxonomy import get_taxonomy
+from .naming import COLLISION_SUFFIX, SIDE_SUFFIXES, strip_side
+from .rename_service import rename_pairs, report_rename_results
+from .auto_classify import read_part_bounds
+from .symmetry import AXES, mirror_plane, find_mirror_pairs
+from .profiling import timed, profiled_operator
+
+DEFAULT_TOLERANCE = 0.001
+
+
+# --- Pairing and naming
+def pair_subgroup(pair, matcher):
+    """Sub-group named by either side, trusting a name without a .001 suffix first."""
+    for obj in sorted(pair, key=lambda o: bool(COLLISION_SUFFIX.search(o.name))):
+        match = matcher.match(strip_side(obj.name))
+        if match is not None:
+            return match[1]
+    return None
+
+
+def name_mirrored_pairs(objects, axis='X', tolerance=DEFAULT_TOLERANCE, sides=SIDE_SUFFIXES[0], plane=None):
+    """
+    Pair mirrored meshes across axis and rename each pair to its sub-group
+    with the left and right suffix. plane defaults to the middle of the
+    parts' extent. Returns (rename results, pairs found, pairs left unnamed
+    because neither side matches a sub-group).
+    """
+    meshes = [obj for obj in objects if obj.type == 'MESH' and obj.data is not None and len(obj.data.vertices)]
+    if len(meshes) < 2:
+        return [], 0, 0
+
+    with timed("mirror.read", len(meshes)):
+        mins, maxs, centroids = read_part_bounds(meshes)
+    axis_index = AXES[axis]
+    if plane is None:
+        plane = mirror_plane(mins, maxs, axis_index)
+    with timed("mirror.pair", len(meshes)):
+        pairs, centered = find_mirror_pairs((mins + maxs) / 2, maxs - mins, axis_index, plane, tolerance)
+
+    matcher = get_taxonomy().matcher
+    by_subgroup = {}
+    unnamed = 0
+    for i, j in pairs:
+        pair = (meshes[i], meshes[j])
+        sub_group = pair_subgroup(pair, matcher)
+        if sub_group is None:
+            unnamed += 1
+        else:
+            by_subgroup.setdefault(sub_group, []).append(pair)
+
+    results = []
+    for sub_group, sub_pairs in by_subgroup.items():
+        sub_pairs.sort(key=lambda pair: pair[0].name)
+        results.extend(rename_pairs(sub_pairs, sub_group, sides))
+    return results, len(pairs), unnamed
+
+
+# --- Operator
+class OBJECT_OT_name_mirrored_pairs(Operator):
+    bl_idname = "object.name_mirrored_pairs"
+    bl_label = "Name Mirrored Pairs"
+    bl_description = "Find left/right copies among selected meshes and name them <sub-group>_L / <sub-group>_R"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    axis: EnumProperty(
+        name="Mirror Axis",
+        items=[(axis, axis, f"Mirror across the {axis} axis") for axis in AXES],
+        default='X',
+    )
+    center: EnumProperty(
+        name="Mirror Plane",
+        items=[
+            ('SELECTION', "Selection Center", "Middle of the selected parts along the axis"),
+            ('ORIGIN', "World Origin", "The plane through the world origin"),
+        ],
+        default='SELECTION',
+    )
+    sides: EnumProperty(
+        name="Suffixes",
+        items=[(left + right, f"{left} / {right}", "") for left, right in SIDE_SUFFIXES],
+    )
+    tolerance: FloatProperty(
+        name="Tolerance",
+        description="How far a mirrored part may sit from its counterpart and still pair",
+        default=DEFAULT_TOLERANCE, min=0.0, soft_max=0.1, precision=4, unit='LENGTH',
+    )
+
+    @profiled_operator("object.name_mirrored_pairs")
+    def execute(self, context):
+        sides = next(pair for pair in SIDE_SUFFIXES if "".join(pair) == self.sides)
+        plane = 0.0 if self.center == 'ORIGIN' else None
+        try:
+            results, pairs, unnamed = name_mirrored_pairs(context.selected_objects, self.axis, self.tolerance, sides, plane)
+        except Exception as e:
+            self.report({'ERROR'}, f"Mirror naming failed: {e}")
+            return {'CANCELLED'}
+
+        if not pairs:
+            self.report({'WARNING'}, "No mirrored pairs found in the selection.")
+            return {'CANCELLED'}
+        message = f"Named {len(results) // 2} mirrored pair(s)"
+        if unnamed:
+            report_rename_results(self, results, None, f"{message}; {unnamed} pair(s) match no sub-group, name one side first.", 'WARNING')
+        else:
+            report_rename_results(self, results, None, f"{message} (see console for details).")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(OBJECT_OT_name_mirrored_pairs)
+
+
+def unregister():
+    bpy.utils.unregister_class(OBJECT_OT_name_mirrored_pairs)
@@ -0,0 +1,103 @@
+import bpy
+
+from .naming import get_suffix
+
+
+# --- Registry of used object / curve-data names
+class NameRegistry:
+    """
+    Used object and curve-data names, so a free name can be checked without
+    scanning bpy.data. Built once per file and then kept up to date as
+    curves are renamed; entries whose ID was renamed or deleted behind our
+    back are detected and dropped lazily. Names taken behind our back are
+    only learnt through adopt() after a rename collides.
+    """
+
+    def __init__(self):
+        self._holders = {}
+        self._pending = set()
+        self._built = False
+
+    def reset(self):
+        self._holders.clear()
+        self._pending.clear()
+        self._built = False
+
+    def sync(self):
+        if self._built:
+            return
+        for obj in bpy.data.objects:
+            self._add(obj.name, obj)
+        for curve in bpy.data.curves:
+            self._add(curve.name, curve)
+        self._built = True
+
+    def _add(self, name, id_block):
+        holders = self._holders.setdefault(name, [])
+        if id_block not in holders:
+            holders.append(id_block)
+
+    @staticmethod
+    def _still_named(id_block, name):
+        try:
+            return id_block.name == name
+        except ReferenceError:
+            return False
+
+    def is_used(self, name):
+        holders = self._holders.get(name)
+        if not holders:
+            return False
+        holders[:] = [h for h in holders if self._still_named(h, name)]
+        if not holders:
+            del self._holders[name]
+            return False
+        return True
+
+    def __contains__(self, name):
+        """Used or allocated, so the registry can serve as a planner's taken names."""
+        return name in self._pending or self.is_used(name)
+
+    def claim(self, name, *id_blocks):
+        self._pending.discard(name)
+        for id_block in id_blocks:
+            self._add(name, id_block)
+
+    def release(self, name, *id_blocks):
+        holders = self._holders.get(name)
+        if holders is None:
+            return
+        holders[:] = [h for h in holders if h not in id_blocks]
+        if not holders:
+            del self._holders[name]
+
+    def adopt(self, name):
+        """Record whichever IDs really hold name (after an unexpected collision)."""
+        for id_block in (bpy.data.objects.get(name), bpy.data.curves.get(name)):
+            if id_block is not None:
+                self._add(name, id_block)
+
+    def allocate(self, base, count=1):
+        """Reserve and return the `count` lowest free ordinal names for base."""
+        index = 0
+        names = []
+        while len(names) < count:
+            name = f"{base}{get_suffix(index)}"
+            if name not in self:
+                names.append(name)
+                self._pending.add(name)
+            index += 1
+        return names
+
+
+name_registry = NameRegistry()
+
+
+def get_name_registry():
+    name_registry.sync()
+    return name_registry
+
+
+@bpy.app.handlers.persistent
+def reset_name_registry(*args):
+    name_registry.reset()
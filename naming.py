@@ -0,0 +1,115 @@
+import re
+
+# --- Ordinal suffixes
+SUFFIXES = [
+    "", "_second", "_third", "_fourth", "_fifth",
+    "_sixth", "_seventh", "_eighth", "_ninth", "_tenth"
+]
+_SUFFIX_INDEX = {suffix: i for i, suffix in enumerate(SUFFIXES) if suffix}
+_NUMERIC_SUFFIX = re.compile(r"_(\d+)(st|nd|rd|th)$")
+_ORDINAL_ENDINGS = {1: "st", 2: "nd", 3: "rd"}
+COLLISION_SUFFIX = re.compile(r"\.\d{3,}$")    # Blender's Name.001 on a name clash
+
+
+def ordinal(number):
+    if 10 <= number % 100 <= 20:
+        return f"{number}th"
+    return f"{number}{_ORDINAL_ENDINGS.get(number % 10, 'th')}"
+
+
+def get_suffix(index):
+    if index < len(SUFFIXES):
+        return SUFFIXES[index]
+    else:
+        return f"_{ordinal(index + 1)}"
+
+
+def parse_suffix(name):
+    """Split a name produced with get_suffix() back into (base, index)."""
+    head, sep, tail = name.rpartition("_")
+    if sep and f"_{tail}" in _SUFFIX_INDEX:
+        return head, _SUFFIX_INDEX[f"_{tail}"]
+
+    match = _NUMERIC_SUFFIX.search(name)
+    if match:
+        index = int(match.group(1)) - 1
+        if index >= len(SUFFIXES) and get_suffix(index) == match.group(0):
+            return name[:match.start()], index
+
+    return name, 0
+
+
+def ordinal_order(base):
+    """
+    Sort key putting names already numbered under base first, by ordinal
+    (Welt_curve, Welt_curve_second, Welt_curve_fourth), then the rest by name.
+    """
+    def key(obj):
+        head, index = parse_suffix(obj.name)
+        return (0, index, "") if head == base else (1, 0, obj.name)
+    return key
+
+
+# --- Numbered names
+def numbered_name(base_name, index):
+    """Base name for the first target, then Base_02, Base_03, ..."""
+    return base_name if index == 0 else f"{base_name}_{index + 1:02d}"
+
+
+def numbered_index(base_name, name):
+    """Index numbered_name() gives name under base_name, or None if name isn't one of them."""
+    if name == base_name:
+        return 0
+    head, sep, tail = name.rpartition("_")
+    if head == base_name and tail.isdigit():
+        index = int(tail) - 1
+        if index > 0 and numbered_name(base_name, index) == name:
+            return index
+    return None
+
+
+def allocate_names(base_name, count, taken):
+    """Return `count` deterministic names for base_name that are not in taken."""
+    names = []
+    index = 0
+    while len(names) < count:
+        candidate = numbered_name(base_name, index)
+        if candidate not in taken:
+            names.append(candidate)
+        index += 1
+    return names
+
+
+# --- Mirror sides
+# (left, right) suffix pairs; the first is the default. Every pair is
+# recognised when renaming and bundling, whichever one named the object.
+SIDE_SUFFIXES = (("_L", "_R"), (".L", ".R"), ("_Left", "_Right"))
+_SIDE = re.compile(
+    "^(.*?)(" + "|".join(re.escape(side) for pair in SIDE_SUFFIXES for side in pair) + r")((?:_\d{2,})?(?:\.\d{3,})?)$"
+)
+
+
+def split_side(name):
+    """Split Arm_Outside_L_02 into ("Arm_Outside", "_L"); the side is "" when there is none."""
+    match = _SIDE.match(name)
+    if match is None:
+        return name, ""
+    return match.group(1), match.group(2)
+
+
+def strip_side(name):
+    """The name without its side suffix (numbering and collision suffixes are kept)."""
+    match = _SIDE.match(name)
+    return name if match is None else match.group(1) + match.group(3)
+
+
+def allocate_pair_names(left_base, right_base, count, taken):
+    """Names for count mirrored pairs that share their number on both sides."""
+    pairs = []
+    index = 0
+    while len(pairs) < count:
+        left, right = numbered_name(left_base, index), numbered_name(right_base, index)
+        if left not in taken and right not in taken:
+            pairs.append((left, right))
+        index += 1
+    return pairs
@@ -0,0 +1,90 @@
+"""
+Geometry heuristics that suggest a sub-group for unnamed parts.
+
+Works on world-space bounds and centroids of every part as NumPy arrays,
+relative to the whole assembly, so each rule is one vectorised comparison
+over all parts at once. No bpy here: auto_classify.py reads the geometry.
+"""
+import numpy as np
+
+# Rules are tried in order, the first one matching a part wins. Features are
+# fractions of the assembly: low/high/z are heights (0 floor, 1 top), y runs
+# front (0, -Y) to rear (1), side is 0 at the centre and 1 at the outer edge,
+# size_* are extents.
+RULES = (
+    ("Legs_Group", "Wood_Legs", "Lowest part, small footprint",
+     lambda f: (f["high"] < 0.3) & (f["size_x"] < 0.3) & (f["size_y"] < 0.3)),
+    ("Headrest_Group", "Headrest_Top", "Above the rest of the assembly",
+     lambda f: f["low"] > 0.8),
+    ("Back_Group", "Back_Outside", "Tall, thin slab at the rear",
+     lambda f: (f["y"] > 0.8) & (f["size_z"] > 0.35) & (f["size_y"] < 0.3)),
+    ("Arm_Group", "Arm_Outside", "Upright panel on the outer side",
+     lambda f: (f["side"] > 0.75) & (f["size_x"] < 0.25) & (f["size_z"] > 0.25)),
+    ("Frame_Group", "Wood_Frame", "Spans the whole footprint",
+     lambda f: (f["size_x"] > 0.85) & (f["size_y"] > 0.85) & (f["high"] < 0.6)),
+    ("Cushion_Group", "Back_Cushion", "Upright, in front of the back",
+     lambda f: (f["y"] > 0.5) & (f["z"] > 0.45) & (f["size_z"] > 0.2) & (f["size_y"] < 0.4)),
+    ("Cushion_Group", "Seat_Cushion", "Flat, at seat height",
+     lambda f: (f["z"] > 0.2) & (f["z"] < 0.6) & (f["size_z"] < 0.3) & (f["size_x"] > 0.25) & (f["size_y"] > 0.3)),
+    ("Front_Group", "Front", "Wide panel at the front",
+     lambda f: (f["y"] < 0.2) & (f["size_x"] > 0.5) & (f["size_y"] < 0.3)),
+)
+
+
+def part_features(mins, maxs, centroids):
+    """Per-part features relative to the assembly bounds, as (N,) arrays."""
+    lo = mins.min(axis=0)
+    span = np.maximum(maxs.max(axis=0) - lo, 1e-9)
+
+    size = (maxs - mins) / span
+    rel_min = (mins - lo) / span
+    rel_max = (maxs - lo) / span
+    rel_centre = (centroids - lo) / span
+    return {
+        "size_x": size[:, 0],
+        "size_y": size[:, 1],
+        "size_z": size[:, 2],
+        "low": rel_min[:, 2],
+        "high": rel_max[:, 2],
+        "z": rel_centre[:, 2],
+        "y": rel_centre[:, 1],
+        "side": np.abs(rel_centre[:, 0] - 0.5) * 2.0,
+    }
+
+
+def resolve_rule(group, sub, groups):
+    """Map a rule onto the active taxonomy, or None if it has no such group."""
+    subs = groups.get(group, ())
+    if sub in subs:
+        return group, sub
+    if subs:
+        return group, subs[0]
+    return None
+
+
+def suggest_subgroups(mins, maxs, centroids, groups, rules=RULES):
+    """
+    Return one suggestion per part: (group, sub_group, reason) or None.
+    mins, maxs and centroids are (N, 3) world-space arrays.
+    """
+    mins = np.asarray(mins, dtype=np.float64).reshape(-1, 3)
+    if not len(mins):
+        return []
+    features = part_features(
+        mins,
+        np.asarray(maxs, dtype=np.float64).reshape(-1, 3),
+        np.asarray(centroids, dtype=np.float64).reshape(-1, 3),
+    )
+
+    choice = np.full(len(mins), -1)
+    for index, rule in enumerate(rules):
+        choice[(choice < 0) & rule[3](features)] = index
+
+    resolved = [resolve_rule(group, sub, groups) for group, sub, reason, test in rules]
+    suggestions = []
+    for index in choice.tolist():
+        if index < 0 or resolved[index] is None:
+            suggestions.append(None)
+        else:
+            suggestions.append((*resolved[index], rules[index][2]))
+    return suggestions
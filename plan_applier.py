@@ -0,0 +1,136 @@
+import bpy
+from mathutils import Matrix
+
+from .planner import ObjectSnapshot, SceneSnapshot
+
+
+# --- Data-block helpers
+def ensure_collection(name, color_tag=None):
+    if name in bpy.data.collections:
+        col = bpy.data.collections[name]
+    else:
+        col = bpy.data.collections.new(name)
+        bpy.context.scene.collection.children.link(col)
+
+    if color_tag and col.color_tag != color_tag:
+        col.color_tag = color_tag
+
+    return col
+
+
+def ensure_empty(name):
+    if name in bpy.data.objects:
+        obj = bpy.data.objects[name]
+    else:
+        obj = bpy.data.objects.new(name, None)
+        bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def find_collection(name):
+    """Collection by name, including the scenes' master collections."""
+    col = bpy.data.collections.get(name)
+    if col is None:
+        for scene in bpy.data.scenes:
+            if scene.collection.name == name:
+                return scene.collection
+    return col
+
+
+# --- Snapshots
+def snapshot_object(obj):
+    return ObjectSnapshot(
+        obj.name,
+        obj.type,
+        obj.parent.name if obj.parent else None,
+        tuple(col.name for col in obj.users_collection),
+        obj.data.name if obj.data is not None else None,
+    )
+
+
+def snapshot_scene(objects, extra_names=()):
+    """Snapshot objects plus any existing objects named in extra_names."""
+    snaps = [snapshot_object(obj) for obj in objects]
+    for name in extra_names:
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            snaps.append(snapshot_object(obj))
+    return SceneSnapshot(snaps, (col.name for col in bpy.data.collections))
+
+
+# --- Applying
+def reparent_keep_transforms(pairs):
+    """
+    Parent (obj, parent) pairs in one pass without moving anything in world
+    space. World matrices are read before any parent changes, and the
+    correction inverse(new_parent_world) @ old_parent_world is computed once
+    per (old parent, new parent) pair, so thousands of children under a few
+    group empties cost a handful of matrix inversions.
+    """
+    identity = Matrix.Identity(4)
+    worlds = {}
+
+    def world(obj):
+        if obj is None:
+            return identity
+        key = obj.as_pointer()
+        if key not in worlds:
+            worlds[key] = obj.matrix_world.copy()
+        return worlds[key]
+
+    corrections = {}
+    staged = []
+    for obj, parent in pairs:
+        old_parent = obj.parent
+        key = (old_parent.as_pointer() if old_parent else 0, parent.as_pointer() if parent else 0)
+        if key not in corrections:
+            old_world = world(old_parent)
+            new_world = world(parent)
+            corrections[key] = None if old_world == new_world else new_world.inverted_safe() @ old_world
+        staged.append((obj, parent, corrections[key]))
+
+    for obj, parent, correction in staged:
+        obj.parent = parent
+        if correction is not None:
+            obj.matrix_parent_inverse = correction @ obj.matrix_parent_inverse
+
+
+def apply_plan(plan):
+    """
+    Execute a Plan in one batched pass: ensure collections and empties,
+    rename, unlink, link, then parent. Objects and collections are resolved
+    once up front, so renames never invalidate later steps and no step
+    looks anything up by name per object.
+    """
+    names = {entry[0] for entries in (plan.renames, plan.unlinks, plan.links, plan.parents) for entry in entries}
+    names.update(parent for child, parent in plan.parents)
+    objects = {name: bpy.data.objects.get(name) for name in names}
+
+    collections = {name: ensure_collection(name, color) for name, color in plan.collections}
+    for name in {col for entries in (plan.unlinks, plan.links) for obj_name, col in entries}:
+        if name not in collections:
+            collections[name] = find_collection(name)
+    for name in plan.create_empties:
+        objects[name] = bpy.data.objects.new(name, None)
+
+    # Two-phase rename so targets never collide with each other mid-batch
+    planned = {new for old, new in plan.renames}
+    for old, new in plan.renames:
+        obj = objects[old]
+        if obj.name in planned and obj.name != new:
+            obj.name = f"{new}__tmp"
+        if obj.data is not None and obj.data.name in planned and obj.data.name != new:
+            obj.data.name = f"{new}__tmp"
+    for old, new in plan.renames:
+        obj = objects[old]
+        obj.name = new
+        if obj.data is not None:
+            obj.data.name = new
+
+    for obj_name, col_name in plan.unlinks:
+        collections[col_name].objects.unlink(objects[obj_name])
+
+    for obj_name, col_name in plan.links:
+        collections[col_name].objects.link(objects[obj_name])
+
+    reparent_keep_transforms([(objects[child], objects[parent]) for child, parent in plan.parents])
@@ -0,0 +1,179 @@
+"""
+Pure-Python planning for bundling and curve renaming.
+
+The planner only sees lightweight snapshots (names, types, parents and
+collection names) and returns a Plan made of plain data, so scenes can be
+previewed, diffed and validated without Blender. plan_applier.py turns a
+Plan into bpy changes in one batched pass.
+"""
+from collections import namedtuple
+
+from .naming import get_suffix, ordinal_order, strip_side
+
+EXPORT_COLLECTION = ("EXPORT", 'COLOR_04')
+ORPHAN_COLLECTION = ("ORPHAN", 'COLOR_01')
+CURVES_EMPTY = "Curves_Group"
+ROOT_EMPTY = "PLACEHOLDER"
+BUNDLED_TYPES = {'MESH', 'CURVE'}
+
+ObjectSnapshot = namedtuple("ObjectSnapshot", ("name", "type", "parent", "collections", "data_name"))
+
+
+class SceneSnapshot:
+    """The part of a scene the planner reads, keyed by object name."""
+
+    def __init__(self, objects, collections=()):
+        self.objects = {snap.name: snap for snap in objects}
+        self.collections = frozenset(collections)
+
+    def get(self, name):
+        return self.objects.get(name)
+
+
+class Plan:
+    """Every change a bundle/rename needs, expressed as names only."""
+
+    def __init__(self):
+        self.collections = []       # (name, color_tag) to ensure
+        self.create_empties = []    # empty object names to create
+        self.renames = []           # (old_name, new_name), object and data
+        self.unlinks = []           # (object_name, collection_name)
+        self.links = []             # (object_name, collection_name)
+        self.parents = []           # (object_name, parent_name)
+        self.groups = {}            # group -> [object names]
+        self.curves = []            # curve object names bundled under Curves_Group
+        self.orphans = []           # object names sent to ORPHAN
+
+    def is_empty(self):
+        return not (self.create_empties or self.renames or self.unlinks or self.links or self.parents)
+
+    def to_dict(self):
+        return {
+            "collections": [list(c) for c in self.collections],
+            "create_empties": list(self.create_empties),
+            "renames": [list(r) for r in self.renames],
+            "unlinks": [list(u) for u in self.unlinks],
+            "links": [list(l) for l in self.links],
+            "parents": [list(p) for p in self.parents],
+            "groups": {g: list(names) for g, names in self.groups.items()},
+            "curves": list(self.curves),
+            "orphans": list(self.orphans),
+        }
+
+    def summary_lines(self, limit=20):
+        lines = [
+            f"{sum(len(n) for n in self.groups.values())} grouped, {len(self.curves)} curves, {len(self.orphans)} orphaned",
+            f"{len(self.create_empties)} empties to create, {len(self.renames)} renames, "
+            f"{len(self.links)} links, {len(self.unlinks)} unlinks, {len(self.parents)} parent changes",
+        ]
+        for group, names in self.groups.items():
+            lines.append(f"{group}: {len(names)}")
+        for name in self.orphans[:limit]:
+            lines.append(f"ORPHAN  {name}")
+        if len(self.orphans) > limit:
+            lines.append(f"... and {len(self.orphans) - limit} more orphans")
+        for old, new in self.renames[:limit]:
+            lines.append(f"RENAME  {old} -> {new}")
+        return lines
+
+
+# --- Bundling
+def plan_bundle(scene, names, matcher):
+    """
+    Plan the EXPORT/ORPHAN bundle for the named objects. Only differences
+    from the snapshot end up in the plan, so an already bundled scene
+    yields an (almost) empty plan.
+    """
+    candidates = [scene.get(n) for n in names]
+    candidates = [snap for snap in candidates if snap is not None and snap.type in BUNDLED_TYPES]
+    if not candidates:
+        raise RuntimeError("No supported objects selected.")
+
+    plan = Plan()
+    plan.collections = [EXPORT_COLLECTION, ORPHAN_COLLECTION]
+    export_col = EXPORT_COLLECTION[0]
+    orphan_col = ORPHAN_COLLECTION[0]
+    created = {}
+
+    def current(name):
+        return created.get(name) or scene.get(name)
+
+    def ensure_empty(name):
+        if current(name) is None:
+            plan.create_empties.append(name)
+            created[name] = ObjectSnapshot(name, 'EMPTY', None, (), None)
+
+    def place(name, collection):
+        collections = current(name).collections
+        for col in collections:
+            if col != collection:
+                plan.unlinks.append((name, col))
+        if collection not in collections:
+            plan.links.append((name, collection))
+
+    def parent_to(name, parent):
+        if name != parent and current(name).parent != parent:
+            plan.parents.append((name, parent))
+
+    ensure_empty(CURVES_EMPTY)
+    ensure_empty(ROOT_EMPTY)
+    place(CURVES_EMPTY, export_col)
+    place(ROOT_EMPTY, export_col)
+
+    for snap in candidates:
+        # Sides are placement, not part of the sub-group: Arm_Top_L is an Arm_Top
+        match = matcher.match(strip_side(snap.name))
+
+        if "curve" in snap.name.lower():
+            if match:
+                place(snap.name, export_col)
+                parent_to(snap.name, CURVES_EMPTY)
+                plan.curves.append(snap.name)
+            else:
+                place(snap.name, orphan_col)
+                plan.orphans.append(snap.name)
+            continue
+
+        if match:
+            group = match[0]
+            if group not in plan.groups:
+                plan.groups[group] = []
+                ensure_empty(group)
+                place(group, export_col)
+                parent_to(group, ROOT_EMPTY)
+            place(snap.name, export_col)
+            parent_to(snap.name, group)
+            plan.groups[group].append(snap.name)
+        else:
+            place(snap.name, orphan_col)
+            plan.orphans.append(snap.name)
+
+    parent_to(CURVES_EMPTY, ROOT_EMPTY)
+    return plan
+
+
+def bundle_empty_names(groups):
+    """Every empty a bundle may create or reuse, for snapshotting."""
+    return [CURVES_EMPTY, ROOT_EMPTY, *groups]
+
+
+# --- Curve renaming
+def plan_curve_renames(curves, base_name, taken, plan=None):
+    """
+    Plan <base_name>_curve<ordinal> names for curve snapshots, taking the
+    lowest ordinals not in taken (names used by anything else). Curves
+    already numbered under the base keep their relative order.
+    """
+    if plan is None:
+        plan = Plan()
+
+    base = f"{base_name}_curve"
+    index = 0
+    for snap in sorted(curves, key=ordinal_order(base)):
+        while f"{base}{get_suffix(index)}" in taken:
+            index += 1
+        new_name = f"{base}{get_suffix(index)}"
+        index += 1
+        if new_name != snap.name or new_name != snap.data_name:
+            plan.renames.append((snap.name, new_name))
+    return plan
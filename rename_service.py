@@ -0,0 +1,128 @@
+import bpy
+
+from .naming import allocate_names, allocate_pair_names, numbered_index, split_side
+from .profiling import timed
+
+
+# --- Geometry (only touched on request)
+def rebuild_mesh(mesh):
+    """Round-trip a mesh through BMesh, rewriting its geometry in place."""
+    import bmesh
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.to_mesh(mesh)
+    bm.free()
+
+
+# --- Rename service shared by the panel and pie operators
+def get_rename_targets(context, batch):
+    if batch:
+        return [obj for obj in context.selected_objects if obj.type == 'MESH' and obj.data is not None]
+    obj = context.active_object
+    if obj is not None and obj.type == 'MESH' and obj.data is not None:
+        return [obj]
+    return []
+
+def taken_names(targets):
+    """Object and mesh names held by anything but targets and their data."""
+    target_set = set(targets)
+    target_data = {obj.data for obj in targets if obj.data is not None}
+    taken = {obj.name for obj in bpy.data.objects if obj not in target_set}
+    taken.update(mesh.name for mesh in bpy.data.meshes if mesh not in target_data)
+    return taken
+
+def apply_names(targets, new_names, rebuild=False):
+    """
+    Rename each target object and its data block to the planned name.
+    Returns a list of (old_name, new_name) tuples.
+    """
+    planned = set(new_names)
+    old_names = [obj.name for obj in targets]
+
+    # Move targets and their data off names another target is about to
+    # take, so Blender never falls back to its own .001 suffixes mid-batch.
+    moved_data = set()
+    for obj, new_name in zip(targets, new_names):
+        if obj.name in planned and obj.name != new_name:
+            obj.name = f"{new_name}__tmp"
+        data = obj.data
+        if data is not None and data not in moved_data:
+            moved_data.add(data)
+            if data.name in planned and data.name != new_name:
+                data.name = f"{new_name}__tmp"
+
+    results = []
+    renamed_data = set()
+    with timed("rename.apply", len(targets)):
+        for obj, old_name, new_name in zip(targets, old_names, new_names):
+            data = obj.data
+
+            if rebuild and obj.type == 'MESH':
+                with timed("rename.rebuild_mesh"):
+                    rebuild_mesh(data)
+
+            obj.name = new_name
+            if data is not None and data not in renamed_data:
+                data.name = new_name
+                renamed_data.add(data)
+            results.append((old_name, obj.name))
+
+    return results
+
+def rename_objects(objects, base_name, rebuild=False):
+    """
+    Rename every object and its data block to base_name with collision-aware
+    numbering. Objects already holding one of base_name's numbered names
+    keep it, so renaming again changes nothing; the rest fill the free
+    numbers in name order. Objects named for a mirror side (Arm_Outside_L)
+    keep that side unless base_name has one of its own. Geometry is left
+    untouched unless rebuild is True. Returns a list of (old_name, new_name)
+    tuples.
+    """
+    targets = sorted(objects, key=lambda o: o.name)
+    keep_sides = not split_side(base_name)[1]
+
+    by_side = {}
+    for obj in targets:
+        side = split_side(obj.name)[1] if keep_sides else ""
+        by_side.setdefault(side, []).append(obj)
+
+    with timed("rename.allocate", len(targets)):
+        taken = taken_names(targets)
+        ordered, new_names = [], []
+        for side, objs in by_side.items():
+            side_base = f"{base_name}{side}"
+            rest = []
+            for obj in objs:
+                if obj.name not in taken and numbered_index(side_base, obj.name) is not None:
+                    ordered.append(obj)
+                    new_names.append(obj.name)
+                    taken.add(obj.name)
+                else:
+                    rest.append(obj)
+            ordered.extend(rest)
+            new_names.extend(allocate_names(side_base, len(rest), taken))
+
+    return apply_names(ordered, new_names, rebuild)
+
+def rename_pairs(pairs, base_name, sides, rebuild=False):
+    """
+    Rename (left, right) object pairs to base_name plus the left and right
+    suffix in sides, numbered alike on both sides (Leg_L_02 mirrors Leg_R_02).
+    """
+    left_suffix, right_suffix = sides
+    targets = [obj for pair in pairs for obj in pair]
+    with timed("rename.allocate", len(targets)):
+        names = allocate_pair_names(f"{base_name}{left_suffix}", f"{base_name}{right_suffix}", len(pairs), taken_names(targets))
+    return apply_names(targets, [name for pair in names for name in pair], rebuild)
+
+def report_rename_results(operator, results, base_name, summary=None, level='INFO'):
+    """Print every rename to the console and report summary (or a default one) at level."""
+    for old_name, new_name in results:
+        print(f"Renamed '{old_name}' -> '{new_name}'")
+    if summary is not None:
+        operator.report({level}, summary)
+    elif len(results) == 1:
+        operator.report({'INFO'}, f"Renamed object and mesh to {results[0][1]}")
+    else:
+        operator.report({'INFO'}, f"Renamed {len(results)} objects to '{base_name}' (see console for details)")
@@ -0,0 +1,322 @@
+import time
+
+import bpy
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import CollectionProperty, EnumProperty, IntProperty, PointerProperty, StringProperty
+from .taxonomy import get_taxonomy
+from .planner import EXPORT_COLLECTION, ORPHAN_COLLECTION, BUNDLED_TYPES
+from .naming import COLLISION_SUFFIX
+from .group_index import select_objects
+from .profiling import profiled_operator
+
+SLICE_SECONDS = 0.015       # audit work per timer tick, keeps the UI at ~60 fps
+TICK_SECONDS = 0.01
+MAX_LISTED = 1000           # issues shown in the list; counts and bulk select cover all
+
+ISSUES = (
+    ('UNMATCHED', "No Sub-Group", "Name matches no sub-group", 'QUESTION'),
+    ('SUFFIX', "Collision Suffix", "Blender added a .001-style suffix", 'DUPLICATE'),
+    ('DATA_NAME', "Data Mismatch", "Object and data names differ", 'UNLINKED'),
+    ('MULTI_GROUP', "Several Groups", "Name fits more than one group", 'ERROR'),
+    ('OUTSIDE', "Not Bundled", "Not in the EXPORT or ORPHAN collection", 'OUTLINER_COLLECTION'),
+)
+ISSUE_ICONS = {code: icon for code, name, description, icon in ISSUES}
+
+
+# --- Checks
+def audit_object(obj, taxonomy, bundle_collections):
+    """Return [(code, message)] for one object."""
+    issues = []
+    name = obj.name
+    if COLLISION_SUFFIX.search(name):
+        issues.append(('SUFFIX', "Collision suffix"))
+    if obj.type not in BUNDLED_TYPES:
+        return issues
+
+    matches = taxonomy.matcher.match_all(name)
+    if not matches:
+        issues.append(('UNMATCHED', "Matches no sub-group"))
+    else:
+        group, sub = matches[0]
+        groups = set(taxonomy.subgroup_groups.get(sub, (group,)))
+        # Matches inside the best one (Welt in Seat_Cushion_Welt) aren't rivals
+        groups.update(g for g, s in matches[1:] if s.lower() not in sub.lower())
+        if len(groups) > 1:
+            labels = ", ".join(taxonomy.labels.get(g, g) for g in sorted(groups))
+            issues.append(('MULTI_GROUP', f"Fits {labels}"))
+
+    data = obj.data
+    if data is not None and data.users == 1 and data.name != name:
+        issues.append(('DATA_NAME', f"Data is named '{data.name}'"))
+
+    if not any(col.name in bundle_collections for col in obj.users_collection):
+        issues.append(('OUTSIDE', "Not in EXPORT or ORPHAN"))
+    return issues
+
+
+def audit_data(data):
+    if COLLISION_SUFFIX.search(data.name):
+        return [('SUFFIX', "Collision suffix on data")]
+    return []
+
+
+class SceneAudit:
+    """
+    Resumable audit over objects, meshes and curves. step() works for a
+    bounded slice of time, so a modal operator can spread a 100k-object
+    scene over many timer ticks.
+    """
+
+    def __init__(self, taxonomy):
+        self.taxonomy = taxonomy
+        self.bundle_collections = {EXPORT_COLLECTION[0], ORPHAN_COLLECTION[0]}
+        self.queue = [('OBJECT', obj) for obj in bpy.data.objects]
+        self.queue += [('MESH', mesh) for mesh in bpy.data.meshes]
+        self.queue += [('CURVE', curve) for curve in bpy.data.curves]
+        self.position = 0
+        self.issues = []        # (kind, name, code, message)
+        self.counts = dict.fromkeys(ISSUE_ICONS, 0)
+
+    @property
+    def done(self):
+        return self.position >= len(self.queue)
+
+    @property
+    def progress(self):
+        return self.position / len(self.queue) if self.queue else 1.0
+
+    def step(self, seconds=SLICE_SECONDS):
+        deadline = time.perf_counter() + seconds
+        queue = self.queue
+        while self.position < len(queue):
+            kind, id_block = queue[self.position]
+            self.position += 1
+            try:
+                if kind == 'OBJECT':
+                    found = audit_object(id_block, self.taxonomy, self.bundle_collections)
+                else:
+                    found = audit_data(id_block)
+                name = id_block.name
+            except ReferenceError:
+                continue    # removed while the audit was running
+            for code, message in found:
+                self.issues.append((kind, name, code, message))
+                self.counts[code] += 1
+            # Checking the clock every item would cost more than the checks
+            if not self.position % 64 and time.perf_counter() > deadline:
+                break
+        return self.done
+
+
+# --- Results (full list kept here; the UI list shows the first MAX_LISTED)
+_audit = {"current": None, "results": [], "counts": {}, "cancelled": False}
+
+
+def objects_for_issues(issues):
+    """Objects behind (kind, name, ...) issues; data issues resolve to their users."""
+    wanted_objects = {name for kind, name, *rest in issues if kind == 'OBJECT'}
+    wanted_data = {(kind, name) for kind, name, *rest in issues if kind != 'OBJECT'}
+    found = []
+    for obj in bpy.data.objects:
+        if obj.name in wanted_objects or (obj.data is not None and (obj.type, obj.data.name) in wanted_data):
+            found.append(obj)
+    return found
+
+
+def select_clicked_issue(self, context):
+    if 0 <= self.index < len(self.issues):
+        item = self.issues[self.index]
+        select_objects(context, objects_for_issues([(item.kind, item.name)]))
+
+
+class AuditIssue(PropertyGroup):
+    kind: StringProperty()
+    name: StringProperty()
+    code: StringProperty()
+    message: StringProperty()
+
+
+class AuditProps(PropertyGroup):
+    issues: CollectionProperty(type=AuditIssue)
+    index: IntProperty(update=select_clicked_issue)
+
+
+class GROUPRENAMER_UL_audit(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(text=item.name, icon=ISSUE_ICONS.get(item.code, 'DOT'))
+        row.label(text=item.message)
+
+
+# --- Operators
+class OBJECT_OT_audit_scene(Operator):
+    bl_idname = "object.audit_scene"
+    bl_label = "Audit Scene Names"
+    bl_description = "Check every object, mesh and curve against the naming scheme (Esc to stop)"
+
+    _timer = None
+
+    def invoke(self, context, event):
+        if _audit["current"] is not None:
+            self.report({'WARNING'}, "An audit is already running.")
+            return {'CANCELLED'}
+
+        _audit["current"] = SceneAudit(get_taxonomy())
+        _audit["cancelled"] = False
+        wm = context.window_manager
+        wm.progress_begin(0, 100)
+        self._timer = wm.event_timer_add(TICK_SECONDS, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            _audit["cancelled"] = True
+            return self.finish(context)
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        audit = _audit["current"]
+        done = None
+        try:
+            done = audit.step()
+        finally:
+            if done is None:
+                # step() raised: don't leave the timer and progress bar behind
+                _audit["cancelled"] = True
+                self.cleanup(context)
+        context.window_manager.progress_update(int(audit.progress * 100))
+        tag_redraw(context)
+        if done:
+            return self.finish(context)
+        return {'RUNNING_MODAL'}
+
+    def cancel(self, context):
+        # Blender ending the modal (file load, window closed)
+        _audit["cancelled"] = True
+        self.cleanup(context)
+
+    @profiled_operator("object.audit_scene")
+    def execute(self, context):
+        # Blocking run, for scripts and the redo panel
+        _audit["current"] = audit = SceneAudit(get_taxonomy())
+        _audit["cancelled"] = False
+        audit.step(float("inf"))
+        store_results(context, audit)
+        self.report({'INFO'}, summary_text())
+        return {'FINISHED'}
+
+    def cleanup(self, context):
+        """Stop the timer and progress bar and keep what was found; safe to call twice."""
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+            wm.progress_end()
+        if _audit["current"] is not None:
+            store_results(context, _audit["current"])
+        tag_redraw(context)
+
+    def finish(self, context):
+        self.cleanup(context)
+        self.report({'WARNING'} if _audit["cancelled"] else {'INFO'}, summary_text())
+        return {'CANCELLED'} if _audit["cancelled"] else {'FINISHED'}
+
+
+def store_results(context, audit):
+    _audit["current"] = None
+    _audit["results"] = audit.issues
+    _audit["counts"] = audit.counts
+    if context.scene is None:
+        return
+
+    props = context.scene.audit_props
+    props.issues.clear()
+    for kind, name, code, message in audit.issues[:MAX_LISTED]:
+        item = props.issues.add()
+        item.kind, item.name, item.code, item.message = kind, name, code, message
+
+
+def summary_text():
+    total = len(_audit["results"])
+    state = "Audit stopped early" if _audit["cancelled"] else "Audit complete"
+    return f"{state}: {total} issue(s) found." if total else f"{state}: no issues."
+
+
+def tag_redraw(context):
+    for area in context.screen.areas if context.screen else ():
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
+
+
+class OBJECT_OT_select_audit_issues(Operator):
+    bl_idname = "object.select_audit_issues"
+    bl_label = "Select Offending Objects"
+    bl_description = "Select every object flagged by the last audit (optionally one kind of issue)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    code: EnumProperty(items=[('ALL', "All", "")] + [(code, name, description) for code, name, description, icon in ISSUES])
+
+    def execute(self, context):
+        issues = [issue for issue in _audit["results"] if self.code == 'ALL' or issue[2] == self.code]
+        selected = select_objects(context, objects_for_issues(issues))
+        self.report({'INFO'}, f"Selected {len(selected)} object(s).")
+        return {'FINISHED'}
+
+
+# --- Panel
+class VIEW3D_PT_scene_audit(Panel):
+    bl_label = "Audit"
+    bl_idname = "VIEW3D_PT_scene_audit"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Rename"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        running = _audit["current"]
+        if running is not None:
+            layout.label(text=f"Auditing... {running.progress * 100:.0f}% (Esc to stop)", icon="TIME")
+            return
+
+        layout.operator("object.audit_scene", icon="VIEWZOOM")
+        if not _audit["results"]:
+            return
+
+        col = layout.column(align=True)
+        for code, name, description, icon in ISSUES:
+            count = _audit["counts"].get(code, 0)
+            if count:
+                row = col.row(align=True)
+                row.label(text=f"{name}: {count}", icon=icon)
+                row.operator("object.select_audit_issues", text="", icon="RESTRICT_SELECT_OFF").code = code
+
+        props = context.scene.audit_props
+        layout.template_list("GROUPRENAMER_UL_audit", "", props, "issues", props, "index", rows=8)
+        if len(_audit["results"]) > MAX_LISTED:
+            layout.label(text=f"Showing first {MAX_LISTED} of {len(_audit['results'])}", icon="INFO")
+        layout.operator("object.select_audit_issues", text="Select All Flagged").code = 'ALL'
+
+
+classes = (
+    AuditIssue,
+    AuditProps,
+    GROUPRENAMER_UL_audit,
+    OBJECT_OT_audit_scene,
+    OBJECT_OT_select_audit_issues,
+    VIEW3D_PT_scene_audit,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.audit_props = PointerProperty(type=AuditProps)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.audit_props
+    _audit["current"] = None
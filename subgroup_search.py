@@ -0,0 +1,123 @@
+"""
+Type-ahead index over every sub-group of a taxonomy.
+
+Built once per taxonomy: a sorted word list answers prefix queries with a
+bisect, and a trigram index narrows substring queries to a few posting
+sets, so a keystroke never scans the whole taxonomy unless the query is
+fuzzy enough to need it.
+"""
+from bisect import bisect_left
+
+
+def normalize(text):
+    return text.lower().replace("_", " ").strip()
+
+
+def trigrams(text):
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def is_subsequence(needle, haystack):
+    chars = iter(haystack)
+    return all(char in chars for char in needle)
+
+
+class SubgroupIndex:
+    """Prefix, substring and fuzzy (subsequence) search over sub-groups."""
+
+    def __init__(self, groups):
+        owners = {}
+        for group, subs in groups.items():
+            for sub in subs:
+                owners.setdefault(sub, []).append(group)
+
+        self.names = list(owners)
+        self.groups = [tuple(owners[name]) for name in self.names]
+        self.keys = [normalize(name) for name in self.names]
+        self._order = {name: i for i, name in enumerate(self.names)}
+
+        words = set()
+        for i, key in enumerate(self.keys):
+            words.add((key, i))
+            words.update((word, i) for word in key.split())
+        self._words = sorted(words)
+        self._word_keys = [word for word, i in self._words]
+
+        self._grams = {}
+        for i, key in enumerate(self.keys):
+            for gram in trigrams(key):
+                self._grams.setdefault(gram, set()).add(i)
+
+    def _prefixed(self, token):
+        ids = set()
+        start = bisect_left(self._word_keys, token)
+        for word, i in self._words[start:]:
+            if not word.startswith(token):
+                break
+            ids.add(i)
+        return ids
+
+    def _containing(self, token):
+        grams = trigrams(token)
+        # Trigrams of the padded token include word boundaries it doesn't
+        # have inside a longer key, so only interior grams are required
+        grams = {gram for gram in grams if " " not in gram} or grams
+        postings = sorted((self._grams.get(gram, set()) for gram in grams), key=len)
+        ids = set(postings[0]) if postings else set()
+        for posting in postings[1:]:
+            ids &= posting
+        return {i for i in ids if token in self.keys[i]}
+
+    def _candidates(self, token):
+        ids = self._prefixed(token)
+        if len(token) >= 3:
+            ids |= self._containing(token)
+        # Only a query the index can't place (an abbreviation or typo) pays
+        # for the fuzzy scan over every key
+        return ids or range(len(self.keys))
+
+    @staticmethod
+    def _token_score(token, key):
+        if key.startswith(token):
+            return 4
+        if f" {token}" in f" {key}":
+            return 3
+        if token in key:
+            return 2
+        if is_subsequence(token, key.replace(" ", "")):
+            return 1
+        return 0
+
+    def search(self, query, limit=50, recent=()):
+        """
+        Return up to limit sub-group names for query, best first. Names in
+        recent (most recent first) rank above equally good matches; an
+        empty query returns the recent names followed by everything else.
+        """
+        recent_rank = {name: len(recent) - i for i, name in enumerate(recent) if name in self._order}
+        tokens = normalize(query).split()
+        if not tokens:
+            ordered = sorted(recent_rank, key=recent_rank.get, reverse=True)
+            ordered += [name for name in self.names if name not in recent_rank]
+            return ordered[:limit]
+
+        scored = []
+        for i in self._candidates(tokens[0]):
+            key = self.keys[i]
+            score = 0
+            for token in tokens:
+                token_score = self._token_score(token, key)
+                if not token_score:
+                    break
+                score += token_score
+            else:
+                name = self.names[i]
+                scored.append((-score, -recent_rank.get(name, 0), len(key), i))
+
+        scored.sort()
+        return [self.names[entry[3]] for entry in scored[:limit]]
+
+    def groups_of(self, name):
+        index = self._order.get(name)
+        return self.groups[index] if index is not None else ()
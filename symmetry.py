@@ -0,0 +1,56 @@
+"""
+Mirror pairing of parts from their world-space bounding boxes.
+
+Parts are reduced to (N, 3) box centres and sizes by the caller. Each part
+on the left of the mirror plane is reflected across it and looked up in a
+KD-tree of the right-hand parts, so pairing costs O(n log n) instead of
+comparing every pair. Boxes must agree in size as well as position, which
+keeps a cushion from pairing with the panel behind it.
+"""
+AXES = {'X': 0, 'Y': 1, 'Z': 2}
+
+
+def mirror_plane(mins, maxs, axis):
+    """Mid-point of the parts' overall extent along axis."""
+    return float((mins[:, axis].min() + maxs[:, axis].max()) / 2)
+
+
+def find_mirror_pairs(centers, sizes, axis, plane, tolerance):
+    """
+    Return (pairs, centered) where pairs are (left, right) part indices and
+    centered the indices of parts straddling the plane. Left is the +axis
+    side, Blender's .L convention for a model facing -Y. Each part pairs at
+    most once, closest matches first.
+    """
+    import numpy as np
+    from mathutils.kdtree import KDTree
+
+    offsets = centers[:, axis] - plane
+    left = np.flatnonzero(offsets > tolerance)
+    right = np.flatnonzero(offsets < -tolerance)
+    centered = np.flatnonzero(np.abs(offsets) <= tolerance).tolist()
+    if not len(left) or not len(right):
+        return [], centered
+
+    tree = KDTree(len(right))
+    for slot, co in enumerate(centers[right].tolist()):
+        tree.insert(co, slot)
+    tree.balance()
+
+    mirrored = centers[left].copy()
+    mirrored[:, axis] = 2 * plane - mirrored[:, axis]
+
+    candidates = []
+    for i, co in zip(left.tolist(), mirrored.tolist()):
+        for found_co, slot, distance in tree.find_range(co, tolerance):
+            j = int(right[slot])
+            if np.abs(sizes[i] - sizes[j]).max() <= tolerance:
+                candidates.append((distance, i, j))
+
+    candidates.sort()
+    pairs, used = [], set()
+    for distance, i, j in candidates:
+        if i not in used and j not in used:
+            used.update((i, j))
+            pairs.append((i, j))
+    return pairs, centered
@@ -0,0 +1,352 @@
+import os
+import time
+from types import MappingProxyType
+
+import bpy
+
+from .group_data import GROUPS
+from .group_matcher import SubgroupMatcher
+from .subgroup_search import SubgroupIndex
+
+RELOAD_CHECK_INTERVAL = 1.0     # seconds between mtime checks on access
+RELOAD_POLL_INTERVAL = 2.0      # seconds between background hot-reload polls
+DEFAULT_PROFILE = "Default"
+CACHE_FORMAT = 1                # bump when Taxonomy's pickled state changes
+CACHE_KEEP = 8                  # compiled files kept in the cache directory
+
+
+# --- Compiled taxonomy
+def make_label(name):
+    return name.replace("_", " ")
+
+
+class Taxonomy:
+    """
+    Immutable, compiled view of a group -> sub-groups mapping. Every derived
+    structure the UI and bundler need is built once here, so draw callbacks
+    and per-object loops never rebuild strings.
+    """
+
+    __slots__ = (
+        "groups", "_version", "source",
+        "group_items", "subgroup_items", "labels",
+        "lower_lookup", "subgroup_groups", "_matcher", "_search_index",
+    )
+
+    def __init__(self, groups, source=""):
+        groups = {str(g): tuple(str(s) for s in subs) for g, subs in groups.items()}
+
+        self.groups = MappingProxyType(groups)
+        self._version = None
+        self.source = source
+
+        labels = {}
+        subgroup_groups = {}
+        for group, subs in groups.items():
+            labels[group] = make_label(group)
+            for sub in subs:
+                labels[sub] = make_label(sub)
+                subgroup_groups.setdefault(sub, []).append(group)
+
+        self.labels = MappingProxyType(labels)
+        self.group_items = tuple((g, labels[g], "") for g in groups)
+        self.subgroup_items = MappingProxyType({
+            g: tuple((s, labels[s], "") for s in subs) for g, subs in groups.items()
+        })
+        self.lower_lookup = MappingProxyType({
+            name.lower(): name for name in reversed(list(labels))
+        })
+        self.subgroup_groups = MappingProxyType({s: tuple(gs) for s, gs in subgroup_groups.items()})
+        self._matcher = None
+        self._search_index = None
+
+    @property
+    def version(self):
+        """Short content hash, computed on first use (keeps hashlib off the load path)."""
+        if self._version is None:
+            import hashlib
+            import json
+            canonical = json.dumps(list(self.groups.items()), separators=(",", ":"))
+            self._version = hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+        return self._version
+
+    @property
+    def matcher(self):
+        if self._matcher is None:
+            self._matcher = SubgroupMatcher(self.groups, version=self.version)
+        return self._matcher
+
+    @property
+    def search_index(self):
+        if self._search_index is None:
+            self._search_index = SubgroupIndex(self.groups)
+        return self._search_index
+
+    def __getstate__(self):
+        # Everything derived goes along, so a cached profile never recompiles
+        return {
+            "groups": dict(self.groups),
+            "version": self.version,
+            "source": self.source,
+            "labels": dict(self.labels),
+            "group_items": self.group_items,
+            "subgroup_items": dict(self.subgroup_items),
+            "lower_lookup": dict(self.lower_lookup),
+            "subgroup_groups": dict(self.subgroup_groups),
+            "matcher": self.matcher,
+            "search_index": self.search_index,
+        }
+
+    def __setstate__(self, state):
+        self.groups = MappingProxyType(state["groups"])
+        self._version = state["version"]
+        self.source = state["source"]
+        self.labels = MappingProxyType(state["labels"])
+        self.group_items = state["group_items"]
+        self.subgroup_items = MappingProxyType(state["subgroup_items"])
+        self.lower_lookup = MappingProxyType(state["lower_lookup"])
+        self.subgroup_groups = MappingProxyType(state["subgroup_groups"])
+        self._matcher = state["matcher"]
+        self._search_index = state["search_index"]
+
+    def subgroups(self, group):
+        return self.groups.get(group, ())
+
+    def group_of(self, sub_group):
+        """First group (in taxonomy order) that lists sub_group, or None."""
+        groups = self.subgroup_groups.get(sub_group)
+        return groups[0] if groups else None
+
+
+# --- Loading
+def parse_taxonomy(data):
+    """
+    Accept either {"Group": ["Sub", ...], ...} or {"groups": {...}} and
+    return a plain dict, raising ValueError on anything malformed.
+    """
+    if isinstance(data, dict) and isinstance(data.get("groups"), dict):
+        data = data["groups"]
+    if not isinstance(data, dict) or not data:
+        raise ValueError("Taxonomy must be a non-empty mapping of group -> sub-groups")
+
+    groups = {}
+    for group, subs in data.items():
+        if not isinstance(subs, (list, tuple)) or not all(isinstance(s, str) and s.strip() for s in subs):
+            raise ValueError(f"Group '{group}' must be a list of non-empty sub-group names")
+        groups[str(group).strip()] = [s.strip() for s in subs]
+    return groups
+
+
+def parse_profiles(data):
+    """
+    Accept {"profiles": {"Sofa": <taxonomy>, "Chair": <taxonomy>}} or a
+    single taxonomy (which becomes the Default profile) and return
+    {profile: groups}.
+    """
+    if isinstance(data, dict) and isinstance(data.get("profiles"), dict):
+        profiles = data["profiles"]
+        if not profiles:
+            raise ValueError("'profiles' must name at least one taxonomy")
+        parsed = {}
+        for name, taxonomy in profiles.items():
+            try:
+                parsed[str(name).strip()] = parse_taxonomy(taxonomy)
+            except ValueError as e:
+                raise ValueError(f"Profile '{name}': {e}") from None
+        return parsed
+    return {DEFAULT_PROFILE: parse_taxonomy(data)}
+
+
+def read_taxonomy_data(path, raw):
+    if path.lower().endswith(".toml"):
+        import tomllib
+        return tomllib.loads(raw.decode("utf-8"))
+    import json
+    return json.loads(raw)
+
+
+def get_cache_dir():
+    try:
+        return bpy.utils.user_resource('CONFIG', path=os.path.join(__package__, "taxonomy_cache"), create=True)
+    except Exception:
+        return ""
+
+
+def load_profiles_file(path, cache_dir=None):
+    """
+    Load every profile in a .json or .toml file as {name: Taxonomy}. The
+    compiled profiles are pickled under cache_dir keyed by a hash of the
+    file's bytes, so an unchanged file never recompiles.
+    """
+    import hashlib
+    import pickle
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+
+    key = hashlib.sha1(raw + f"|{CACHE_FORMAT}|{os.path.splitext(path)[1].lower()}".encode()).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{key}.pickle") if cache_dir else ""
+    if cache_path and os.path.isfile(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable taxonomy cache {cache_path}: {e}")
+
+    profiles = {
+        name: Taxonomy(groups, source=f"{path}:{name}")
+        for name, groups in parse_profiles(read_taxonomy_data(path, raw)).items()
+    }
+    if cache_path:
+        tmp_path = cache_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(profiles, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            prune_cache(cache_dir)
+        except OSError as e:
+            print(f"Failed to write taxonomy cache: {e}")
+    return profiles
+
+
+def prune_cache(cache_dir, keep=CACHE_KEEP):
+    """Drop all but the most recently written compiled taxonomies."""
+    entries = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith(".pickle")]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for path in entries[keep:]:
+        os.remove(path)
+
+
+def load_taxonomy_file(path, profile=None):
+    """Load one profile (the first one when profile is missing) from a taxonomy file."""
+    profiles = load_profiles_file(path)
+    return profiles.get(profile) or next(iter(profiles.values()))
+
+
+# --- Profiles with hot reload
+_builtin = Taxonomy(GROUPS, source="group_data")
+_state = {
+    "profiles": {DEFAULT_PROFILE: _builtin},
+    "taxonomy": _builtin,
+    "key": None,
+    "checked_at": 0.0,
+}
+_listeners = []
+
+
+def get_taxonomy_path():
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon is None:
+        return ""
+    path = addon.preferences.taxonomy_path
+    return os.path.normpath(bpy.path.abspath(path)) if path else ""
+
+
+def get_scene_profile(scene=None):
+    if scene is None:
+        scene = getattr(bpy.context, "scene", None)
+    if scene is None:
+        return ""
+    props = getattr(scene, "rename_props", None)
+    if props is not None:
+        return props.profile
+    # Add-on loaded without registering (batch workers): read the stored value
+    stored = scene.get("rename_props")
+    return stored.get("profile", "") if stored is not None else ""
+
+
+def add_taxonomy_listener(callback):
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def remove_taxonomy_listener(callback):
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def _set_taxonomy(taxonomy):
+    previous = _state["taxonomy"]
+    _state["taxonomy"] = taxonomy
+    if taxonomy.version != previous.version:
+        for callback in list(_listeners):
+            try:
+                callback(taxonomy)
+            except Exception as e:
+                print(f"Taxonomy listener failed: {e}")
+
+
+def get_profiles():
+    """
+    Return {profile: Taxonomy}. The built-in taxonomy is the Default
+    profile; the configured file adds profiles or, with a single taxonomy,
+    replaces Default. The file is re-checked at most once per
+    RELOAD_CHECK_INTERVAL and reloaded only when its path or mtime changed.
+    """
+    now = time.monotonic()
+    if now - _state["checked_at"] < RELOAD_CHECK_INTERVAL:
+        return _state["profiles"]
+    _state["checked_at"] = now
+
+    path = get_taxonomy_path()
+    try:
+        key = (path, os.path.getmtime(path)) if path else None
+    except OSError:
+        key = (path, None)
+
+    if key == _state["key"]:
+        return _state["profiles"]
+    _state["key"] = key
+
+    if key is None:
+        _state["profiles"] = {DEFAULT_PROFILE: _builtin}
+    elif key[1] is None:
+        print(f"Taxonomy file not found: {path}, keeping current taxonomy.")
+    else:
+        try:
+            _state["profiles"] = {DEFAULT_PROFILE: _builtin, **load_profiles_file(path)}
+            print(f"Loaded taxonomy profiles from {path}: {', '.join(_state['profiles'])}")
+        except Exception as e:
+            print(f"Failed to load taxonomy from {path}: {e}")
+
+    return _state["profiles"]
+
+
+def get_taxonomy(profile=None):
+    """
+    Return a compiled taxonomy: the named profile, or the active scene's
+    profile when profile is None. Unknown names fall back to Default.
+    Switching the active scene's profile notifies the taxonomy listeners.
+    """
+    profiles = get_profiles()
+    if profile is not None:
+        return profiles.get(profile) or profiles[DEFAULT_PROFILE]
+
+    taxonomy = profiles.get(get_scene_profile()) or profiles[DEFAULT_PROFILE]
+    if taxonomy is not _state["taxonomy"]:
+        _set_taxonomy(taxonomy)
+    return taxonomy
+
+
+def invalidate_taxonomy(*args):
+    _state["checked_at"] = 0.0
+    _state["key"] = None
+
+
+def _poll_taxonomy():
+    get_taxonomy()
+    return RELOAD_POLL_INTERVAL
+
+
+def register():
+    invalidate_taxonomy()
+    if not bpy.app.timers.is_registered(_poll_taxonomy):
+        bpy.app.timers.register(_poll_taxonomy, first_interval=RELOAD_POLL_INTERVAL, persistent=True)
+
+
+def unregister():
+    if bpy.app.timers.is_registered(_poll_taxonomy):
+        bpy.app.timers.unregister(_poll_taxonomy)
+    _listeners.clear()
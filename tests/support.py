@@ -0,0 +1,22 @@
+"""
+Import the add-on's bpy-free modules outside Blender.
+
+The package __init__ imports bpy, so modules are loaded as submodules of a
+bare stand-in package pointing at the add-on folder; their relative imports
+resolve as usual without running __init__.py.
+"""
+import importlib
+import os
+import sys
+import types
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "group_renamer"
+
+
+def load_module(name):
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{name}")
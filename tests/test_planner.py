@@ -0,0 +1,109 @@
+import unittest
+
+from support import load_module
+
+planner = load_module("planner")
+SubgroupMatcher = load_module("group_matcher").SubgroupMatcher
+ObjectSnapshot = planner.ObjectSnapshot
+
+GROUPS = {
+    "Seat": ["Seat_Cushion", "Seat_Welt"],
+    "Arm": ["Arm_Top"],
+}
+EXPORT = planner.EXPORT_COLLECTION[0]
+ORPHAN = planner.ORPHAN_COLLECTION[0]
+
+
+def snap(name, kind='MESH', parent=None, collections=("Collection",), data_name=None):
+    return ObjectSnapshot(name, kind, parent, tuple(collections), data_name or name)
+
+
+def curves(*names):
+    return [snap(name, 'CURVE') for name in names]
+
+
+class PlanBundleTest(unittest.TestCase):
+    def setUp(self):
+        self.matcher = SubgroupMatcher(GROUPS)
+
+    def plan(self, objects, names=None):
+        scene = planner.SceneSnapshot(objects, ["Collection"])
+        return planner.plan_bundle(scene, names or [obj.name for obj in objects], self.matcher)
+
+    def test_groups_curves_and_orphans(self):
+        plan = self.plan([
+            snap("Seat_Cushion"),
+            snap("Arm_Top_L"),
+            snap("Seat_Welt_curve", 'CURVE'),
+            snap("Stray_curve", 'CURVE'),
+            snap("Lamp"),
+        ])
+
+        self.assertEqual(plan.groups, {"Seat": ["Seat_Cushion"], "Arm": ["Arm_Top_L"]})
+        self.assertEqual(plan.curves, ["Seat_Welt_curve"])
+        self.assertEqual(plan.orphans, ["Stray_curve", "Lamp"])
+        self.assertEqual(plan.create_empties, [planner.CURVES_EMPTY, planner.ROOT_EMPTY, "Seat", "Arm"])
+        self.assertIn(("Seat_Cushion", "Seat"), plan.parents)
+        self.assertIn(("Arm_Top_L", "Arm"), plan.parents)
+        self.assertIn(("Seat_Welt_curve", planner.CURVES_EMPTY), plan.parents)
+        self.assertIn(("Seat", planner.ROOT_EMPTY), plan.parents)
+        self.assertIn(("Lamp", "Collection"), plan.unlinks)
+        self.assertIn(("Lamp", ORPHAN), plan.links)
+        self.assertIn(("Seat_Cushion", EXPORT), plan.links)
+
+    def test_bundled_scene_plans_nothing(self):
+        export = (EXPORT,)
+        objects = [
+            snap(planner.CURVES_EMPTY, 'EMPTY', planner.ROOT_EMPTY, export),
+            snap(planner.ROOT_EMPTY, 'EMPTY', None, export),
+            snap("Seat", 'EMPTY', planner.ROOT_EMPTY, export),
+            snap("Seat_Cushion", parent="Seat", collections=export),
+            snap("Seat_Welt_curve", 'CURVE', planner.CURVES_EMPTY, export),
+            snap("Lamp", collections=(ORPHAN,)),
+        ]
+        plan = self.plan(objects, ["Seat_Cushion", "Seat_Welt_curve", "Lamp"])
+
+        self.assertTrue(plan.is_empty(), plan.to_dict())
+        self.assertEqual(plan.groups, {"Seat": ["Seat_Cushion"]})
+
+    def test_nothing_bundleable(self):
+        with self.assertRaises(RuntimeError):
+            self.plan([snap("Camera", 'CAMERA')])
+
+
+class PlanCurveRenamesTest(unittest.TestCase):
+    def renames(self, snaps, taken=()):
+        return planner.plan_curve_renames(snaps, "Welt", set(taken)).renames
+
+    def test_lowest_free_ordinals(self):
+        renames = self.renames(curves("BezierCurve", "NurbsPath"))
+        self.assertEqual(renames, [("BezierCurve", "Welt_curve"), ("NurbsPath", "Welt_curve_second")])
+
+    def test_gaps_close_in_ordinal_order(self):
+        # Alphabetically _fourth sorts before _second; the order must not flip
+        renames = self.renames(curves("Welt_curve_fourth", "Welt_curve", "Welt_curve_second"))
+        self.assertEqual(renames, [("Welt_curve_fourth", "Welt_curve_third")])
+
+    def test_numbered_curves_come_before_new_ones(self):
+        renames = self.renames(curves("Welt_curve_second", "Arc"))
+        self.assertEqual(renames, [("Welt_curve_second", "Welt_curve"), ("Arc", "Welt_curve_second")])
+
+    def test_taken_names_are_skipped(self):
+        renames = self.renames(curves("A", "B"), taken={"Welt_curve", "Welt_curve_third"})
+        self.assertEqual(renames, [("A", "Welt_curve_second"), ("B", "Welt_curve_fourth")])
+
+    def test_numbered_past_tenth(self):
+        snaps = curves(*(f"C{i:02d}" for i in range(12)))
+        new_names = [new for old, new in self.renames(snaps)]
+        self.assertEqual(new_names[9:], ["Welt_curve_tenth", "Welt_curve_11th", "Welt_curve_12th"])
+
+    def test_data_name_mismatch_is_renamed(self):
+        renames = self.renames([snap("Welt_curve", 'CURVE', data_name="BezierCurve.001")])
+        self.assertEqual(renames, [("Welt_curve", "Welt_curve")])
+
+    def test_renamed_curves_plan_nothing(self):
+        self.assertEqual(self.renames(curves("Welt_curve", "Welt_curve_second")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
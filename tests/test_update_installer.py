@@ -0,0 +1,166 @@
+import functools
+import hashlib
+import http.server
+import os
+import tempfile
+import threading
+import unittest
+import zipfile
+
+from support import load_module
+
+update_installer = load_module("update_installer")
+
+OLD_RELEASE = {
+    "__init__.py": b"VERSION = 1\n",
+    "naming.py": b"def name(): pass\n",
+    "legacy.py": b"# dropped in version 2\n",
+    "data/groups.json": b"{}\n",
+}
+NEW_RELEASE = {
+    "__init__.py": b"VERSION = 2\n",
+    "naming.py": b"def name(): pass\n",
+    "data/groups.json": b"{}\n",
+    "data/profiles.json": b"[]\n",
+}
+
+
+def write_tree(root, files):
+    for rel_path, content in files.items():
+        path = os.path.join(root, *rel_path.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+
+def read_tree(root):
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, root).replace(os.sep, "/")] = f.read()
+    return files
+
+
+def write_release(path, files, root="group_renamer-2.0/"):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for rel_path, content in files.items():
+            archive.writestr(root + rel_path, content)
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class UpdateInstallerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = self.tmp.name
+
+        self.addon_dir = os.path.join(root, "addons", "group_renamer")
+        self.work_dir = os.path.join(root, "work")
+        self.served_dir = os.path.join(root, "served")
+        for path in (self.addon_dir, self.work_dir, self.served_dir):
+            os.makedirs(path)
+        write_tree(self.addon_dir, OLD_RELEASE)
+        write_tree(self.addon_dir, {"__pycache__/naming.cpython-311.pyc": b"\0"})
+
+        self.zip_path = os.path.join(self.served_dir, "release.zip")
+        self.sha256 = write_release(self.zip_path, NEW_RELEASE)
+        with open(self.zip_path + ".sha256", "w") as f:
+            f.write(f"{self.sha256}  release.zip\n")
+
+        # Local HTTP stand-in for the release server
+        handler = functools.partial(QuietHandler, directory=self.served_dir)
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/release.zip"
+
+    def visible_addons(self):
+        return sorted(name for name in os.listdir(os.path.dirname(self.addon_dir)) if not name.startswith("."))
+
+    def test_download_verifies_and_reports_progress(self):
+        dest = os.path.join(self.work_dir, "update.zip")
+        progress = []
+        sha256 = update_installer.download_file(
+            self.url, dest, expected_sha256=self.sha256.upper(),
+            progress=lambda done, total: progress.append((done, total)), chunk_size=64,
+        )
+
+        self.assertEqual(sha256, self.sha256)
+        self.assertEqual(os.path.getsize(dest), os.path.getsize(self.zip_path))
+        self.assertEqual(progress[-1], (os.path.getsize(dest), os.path.getsize(dest)))
+        self.assertFalse(os.path.exists(dest + ".part"))
+
+    def test_checksum_file(self):
+        self.assertEqual(update_installer.fetch_checksum(self.url + ".sha256"), self.sha256)
+
+    def test_checksum_mismatch_leaves_nothing_behind(self):
+        dest = os.path.join(self.work_dir, "update.zip")
+        with self.assertRaises(update_installer.UpdateError):
+            update_installer.download_file(self.url, dest, expected_sha256="0" * 64)
+
+        self.assertFalse(os.path.exists(dest))
+        self.assertFalse(os.path.exists(dest + ".part"))
+
+    def test_install_from_local_file(self):
+        url = "file:" + os.path.abspath(self.zip_path).replace(os.sep, "/")
+        result = update_installer.install_update(url, self.addon_dir, self.work_dir, expected_sha256=self.sha256)
+
+        self.assertEqual(read_tree(self.addon_dir), NEW_RELEASE)
+        self.assertEqual(sorted(result["changed"]), ["__init__.py", "data/profiles.json"])
+        self.assertEqual(sorted(result["unchanged"]), ["data/groups.json", "naming.py"])
+        self.assertEqual(result["removed"], ["legacy.py"])
+
+    def test_install_swaps_and_rolls_back(self):
+        before = read_tree(self.addon_dir)
+        result = update_installer.install_update(self.url, self.addon_dir, self.work_dir, expected_sha256=self.sha256)
+
+        self.assertEqual(result["sha256"], self.sha256)
+        self.assertEqual(read_tree(self.addon_dir), NEW_RELEASE)
+        self.assertTrue(update_installer.can_rollback(self.addon_dir))
+        self.assertFalse(os.path.exists(update_installer.sibling_dir(self.addon_dir, update_installer.STAGING_SUFFIX)))
+        self.assertEqual(os.listdir(self.work_dir), [])
+        # Only hidden folders beside the add-on, so Blender never lists a second copy
+        self.assertEqual(self.visible_addons(), ["group_renamer"])
+
+        update_installer.rollback(self.addon_dir)
+
+        self.assertEqual(read_tree(self.addon_dir), before)
+        self.assertFalse(update_installer.can_rollback(self.addon_dir))
+        self.assertEqual(self.visible_addons(), ["group_renamer"])
+
+    def test_legacy_backup_is_cleared(self):
+        legacy = self.addon_dir + update_installer.BACKUP_SUFFIX
+        write_tree(legacy, OLD_RELEASE)
+        update_installer.install_update(self.url, self.addon_dir, self.work_dir)
+
+        self.assertFalse(os.path.exists(legacy))
+        self.assertTrue(update_installer.can_rollback(self.addon_dir))
+
+    def test_failed_checksum_keeps_installed_version(self):
+        before = read_tree(self.addon_dir)
+        with self.assertRaises(update_installer.UpdateError):
+            update_installer.install_update(self.url, self.addon_dir, self.work_dir, expected_sha256="f" * 64)
+
+        self.assertEqual(read_tree(self.addon_dir), before)
+        self.assertFalse(update_installer.can_rollback(self.addon_dir))
+
+    def test_same_release_is_not_swapped(self):
+        write_release(self.zip_path, OLD_RELEASE)
+        result = update_installer.install_update(self.url, self.addon_dir, self.work_dir)
+
+        self.assertEqual(result["changed"], [])
+        self.assertEqual(result["removed"], [])
+        self.assertFalse(update_installer.can_rollback(self.addon_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
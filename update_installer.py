@@ -0,0 +1,231 @@
+"""
+Streaming, verified and atomic installation of add-on updates.
+
+Nothing in here touches bpy, so it can run against a local file:// or
+HTTP stand-in outside Blender.
+"""
+import hashlib
+import os
+import shutil
+import urllib.request
+import zipfile
+import zlib
+
+CHUNK_SIZE = 64 * 1024
+DOWNLOAD_TIMEOUT = 30.0
+STAGING_SUFFIX = ".staging"
+BACKUP_SUFFIX = ".previous"
+FAILED_SUFFIX = ".failed"
+SKIP_NAMES = {"__pycache__", ".git"}
+
+
+class UpdateError(Exception):
+    pass
+
+
+# --- Download
+def download_file(url, dest_path, expected_sha256=None, progress=None,
+                  timeout=DOWNLOAD_TIMEOUT, chunk_size=CHUNK_SIZE):
+    """
+    Stream url to dest_path, hashing as it goes. progress(done, total) is
+    called after every chunk; total is None when the size is unknown.
+    The file only appears at dest_path once it is complete and verified.
+    """
+    part_path = dest_path + ".part"
+    digest = hashlib.sha256()
+    done = 0
+
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response, open(part_path, "wb") as f:
+            length = response.headers.get("Content-Length")
+            total = int(length) if length else None
+            while True:
+                chunk = response.read(chunk_size)
+                if not chunk:
+                    break
+                f.write(chunk)
+                digest.update(chunk)
+                done += len(chunk)
+                if progress:
+                    progress(done, total)
+
+        sha256 = digest.hexdigest()
+        if expected_sha256 and sha256 != expected_sha256.lower():
+            raise UpdateError(f"Checksum mismatch: expected {expected_sha256}, got {sha256}")
+
+        os.replace(part_path, dest_path)
+        return sha256
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+
+def fetch_checksum(url, timeout=DOWNLOAD_TIMEOUT):
+    """Read the first hex digest from a `.sha256` / `sha256sum` style file."""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        text = response.read().decode("utf-8", "replace")
+    for token in text.split():
+        if len(token) == 64 and all(c in "0123456789abcdefABCDEF" for c in token):
+            return token.lower()
+    raise UpdateError(f"No SHA-256 digest found at {url}")
+
+
+# --- Diffing against the installed add-on
+def file_crc32(path):
+    crc = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def archive_root(names):
+    """GitHub archives wrap everything in one `<repo>-<tag>/` folder."""
+    tops = {name.split("/", 1)[0] for name in names}
+    if len(tops) == 1 and all("/" in name for name in names):
+        return tops.pop() + "/"
+    return ""
+
+
+def changed_members(archive, addon_dir):
+    """
+    Yield (ZipInfo, relative_path, is_changed) for every file in the archive.
+    Unchanged files are detected with the CRC32 stored in the zip's central
+    directory, so they are never decompressed.
+    """
+    root = archive_root(archive.namelist())
+    for info in archive.infolist():
+        if info.is_dir() or not info.filename.startswith(root):
+            continue
+        rel_path = info.filename[len(root):]
+        parts = rel_path.split("/")
+        if not rel_path or ".." in parts or rel_path.startswith("/") or SKIP_NAMES.intersection(parts):
+            continue
+
+        installed = os.path.join(addon_dir, *parts)
+        unchanged = (
+            os.path.isfile(installed)
+            and os.path.getsize(installed) == info.file_size
+            and file_crc32(installed) == info.CRC
+        )
+        yield info, rel_path, not unchanged
+
+
+# --- Staging, swapping and rollback
+def installed_files(addon_dir):
+    """Relative paths (with /) of every installed file, skipping caches and VCS folders."""
+    found = set()
+    for dirpath, dirnames, filenames in os.walk(addon_dir):
+        dirnames[:] = [name for name in dirnames if name not in SKIP_NAMES]
+        rel_dir = os.path.relpath(dirpath, addon_dir).replace(os.sep, "/")
+        for name in filenames:
+            found.add(name if rel_dir == "." else f"{rel_dir}/{name}")
+    return found
+
+
+def stage_update(zip_path, addon_dir, staging_dir):
+    """
+    Build the next version of the add-on in staging_dir from the archive
+    alone: unchanged files are copied from the installed add-on, changed
+    ones extracted. Installed files missing from the archive are left out,
+    so files deleted in the new release go away. Returns (changed,
+    unchanged, removed) relative path lists.
+    """
+    if os.path.exists(staging_dir):
+        shutil.rmtree(staging_dir)
+    os.makedirs(staging_dir)
+
+    changed, unchanged = [], []
+    with zipfile.ZipFile(zip_path, "r") as archive:
+        for info, rel_path, is_changed in changed_members(archive, addon_dir):
+            parts = rel_path.split("/")
+            target = os.path.join(staging_dir, *parts)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if is_changed:
+                with archive.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, CHUNK_SIZE)
+                changed.append(rel_path)
+            else:
+                shutil.copy2(os.path.join(addon_dir, *parts), target)
+                unchanged.append(rel_path)
+
+    removed = sorted(installed_files(addon_dir).difference(changed, unchanged))
+    return changed, unchanged, removed
+
+
+def sibling_dir(addon_dir, suffix):
+    """
+    Hidden folder next to the add-on (.group_renamer.previous). A visible
+    one would hold an __init__.py with bl_info and show up in Blender's
+    add-on list as a second, broken copy.
+    """
+    parent, name = os.path.split(os.path.normpath(addon_dir))
+    return os.path.join(parent, f".{name}{suffix}")
+
+
+def remove_legacy_dirs(addon_dir):
+    """Drop the visible staging/backup folders older versions left beside the add-on."""
+    for suffix in (STAGING_SUFFIX, BACKUP_SUFFIX, FAILED_SUFFIX):
+        legacy = os.path.normpath(addon_dir) + suffix
+        if os.path.isdir(legacy):
+            shutil.rmtree(legacy, ignore_errors=True)
+
+
+def swap_in(addon_dir, staging_dir, backup_dir):
+    """Replace addon_dir with staging_dir, keeping the old tree as backup_dir."""
+    if os.path.exists(backup_dir):
+        shutil.rmtree(backup_dir)
+
+    os.replace(addon_dir, backup_dir)
+    try:
+        os.replace(staging_dir, addon_dir)
+    except OSError:
+        os.replace(backup_dir, addon_dir)
+        raise
+
+
+def can_rollback(addon_dir):
+    return os.path.isdir(sibling_dir(addon_dir, BACKUP_SUFFIX))
+
+
+def rollback(addon_dir):
+    """Restore the version that was live before the last update."""
+    backup_dir = sibling_dir(addon_dir, BACKUP_SUFFIX)
+    if not os.path.isdir(backup_dir):
+        raise UpdateError("No previous version to roll back to.")
+
+    failed_dir = sibling_dir(addon_dir, FAILED_SUFFIX)
+    if os.path.exists(failed_dir):
+        shutil.rmtree(failed_dir)
+
+    os.replace(addon_dir, failed_dir)
+    try:
+        os.replace(backup_dir, addon_dir)
+    except OSError:
+        os.replace(failed_dir, addon_dir)
+        raise
+    shutil.rmtree(failed_dir, ignore_errors=True)
+
+
+def install_update(url, addon_dir, work_dir, expected_sha256=None, progress=None):
+    """
+    Download, verify, stage and atomically swap in an update.
+    Returns a dict with the changed, unchanged and removed file lists.
+    """
+    addon_dir = os.path.normpath(addon_dir)
+    staging_dir = sibling_dir(addon_dir, STAGING_SUFFIX)
+    remove_legacy_dirs(addon_dir)
+    zip_path = os.path.join(work_dir, "group_renamer_update.zip")
+
+    sha256 = download_file(url, zip_path, expected_sha256=expected_sha256, progress=progress)
+    try:
+        changed, unchanged, removed = stage_update(zip_path, addon_dir, staging_dir)
+        if changed or removed:
+            swap_in(addon_dir, staging_dir, sibling_dir(addon_dir, BACKUP_SUFFIX))
+    finally:
+        if os.path.exists(staging_dir):
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        if os.path.exists(zip_path):
+            os.remove(zip_path)
+
+    return {"sha256": sha256, "changed": changed, "unchanged": unchanged, "removed": removed}